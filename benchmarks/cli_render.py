@@ -0,0 +1,87 @@
+"""Benchmark CLI student listings: one print per line vs the buffered writer.
+
+Usage: python -m benchmarks.cli_render [--students N] [--output PATH]
+"""
+import argparse
+import contextlib
+import os
+import random
+import time
+
+from src.models.student import Student
+from src.models.subject import Subject
+from src.views.cli.admin_view import AdminCliView
+
+
+def generate_students(count: int, seed: int = 42):
+    """Build synthetic students in memory."""
+    random.seed(seed)
+    students = []
+    for i in range(count):
+        student = Student(f"Student {i}", f"student{i}@university.com", "Password123")
+        for _ in range(random.randint(0, 4)):
+            student.enrol_subject(Subject())
+        students.append(student)
+    return students
+
+
+def print_per_line(students):
+    """The listing as the view used to produce it, one print() per line."""
+    print("\nAll Students")
+    print("=" * 50)
+    for student in students:
+        print(f"Student ID: {student.id}")
+        print(f"Name: {student.name}")
+        print(f"Email: {student.email}")
+        if student.subjects:
+            print("\nEnrolled Subjects:")
+            print("-" * 20)
+            for subject in student.subjects:
+                print(f"Subject {subject.id}")
+                print(f"  Mark: {subject.mark:.1f}")
+                print(f"  Grade: {subject.grade}")
+            print("-" * 20)
+            print(f"Average Mark: {student.get_average_mark():.1f}")
+            print(f"Overall Status: {'PASS' if student.is_passing() else 'FAIL'}")
+        else:
+            print("\nNo subjects enrolled")
+        print("\n" + "-" * 50)
+
+
+def measure(render, students, output: str, line_buffered: bool):
+    """Return (lines, seconds) for rendering into output."""
+    with open(output, "w", buffering=1 if line_buffered else -1) as f:
+        with contextlib.redirect_stdout(f):
+            start = time.perf_counter()
+            render(students)
+            f.flush()
+            elapsed = time.perf_counter() - start
+    with open(output) as f:
+        lines = sum(1 for _ in f)
+    return lines, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--students", type=int, default=50_000)
+    parser.add_argument("--output", default="listing.txt",
+                        help="file the listing is written to (removed afterwards)")
+    args = parser.parse_args()
+
+    students = generate_students(args.students)
+    view = AdminCliView()
+    renderers = [("print per line", print_per_line), ("buffered writer", view.display_all_students)]
+
+    print(f"{'renderer':<18}{'stdout':<16}{'lines':>10}{'seconds':>10}{'lines/s':>12}")
+    try:
+        for mode, line_buffered in (("line-buffered", True), ("block-buffered", False)):
+            for name, render in renderers:
+                lines, elapsed = measure(render, students, args.output, line_buffered)
+                print(f"{name:<18}{mode:<16}{lines:>10}{elapsed:>10.2f}{lines / elapsed:>12.0f}")
+    finally:
+        if os.path.exists(args.output):
+            os.remove(args.output)
+
+
+if __name__ == "__main__":
+    main()
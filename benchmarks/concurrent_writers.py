@@ -0,0 +1,160 @@
+"""Stress concurrent Database writers across threads and processes.
+
+Checks that exactly one of several writers holding the same version of a
+record wins, that no update is lost whether it is written directly or
+from a session, and that the data file matches the in-memory rows.
+
+Usage: python -m benchmarks.concurrent_writers [--threads T] [--processes P] [--rounds R]
+"""
+import argparse
+import json
+import multiprocessing
+import os
+import tempfile
+import threading
+import time
+
+from benchmarks.parallel_report import generate_roster
+from src.models.database import Database, StaleRecordError
+
+# Every writer updates this student as well as its own
+SHARED_ID = "000000"
+
+
+def _update(database: Database, student_id: str, name: str):
+    """Rename a student, reloading and retrying whenever the write is stale."""
+    while True:
+        student = database.get_student(student_id)
+        student.name = name
+        try:
+            database.update_student(student)
+            return
+        except StaleRecordError:
+            continue
+
+
+def _write_rounds(database: Database, writer: int, rounds: int, batch: int):
+    """Update the shared student and the writer's own one, rounds times.
+
+    With batch > 1 the updates are made in sessions of that many rounds.
+    """
+    own_id = f"{writer + 1:06d}"
+    for start in range(0, rounds, batch):
+        with database.session():
+            for round_ in range(start, min(start + batch, rounds)):
+                _update(database, own_id, f"Writer {writer} round {round_}")
+                _update(database, SHARED_ID, f"Shared by {writer} round {round_}")
+
+
+def _process_writer(filename: str, writer: int, rounds: int, batch: int):
+    _write_rounds(Database(filename), writer, rounds, batch)
+
+
+def _stale_process(filename: str, barrier, results):
+    database = Database(filename)
+    student = database.get_student(SHARED_ID)
+    barrier.wait()
+    try:
+        results.put(database.update_student(student))
+    except StaleRecordError:
+        results.put(False)
+
+
+def stale_writers(filename: str, threads: int, processes: int) -> int:
+    """Let writers that all loaded the same version race; return how many won."""
+    database = Database(filename)
+    barrier = threading.Barrier(threads)
+    wins = []
+
+    def write(student):
+        barrier.wait()
+        try:
+            wins.append(database.update_student(student))
+        except StaleRecordError:
+            wins.append(False)
+
+    students = [database.get_student(SHARED_ID) for _ in range(threads)]
+    workers = [threading.Thread(target=write, args=(s,)) for s in students]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    thread_wins = sum(wins)
+
+    process_barrier = multiprocessing.Barrier(processes)
+    results = multiprocessing.Queue()
+    workers = [
+        multiprocessing.Process(target=_stale_process, args=(filename, process_barrier, results))
+        for _ in range(processes)
+    ]
+    for worker in workers:
+        worker.start()
+    process_wins = sum(results.get() for _ in workers)
+    for worker in workers:
+        worker.join()
+
+    assert thread_wins == 1, f"{thread_wins} of {threads} stale threads won"
+    assert process_wins == 1, f"{process_wins} of {processes} stale processes won"
+    return thread_wins + process_wins
+
+
+def check_file_matches(database: Database):
+    """Assert the data file holds exactly the rows the database has in memory."""
+    with open(database.filename) as f:
+        stored = json.load(f)
+    assert stored == list(database.snapshot().records()), "data file differs from memory"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--threads", type=int, default=4)
+    parser.add_argument("--processes", type=int, default=4)
+    parser.add_argument("--rounds", type=int, default=100)
+    parser.add_argument("--batch", type=int, default=10,
+                        help="rounds per session in every other writer")
+    args = parser.parse_args()
+    writers = args.threads + args.processes
+
+    with tempfile.TemporaryDirectory() as tmp:
+        filename = os.path.join(tmp, "students.data")
+        generate_roster(filename, writers + 1)
+
+        stale_writers(filename, args.threads, args.processes)
+        print(f"stale writers: 1 of {args.threads} threads and 1 of {args.processes} processes won")
+
+        database = Database(filename)
+        base = database.get_student(SHARED_ID).version
+        # Odd writers batch their updates in sessions, even ones write directly
+        batches = [args.batch if writer % 2 else 1 for writer in range(writers)]
+
+        start = time.perf_counter()
+        workers = [
+            threading.Thread(target=_write_rounds, args=(database, writer, args.rounds, batches[writer]))
+            for writer in range(args.threads)
+        ] + [
+            multiprocessing.Process(target=_process_writer, args=(filename, writer, args.rounds, batches[writer]))
+            for writer in range(args.threads, writers)
+        ]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+        elapsed = time.perf_counter() - start
+
+        shared = database.get_student(SHARED_ID)
+        expected = base + writers * args.rounds
+        assert shared.version == expected, f"shared student at version {shared.version}, expected {expected}"
+        for writer in range(writers):
+            student = database.get_student(f"{writer + 1:06d}")
+            assert student.version == args.rounds, f"writer {writer} lost updates"
+            assert student.name == f"Writer {writer} round {args.rounds - 1}"
+        check_file_matches(database)
+        check_file_matches(Database(filename))
+
+        updates = 2 * writers * args.rounds
+        print(f"{writers} writers x {args.rounds} rounds: {updates} updates, none lost")
+        print(f"{updates / elapsed:.0f} updates/s over {elapsed:.2f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""Sort a roster larger than the process's address space limit.
+
+Runs the external sort in a child process whose RLIMIT_AS is set below
+the size of the data file, then checks the records come out best average
+first (file order within ties), that runs were spilled to disk, and that
+the roster could not have been loaded whole under the same limit.
+
+Usage: python -m benchmarks.external_sort_memory [--students N] [--headroom MB] [--budget MB]
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+from benchmarks.parallel_report import generate_roster
+from src.models import external_sort
+from src.models.database import Database
+from src.models.indexes import record_average
+
+MB = 1024 * 1024
+
+
+def _address_space() -> int:
+    """Bytes of address space the process is using now (Linux)."""
+    with open("/proc/self/status") as f:
+        for line in f:
+            if line.startswith("VmSize:"):
+                return int(line.split()[1]) * 1024
+    raise RuntimeError("VmSize not reported")
+
+
+def sort_under_limit(filename: str, headroom: int, budget: int):
+    """Child process: cap the address space, sort the roster and check the result."""
+    import resource
+
+    limit = _address_space() + headroom
+    assert os.path.getsize(filename) > limit, "roster fits under the limit; raise --students"
+    resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+
+    spills = 0
+    spill = external_sort._spill
+
+    def counting_spill(batch):
+        nonlocal spills
+        spills += 1
+        return spill(batch)
+
+    external_sort._spill = counting_spill
+
+    start = time.perf_counter()
+    count = 0
+    previous = None
+    for record in external_sort.sort_by_average(Database(filename).iter_records(), budget):
+        # generate_roster numbers IDs in file order
+        key = (-record_average(record), int(record["id"]))
+        assert previous is None or previous < key, f"{record['id']} out of order"
+        previous = key
+        count += 1
+    elapsed = time.perf_counter() - start
+    assert spills > 1, f"only {spills} runs spilled"
+
+    try:
+        with open(filename) as f:
+            json.load(f)
+    except MemoryError:
+        pass
+    else:
+        raise AssertionError("the whole roster loaded under the limit")
+
+    print(f"sorted {count} records in {elapsed:.2f} s under a {limit / MB:.0f} MB "
+          f"address space limit, {spills} runs spilled")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--students", type=int, default=300_000)
+    parser.add_argument("--headroom", type=int, default=64,
+                        help="MB of address space allowed above the child's baseline")
+    parser.add_argument("--budget", type=int, default=8, help="sort memory budget in MB")
+    parser.add_argument("--child", metavar="FILE", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        sort_under_limit(args.child, args.headroom * MB, args.budget * MB)
+        return
+
+    with tempfile.TemporaryDirectory() as tmp:
+        filename = os.path.join(tmp, "students.data")
+        generate_roster(filename, args.students)
+        print(f"{args.students} students, {os.path.getsize(filename) / MB:.0f} MB on disk")
+        subprocess.run(
+            [sys.executable, "-m", "benchmarks.external_sort_memory", "--child", filename,
+             "--headroom", str(args.headroom), "--budget", str(args.budget)],
+            check=True,
+        )
+
+
+if __name__ == "__main__":
+    main()
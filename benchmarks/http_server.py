@@ -0,0 +1,95 @@
+"""Load-test the local HTTP API with many concurrent keep-alive clients.
+
+Usage: python -m benchmarks.http_server [--students N] [--clients C] [--requests R]
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import tempfile
+import time
+
+from benchmarks.parallel_report import generate_roster
+from src.models.database import Database
+from src.server.http_server import ApiServer
+from src.services.university_service import UniversityService
+
+
+async def _request(reader, writer, method: str, path: str, body: dict = None):
+    data = json.dumps(body).encode() if body is not None else b""
+    writer.write(
+        f"{method} {path} HTTP/1.1\r\nHost: localhost\r\nContent-Length: {len(data)}\r\n\r\n".encode()
+        + data
+    )
+    await writer.drain()
+    status = int((await reader.readline()).split()[1])
+    length = 0
+    while True:
+        line = await reader.readline()
+        if line == b"\r\n":
+            break
+        name, _, value = line.decode().partition(":")
+        if name.lower() == "content-length":
+            length = int(value)
+    await reader.readexactly(length)
+    return status
+
+
+async def _client(port: int, requests: int, students: int, seed: int, latencies: list):
+    rng = random.Random(seed)
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    try:
+        for i in range(requests):
+            roll = rng.random()
+            start = time.perf_counter()
+            if roll < 0.7:
+                await _request(reader, writer, "GET", f"/students/{rng.randrange(students):06d}")
+            elif roll < 0.8:
+                await _request(reader, writer, "GET", "/reports/summary")
+            elif roll < 0.9:
+                n = rng.randrange(students)
+                await _request(reader, writer, "POST", "/login",
+                               {"email": f"student{n}@university.com", "password": "Password123"})
+            else:
+                await _request(reader, writer, "POST", f"/students/{rng.randrange(students):06d}/subjects")
+            latencies.append(time.perf_counter() - start)
+    finally:
+        writer.close()
+
+
+async def run(students: int, clients: int, requests: int):
+    with tempfile.TemporaryDirectory() as tmp:
+        filename = os.path.join(tmp, "students.data")
+        generate_roster(filename, students)
+        server = ApiServer(UniversityService(Database(filename)), port=0)
+        await server.start()
+        try:
+            latencies: list = []
+            start = time.perf_counter()
+            await asyncio.gather(*(
+                _client(server.port, requests, students, seed, latencies) for seed in range(clients)
+            ))
+            elapsed = time.perf_counter() - start
+        finally:
+            await server.close()
+
+    latencies.sort()
+    total = len(latencies)
+    print(f"{clients} clients x {requests} requests against {students} students")
+    print(f"{total / elapsed:.0f} requests/s over {elapsed:.2f} s")
+    print(f"latency p50 {latencies[total // 2] * 1000:.1f} ms, "
+          f"p99 {latencies[int(total * 0.99)] * 1000:.1f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--students", type=int, default=10_000)
+    parser.add_argument("--clients", type=int, default=200)
+    parser.add_argument("--requests", type=int, default=50)
+    args = parser.parse_args()
+    asyncio.run(run(args.students, args.clients, args.requests))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""Benchmark the parallel roster report against worker count.
+
+Usage: python -m benchmarks.parallel_report [--students N] [--max-workers W]
+"""
+import argparse
+import json
+import os
+import random
+import tempfile
+import time
+
+from src.models.database import Database
+from src.models.parallel_report import ParallelReportExecutor
+
+
+def generate_roster(filename: str, students: int, seed: int = 42):
+    """Write a synthetic roster in the database's on-disk layout."""
+    rng = random.Random(seed)
+    records = []
+    for i in range(students):
+        subjects = []
+        for _ in range(rng.randint(0, 4)):
+            mark = rng.randint(25, 100)
+            subjects.append({"id": f"{rng.randint(1, 999):03d}", "mark": mark, "grade": ""})
+        records.append({
+            "id": f"{i:06d}",
+            "name": f"Student {i}",
+            "email": f"student{i}@university.com",
+            "password": "Password123",
+            "subjects": subjects,
+        })
+    with open(filename, "w") as f:
+        json.dump(records, f, indent=2)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--students", type=int, default=200_000)
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        filename = os.path.join(tmp, "students.data")
+        generate_roster(filename, args.students)
+        database = Database(filename)
+
+        baseline = None
+        workers = 1
+        print(f"{'workers':>8}{'seconds':>10}{'speedup':>10}")
+        while workers <= args.max_workers:
+            start = time.perf_counter()
+            report = ParallelReportExecutor(workers).run(database)
+            elapsed = time.perf_counter() - start
+            baseline = baseline or elapsed
+            assert report.count == args.students
+            print(f"{workers:>8}{elapsed:>10.2f}{baseline / elapsed:>10.2f}")
+            workers *= 2
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,10 @@
+import argparse
+import json
 import sys
 from pathlib import Path
 
+from src.core.paths import DATA_PATH_ENV, resolve_data_path
+
 
 def setup_environment():
     """Set up the environment for the application."""
@@ -13,20 +17,79 @@ def setup_environment():
     return project_root  # 直接返回项目根目录
 
 
-def main():
+def parse_args(argv=None) -> argparse.Namespace:
+    """Parse command line options."""
+    parser = argparse.ArgumentParser(prog="python -m src.cli_main",
+                                     description="University application (CLI)")
+    parser.add_argument("--data", metavar="PATH",
+                        help=f"student data file (default: ${DATA_PATH_ENV} or students.data in the project root)")
+    parser.add_argument("--page-size", type=int, metavar="LINES",
+                        help="pause long listings every LINES lines when run in a terminal")
+    parser.add_argument("--batch", metavar="FILE",
+                        help="run commands from FILE ('-' for stdin) and print one JSON result per line")
+    parser.add_argument("--startup-report", action="store_true",
+                        help="measure start-up time to the first prompt and list the slowest imports")
+    # Used by --startup-report: start up to the first menu, then exit
+    parser.add_argument("--startup-probe", action="store_true", help=argparse.SUPPRESS)
+    return parser.parse_args(argv)
+
+
+def startup_report(project_root: Path, data_path: str, top: int = 15):
+    """Print start-up time and the most expensive imports of a fresh CLI process."""
+    from src.core.startup import measure_startup
+
+    elapsed, timings = measure_startup(
+        ["-m", "src.cli_main", "--startup-probe", "--data", data_path], cwd=str(project_root)
+    )
+    total_us = sum(t.cumulative_us for t in timings if t.depth == 0)
+    print(f"Time to first prompt: {elapsed * 1000:.1f} ms (imports: {total_us / 1000:.1f} ms)")
+    print(f"{'cumulative ms':>14}{'self ms':>10}  module")
+    for timing in sorted(timings, key=lambda t: t.cumulative_us, reverse=True)[:top]:
+        print(f"{timing.cumulative_us / 1000:>14.1f}{timing.self_us / 1000:>10.1f}  {timing.module}")
+
+
+def run_batch(script: str, data_path: str) -> int:
+    """Run a command script and write JSON results to stdout.
+
+    Returns 0 if every command succeeded, otherwise 1.
+    """
+    from src.controllers.batch_controller import BatchController
+    from src.models.database import Database
+
+    controller = BatchController(Database(data_path))
+    source = sys.stdin if script == "-" else open(script, "r")
+    ok = True
+    with source:
+        write = sys.stdout.write
+        for result in controller.run_script(source):
+            ok = ok and result["ok"]
+            write(json.dumps(result) + "\n")
+    return 0 if ok else 1
+
+
+def main(argv=None):
     """Main entry point for the CLI application."""
     try:
+        args = parse_args(argv)
         data_dir = setup_environment()
+        data_path = resolve_data_path(args.data)
+
+        if args.startup_report:
+            startup_report(data_dir, data_path)
+            return 0
+
+        if args.batch:
+            return run_batch(args.batch, data_path)
 
         # Import after environment setup
         from src.controllers.university_controller import UniversityController
-        from src.models.database import Database
 
-        # Set database file path
-        Database.DEFAULT_PATH = str(data_dir / 'students.data')
+        controller = UniversityController(data_path, args.page_size)
+        if args.startup_probe:
+            controller.view.display()
+            return 0
 
         # Run application
-        controller = UniversityController()
         controller.run()
 
         return 0
@@ -42,4 +105,4 @@ def main():
 
 
 if __name__ == "__main__":
-    sys.exit(main())
\ No newline at end of file
+    sys.exit(main())
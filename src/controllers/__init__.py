@@ -1,15 +1,29 @@
 """Controllers for the university application."""
 
-from .admin_controller import AdminController
-from .base_controller import BaseController
-from .student_controller import StudentController
-from .subject_controller import SubjectController
-from .university_controller import UniversityController
+import importlib
+
+# Controllers are imported on first use so startup only loads what it runs
+_CONTROLLER_MODULES = {
+    'BaseController': '.base_controller',
+    'UniversityController': '.university_controller',
+    'StudentController': '.student_controller',
+    'SubjectController': '.subject_controller',
+    'AdminController': '.admin_controller',
+    'BatchController': '.batch_controller',
+}
+
+
+def __getattr__(name):
+    if name in _CONTROLLER_MODULES:
+        return getattr(importlib.import_module(_CONTROLLER_MODULES[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     'BaseController',
     'UniversityController',
     'StudentController',
     'SubjectController',
-    'AdminController'
+    'AdminController',
+    'BatchController'
 ]
@@ -1,17 +1,26 @@
+import itertools
 from enum import Enum
-from typing import Dict, List
+from typing import Callable, Iterator, List, Tuple
 
 from .base_controller import BaseController
+from ..core.constants import JOB_TIMEOUT, JOB_WORKERS
+from ..core.jobs import Job, JobRunner
 from ..models.database import Database
 from ..models.student import Student
+from ..services.university_service import ServiceError, UniversityService
 
 
 class AdminMenuOption(str, Enum):
+    AGGREGATE = "A"
     CLEAR = "C"
+    DASHBOARD = "D"
     GROUP = "G"
     PARTITION = "P"
+    QUERY = "Q"
     REMOVE = "R"
     SHOW = "S"
+    SUBJECT_REPORT = "T"
+    VERIFY = "V"
     EXIT = "X"
 
     @classmethod
@@ -22,83 +31,158 @@ class AdminMenuOption(str, Enum):
             return None
 
 
+def _started(stream: Iterator) -> Iterator:
+    """Run a stream up to its first item and return the whole stream.
+
+    Sorting happens before the first item comes out, so a job can do
+    that work and leave the caller to read the rest at its own pace.
+    """
+    first = next(stream, None)
+    if first is None:
+        return iter(())
+    return itertools.chain([first], stream)
+
+
 class AdminController(BaseController):
     """Controls administrative operations."""
 
-    def __init__(self, view):
+    def __init__(self, view, database: Database = None):
         """Initialize with view and database."""
         super().__init__(view)
-        self.database = Database()
-
-    def _get_grade_from_mark(self, mark: float) -> str:
-        """Get grade letter from mark."""
-        if mark >= 85:
-            return "HD"
-        elif mark >= 75:
-            return "D"
-        elif mark >= 65:
-            return "C"
-        elif mark >= 50:
-            return "P"
-        else:
-            return "Z"
+        self.service = UniversityService(database)
+        self.database = self.service.database
+        self.job_runner = JobRunner(JOB_WORKERS)
+        self.job_timeout = JOB_TIMEOUT
 
-    def group_students(self):
-        """Group and display students by average grade."""
-        students = self.database.load_all_students()
-        if not students:
-            self.view.display_error("No students found")
-            return
+    def iter_grade_groups(self, job: Job = None) -> Iterator[Tuple[str, Student]]:
+        """Stream (grade, student) pairs: each grade's students follow one another, HD first."""
+        return self.service.group_report(job)
+
+    def iter_partitioned_students(self, job: Job = None) -> Iterator[Tuple[bool, Student]]:
+        """Stream (is_passing, student) pairs, passing students first."""
+        return self.service.partition_report(job)
 
-        # Group students by average mark grade
-        grade_groups: Dict[str, List[Student]] = {}
-        for student in students:
-            avg_mark = student.get_average_mark()
-            grade = self._get_grade_from_mark(avg_mark)
+    def load_students(self, job: Job = None) -> List[Student]:
+        """Load every student, reporting progress when run as a job."""
+        return self.service.list_students(job)
 
-            if grade not in grade_groups:
-                grade_groups[grade] = []
-            grade_groups[grade].append(student)
+    def start_grade_groups(self, job: Job = None) -> Iterator[Tuple[str, Student]]:
+        """Sort for the grade listing; returns the stream once its first pair is ready."""
+        return _started(self.iter_grade_groups(job))
 
-        # Sort students within each group by average mark (descending)
-        for grade in grade_groups:
-            grade_groups[grade].sort(
-                key=lambda s: s.get_average_mark(),
-                reverse=True
-            )
+    def start_partition(self, job: Job = None) -> Iterator[Tuple[bool, Student]]:
+        """Sort for the pass/fail listing; returns the stream once its first pair is ready."""
+        return _started(self.iter_partitioned_students(job))
 
-        self.view.display_grade_groups(grade_groups)
+    def group_students(self):
+        """Display students by average grade, sorting in a job and listing as sections arrive."""
+        if not self.service.summary().count:
+            self.view.display_error("No students found")
+            return
+        stream = self.run_job("Group by Grade", self.start_grade_groups)
+        if stream is not None:
+            self.view.display_grade_group_stream(stream)
 
     def partition_students(self):
-        """Partition and display students by pass/fail status."""
-        students = self.database.load_all_students()
-        if not students:
+        """Display passing then failing students, sorting in a job and listing as they arrive."""
+        if not self.service.summary().count:
             self.view.display_error("No students found")
             return
+        stream = self.run_job("Partition", self.start_partition)
+        if stream is not None:
+            self.view.display_partition_stream(stream)
+
+    def show_students(self, job: Job = None):
+        """Display every student."""
+        self.view.display_all_students(self.load_students(job))
+
+    def wipe_database(self, job: Job = None) -> bool:
+        """Remove every student without asking for confirmation."""
+        if job:
+            job.report(0, 1)
+        self.service.clear()
+        if job:
+            job.report(1, 1)
+        return True
+
+    def run_job(self, name: str, func: Callable, *args):
+        """Run an operation in the background while the view shows its progress.
+
+        The operation runs on a job thread and reaches the database only
+        through its locked methods. Returns the operation's result, or None
+        if it was cancelled.
+        """
+        job = self.job_runner.submit(name, func, *args, timeout=self.job_timeout)
+        return self.view.wait_for_job(job)
+
+    def query_students(self, expression: str = None):
+        """Filter and display students matching a query expression."""
+        expression = expression or self.view.get_input(
+            "Enter filter (e.g. avg>=85, subject=123, grade=Z, name^=Li)"
+        )
+        try:
+            students = self.service.query(expression)
+        except ServiceError as e:
+            self.view.display_error(str(e))
+            return []
 
-        passing = [s for s in students if s.is_passing()]
-        failing = [s for s in students if not s.is_passing()]
+        if not students:
+            self.view.display_error("No students matched the filter")
+        else:
+            self.view.display_all_students(students)
+        return students
 
-        # Sort both lists by average mark (descending)
-        passing.sort(key=lambda s: s.get_average_mark(), reverse=True)
-        failing.sort(key=lambda s: s.get_average_mark(), reverse=True)
+    def subject_report(self, subject_id: str = None):
+        """Display statistics for the students enrolled in a subject."""
+        subject_id = subject_id or self.view.get_input("Enter subject ID")
+        try:
+            report = self.service.subject_report(subject_id)
+        except ServiceError as e:
+            self.view.display_error(str(e))
+            return None
+        self.view.display_subject_report(report)
+        return report
 
-        self.view.display_partitioned_students(passing, failing)
+    def roster_report(self):
+        """Build the grade/pass report across worker processes."""
+        report = self.service.roster_report()
+        if not report.count:
+            self.view.display_error("No students found")
+            return report
+        self.view.display_roster_report(report)
+        return report
+
+    def show_summary(self):
+        """Display headline numbers read from the summary sidecar."""
+        summary = self.service.summary()
+        self.view.display_summary(summary)
+        return summary
+
+    def verify_summary(self):
+        """Recompute the summary from scratch and repair the sidecar if stale."""
+        summary, valid = self.service.verify_summary()
+        if valid:
+            self.view.display_success("Summary sidecar is up to date")
+        else:
+            self.view.display_error("Summary sidecar was stale and has been rebuilt")
+        self.view.display_summary(summary)
+        return summary
 
     def remove_student(self, student_id: str = None):
         """Remove a student by ID."""
         student_id = student_id or self.view.get_input("Enter student ID")
-        if self.database.remove_student(student_id):
-            self.view.display_success(f"Student {student_id} removed successfully!")
-            return True
-        else:
-            self.view.display_error(f"Student {student_id} not found!")
+        try:
+            self.service.remove_student(student_id)
+        except ServiceError as e:
+            self.view.display_error(str(e))
             return False
+        self.view.display_success(f"Student {student_id} removed successfully!")
+        return True
 
     def clear_database(self):
         """Clear all student data."""
         if self.view.confirm_action("Are you sure you want to clear all data?"):
-            self.database.clear_all()
+            self.wipe_database()
             self.view.display_success("Database cleared successfully!")
             return True
         else:
@@ -109,17 +193,28 @@ class AdminController(BaseController):
         """Handle admin menu choices."""
         try:
             option = AdminMenuOption(choice.upper())
-            if option == AdminMenuOption.CLEAR:
+            if option == AdminMenuOption.AGGREGATE:
+                self.roster_report()
+            elif option == AdminMenuOption.CLEAR:
                 self.clear_database()
+            elif option == AdminMenuOption.DASHBOARD:
+                self.show_summary()
             elif option == AdminMenuOption.GROUP:
                 self.group_students()
             elif option == AdminMenuOption.PARTITION:
                 self.partition_students()
+            elif option == AdminMenuOption.QUERY:
+                self.query_students()
             elif option == AdminMenuOption.REMOVE:
                 self.remove_student()
             elif option == AdminMenuOption.SHOW:
-                students = self.database.load_all_students()
-                self.view.display_all_students(students)
+                students = self.run_job("Show All Students", self.load_students)
+                if students is not None:
+                    self.view.display_all_students(students)
+            elif option == AdminMenuOption.SUBJECT_REPORT:
+                self.subject_report()
+            elif option == AdminMenuOption.VERIFY:
+                self.verify_summary()
             elif option == AdminMenuOption.EXIT:
                 return False
         except ValueError:
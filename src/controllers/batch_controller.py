@@ -0,0 +1,131 @@
+import json
+import shlex
+from typing import Callable, Dict, Iterable, Iterator, List, Tuple
+
+from src.controllers.admin_controller import AdminController
+from src.controllers.base_controller import BaseController
+from src.controllers.student_controller import StudentController
+from src.models.database import Database
+from src.views.batch_view import BatchView
+
+
+class BatchController(BaseController):
+    """Runs scripted commands against the admin, student and subject controllers.
+
+    A script has one command per line, either as words
+    (``register "Jane Doe" jane@university.com Password123``) or as a JSON
+    object (``{"command": "query", "expression": "avg>=85"}``). Blank lines
+    and lines starting with # are skipped. Subject commands act on the
+    student from the last successful ``login``.
+    """
+
+    def __init__(self, database: Database = None):
+        """Initialize with a headless view shared by every sub-controller."""
+        super().__init__(BatchView())
+        self.database = database or Database()
+        self.student_controller = StudentController(self.view, self.database)
+        self.subject_controller = self.student_controller.subject_controller
+        self.subject_controller.view = self.view
+        self.admin_controller = AdminController(self.view, self.database)
+
+        # command -> (handler, argument names)
+        self.commands: Dict[str, Tuple[Callable[[], None], List[str]]] = {
+            "register": (self.student_controller.register, ["name", "email", "password"]),
+            "login": (self._login, ["email", "password"]),
+            "logout": (self._logout, []),
+            "enrol": (self._subject_command(self.subject_controller.enrol_subject), []),
+            "remove-subject": (
+                self._subject_command(self.subject_controller.remove_subject), ["subject_id"]
+            ),
+            "change-password": (
+                self._subject_command(self.subject_controller.change_password), ["password"]
+            ),
+            "subjects": (self._subject_command(self._show_subjects), []),
+            "show": (self.admin_controller.show_students, []),
+            "group": (self.admin_controller.group_students, []),
+            "partition": (self.admin_controller.partition_students, []),
+            "query": (self.admin_controller.query_students, ["expression"]),
+            "subject-report": (self.admin_controller.subject_report, ["subject_id"]),
+            "report": (self.admin_controller.roster_report, []),
+            "summary": (self.admin_controller.show_summary, []),
+            "verify": (self.admin_controller.verify_summary, []),
+            "remove-student": (self.admin_controller.remove_student, ["student_id"]),
+            "clear": (self.admin_controller.clear_database, []),
+        }
+
+    def _login(self):
+        form_data = self.view.display_login_form()
+        student = self.student_controller.authenticate(form_data["email"], form_data["password"])
+        if student:
+            self.subject_controller.current_student = student
+            self.view.display_success("Login successful!")
+        else:
+            self.view.display_error("Invalid credentials!")
+
+    def _logout(self):
+        self.subject_controller.current_student = None
+        self.view.display_success("Logged out")
+
+    def _show_subjects(self):
+        self.view.display_subjects(self.subject_controller.current_student)
+        if self.subject_controller.current_student.subjects:
+            self.view.display_standing(self.subject_controller.get_standing())
+
+    def _subject_command(self, handler: Callable[[], None]) -> Callable[[], None]:
+        def run():
+            if self.subject_controller.current_student is None:
+                self.view.display_error("Not logged in")
+                return
+            handler()
+        return run
+
+    def parse_command(self, line: str) -> Tuple[str, List[str]]:
+        """Split a script line into the command name and its arguments."""
+        line = line.strip()
+        if line.startswith("{"):
+            fields = json.loads(line)
+            name = str(fields.pop("command", ""))
+            params = self.commands.get(name.lower(), (None, []))[1]
+            return name, [str(fields.get(param, "")) for param in params]
+        words = shlex.split(line)
+        if not words:
+            raise ValueError("empty command")
+        return words[0], words[1:]
+
+    def execute(self, line: str) -> dict:
+        """Run one script line and return its structured result."""
+        try:
+            name, arguments = self.parse_command(line)
+        except ValueError as e:
+            self.view.begin()
+            self.view.display_error(f"Unreadable command: {e}")
+            return {"command": None, **self.view.result()}
+
+        self.view.begin(arguments)
+        command = self.commands.get(name.lower())
+        if command is None:
+            self.view.display_error(f"Unknown command: {name}")
+        else:
+            try:
+                command[0]()
+            except Exception as e:
+                # One failing command shouldn't abort the rest of the script
+                self.view.display_error(f"{type(e).__name__}: {e}")
+        return {"command": name, **self.view.result()}
+
+    def handle_choice(self, choice: str, *args, **kwargs) -> bool:
+        """Run one script line; the outcome is left on the view."""
+        self.execute(choice)
+        return True
+
+    def run_script(self, lines: Iterable[str]) -> Iterator[dict]:
+        """Run every command in a script and yield one result per command.
+
+        The whole script runs in one database session, so the data file
+        is written once at the end rather than after every change.
+        """
+        with self.database.session():
+            for number, line in enumerate(lines, 1):
+                if not line.strip() or line.lstrip().startswith("#"):
+                    continue
+                yield {"line": number, **self.execute(line)}
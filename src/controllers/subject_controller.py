@@ -1,10 +1,10 @@
 from enum import Enum
 
 from src.controllers.base_controller import BaseController
-from src.core.constants import PASSWORD_PATTERN
 from src.models.database import Database
+from src.models.leaderboard import Standing
 from src.models.student import Student
-from src.models.subject import Subject
+from src.services.university_service import ServiceError, UniversityService
 from src.views.cli.subject_view import SubjectCliView
 
 
@@ -26,10 +26,11 @@ class SubjectMenuOption(str, Enum):
 class SubjectController(BaseController):
     """Controls subject enrollment and management."""
 
-    def __init__(self, view: SubjectCliView):
+    def __init__(self, view: SubjectCliView, database: Database = None):
         """Initialize with view and database."""
         super().__init__(view)
-        self.database = Database()
+        self.service = UniversityService(database)
+        self.database = self.service.database
         self.current_student = None
 
     def run(self, student: Student):
@@ -39,42 +40,36 @@ class SubjectController(BaseController):
 
     def enrol_subject(self):
         """Handle subject enrollment."""
-        if len(self.current_student.subjects) >= Student.MAX_SUBJECTS:
-            self.view.display_error(
-                f"Maximum subjects ({Student.MAX_SUBJECTS}) already enrolled!"
-            )
+        try:
+            self.current_student, subject = self.service.enrol(self.current_student.id)
+        except ServiceError as e:
+            self.view.display_error(str(e))
             return
-
-        subject = Subject()
-        if self.current_student.enrol_subject(subject):
-            self.database.update_student(self.current_student)
-            self.view.display_enrolment_result(subject)
-        else:
-            self.view.display_error("Failed to enrol in subject!")
+        self.view.display_enrolment_result(subject)
 
     def remove_subject(self):
         """Handle subject removal."""
         subject_id = self.view.get_input("Enter subject ID to remove")
-
-        if self.current_student.remove_subject(subject_id):
-            self.database.update_student(self.current_student)
-            self.view.display_success(f"Subject {subject_id} removed successfully!")
-        else:
-            self.view.display_error(f"Subject {subject_id} not found!")
+        try:
+            self.current_student = self.service.remove_subject(self.current_student.id, subject_id)
+        except ServiceError as e:
+            self.view.display_error(str(e))
+            return
+        self.view.display_success(f"Subject {subject_id} removed successfully!")
 
     def change_password(self):
         """Handle password change."""
         new_password = self.view.get_input("Enter new password")
-
-        if not PASSWORD_PATTERN.match(new_password):
-            self.view.display_error("Invalid password format!")
+        try:
+            self.current_student = self.service.change_password(self.current_student.id, new_password)
+        except ServiceError as e:
+            self.view.display_error(str(e))
             return
+        self.view.display_success("Password changed successfully!")
 
-        self.current_student.password = new_password
-        if self.database.update_student(self.current_student):
-            self.view.display_success("Password changed successfully!")
-        else:
-            self.view.display_error("Failed to change password!")
+    def get_standing(self) -> Standing:
+        """Return the current student's rank and percentile."""
+        return self.service.standing(self.current_student.id)
 
     def handle_choice(self, choice: str, *args, **kwargs) -> bool:
         """Handle subject menu choices."""
@@ -88,6 +83,8 @@ class SubjectController(BaseController):
                 self.remove_subject()
             elif option == SubjectMenuOption.SHOW:
                 self.view.display_subjects(self.current_student)
+                if self.current_student.subjects:
+                    self.view.display_standing(self.get_standing())
             elif option == SubjectMenuOption.EXIT:
                 return False
         except ValueError:
@@ -1,10 +1,6 @@
 from enum import Enum
 
-from src.controllers.admin_controller import AdminController
 from src.controllers.base_controller import BaseController
-from src.controllers.student_controller import StudentController
-from src.views.cli.admin_view import AdminCliView
-from src.views.cli.student_view import StudentCliView
 from src.views.cli.university_view import UniversityCliView
 
 
@@ -24,11 +20,38 @@ class UniversityMenuOption(str, Enum):
 class UniversityController(BaseController):
     """Controls the main university system menu and navigation."""
 
-    def __init__(self):
-        """Initialize with views and sub-controllers."""
+    def __init__(self, data_path: str = None, page_size: int = None):
+        """Initialize with the menu view; sub-controllers are built on first use."""
         super().__init__(UniversityCliView())
-        self.student_controller = StudentController(StudentCliView())
-        self.admin_controller = AdminController(AdminCliView())
+        self.data_path = data_path
+        self.page_size = page_size
+        self._database = None
+        self._student_controller = None
+        self._admin_controller = None
+
+    @property
+    def database(self):
+        """Database shared by the sub-controllers."""
+        if self._database is None:
+            from src.models.database import Database
+            self._database = Database(self.data_path)
+        return self._database
+
+    @property
+    def student_controller(self):
+        if self._student_controller is None:
+            from src.controllers.student_controller import StudentController
+            from src.views.cli.student_view import StudentCliView
+            self._student_controller = StudentController(StudentCliView(), self.database)
+        return self._student_controller
+
+    @property
+    def admin_controller(self):
+        if self._admin_controller is None:
+            from src.controllers.admin_controller import AdminController
+            from src.views.cli.admin_view import AdminCliView
+            self._admin_controller = AdminController(AdminCliView(self.page_size), self.database)
+        return self._admin_controller
 
     def handle_choice(self, choice: str, *args, **kwargs) -> bool:
         """Handle university menu choices."""
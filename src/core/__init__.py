@@ -1,5 +1,21 @@
 """Core functionality and constants for the university application."""
 
-from .constants import EMAIL_PATTERN, PASSWORD_PATTERN
+from .constants import (
+    EMAIL_PATTERN,
+    IN_MEMORY_ROSTER_LIMIT,
+    JOB_TIMEOUT,
+    JOB_WORKERS,
+    PASSWORD_PATTERN,
+    REPORT_WORKERS,
+    SORT_MEMORY_BUDGET,
+)
 
-__all__ = ["EMAIL_PATTERN", "PASSWORD_PATTERN"]
+__all__ = [
+    "EMAIL_PATTERN",
+    "PASSWORD_PATTERN",
+    "IN_MEMORY_ROSTER_LIMIT",
+    "SORT_MEMORY_BUDGET",
+    "REPORT_WORKERS",
+    "JOB_WORKERS",
+    "JOB_TIMEOUT",
+]
@@ -2,3 +2,17 @@ import re
 
 EMAIL_PATTERN = re.compile(r"^[a-zA-Z0-9._%+-]+@university\.com$")
 PASSWORD_PATTERN = re.compile(r"^[A-Z][a-zA-Z]{4,}[0-9]{3,}$")
+
+# Rosters larger than this are grouped/partitioned with the external sort
+IN_MEMORY_ROSTER_LIMIT = 100_000
+# Bytes of records buffered before the external sort spills a run to disk
+SORT_MEMORY_BUDGET = 64 * 1024 * 1024
+# Worker processes for the parallel roster report (None = one per CPU)
+REPORT_WORKERS = None
+# Threads running background admin jobs, and their timeout in seconds (None = no limit)
+JOB_WORKERS = 2
+JOB_TIMEOUT = None
+# Students whose serialised JSON is kept by the payload cache
+PAYLOAD_CACHE_SIZE = 4096
+# Size in bytes after which the change log next to the data file is started afresh
+CHANGE_LOG_LIMIT = 4 * 1024 * 1024
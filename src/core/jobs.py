@@ -0,0 +1,109 @@
+import itertools
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Iterable, Iterator, Optional
+
+
+class JobCancelledError(Exception):
+    """Raised inside a job once it has been cancelled."""
+
+
+class JobTimeoutError(JobCancelledError):
+    """Raised inside a job once it has run past its timeout."""
+
+
+class Job:
+    """A long-running operation with progress reporting and cooperative cancellation.
+
+    The job function receives the Job as its ``job`` keyword argument and
+    should call ``report``/``track`` regularly; both raise once the job is
+    cancelled or has timed out.
+    """
+
+    def __init__(self, job_id: int, name: str, timeout: float = None,
+                 on_progress: Callable[["Job"], None] = None):
+        self.id = job_id
+        self.name = name
+        self.done = 0
+        self.total: Optional[int] = None
+        self.future: Optional[Future] = None
+        self._on_progress = on_progress
+        self._cancelled = threading.Event()
+        self._deadline = time.monotonic() + timeout if timeout else None
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled.is_set()
+
+    @property
+    def finished(self) -> bool:
+        return self.future is not None and self.future.done()
+
+    @property
+    def fraction(self) -> Optional[float]:
+        """Completed fraction, or None while the total is unknown."""
+        if not self.total:
+            return None
+        return min(1.0, self.done / self.total)
+
+    def cancel(self):
+        """Ask the job to stop at its next progress check."""
+        self._cancelled.set()
+
+    def check(self):
+        """Raise if the job was cancelled or has timed out."""
+        if self._cancelled.is_set():
+            raise JobCancelledError(f"{self.name} cancelled")
+        if self._deadline is not None and time.monotonic() > self._deadline:
+            raise JobTimeoutError(f"{self.name} timed out")
+
+    def report(self, done: int, total: int = None):
+        """Record progress and give cancellation a chance to take effect."""
+        self.done = done
+        if total is not None:
+            self.total = total
+        if self._on_progress:
+            self._on_progress(self)
+        self.check()
+
+    def track(self, items: Iterable, total: int = None, every: int = 100) -> Iterator:
+        """Yield items while reporting progress every few records."""
+        done = 0
+        self.report(0, total)
+        for item in items:
+            yield item
+            done += 1
+            if done % every == 0:
+                self.report(done)
+        self.report(done, max(done, self.total or 0))
+
+    def result(self, timeout: float = None):
+        """Wait for the job and return its result (or raise its error)."""
+        return self.future.result(timeout)
+
+
+class JobRunner:
+    """Runs jobs on a thread pool so long operations don't block the caller.
+
+    Jobs run alongside the caller's own threads (such as the GUI's
+    database I/O thread), so anything they share must be thread-safe.
+    Database is: every public method holds its lock, and long reads work
+    from a snapshot or the data file rather than the live rows.
+    """
+
+    def __init__(self, max_workers: int = 2):
+        """Initialize with the number of worker threads."""
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="job")
+        self._ids = itertools.count(1)
+
+    def submit(self, name: str, func: Callable, *args, timeout: float = None,
+               on_progress: Callable[[Job], None] = None, **kwargs) -> Job:
+        """Start func(*args, job=job, **kwargs) in the background."""
+        job = Job(next(self._ids), name, timeout, on_progress)
+        job.future = self._executor.submit(func, *args, job=job, **kwargs)
+        return job
+
+    def shutdown(self):
+        """Stop accepting jobs and wait for running ones to finish."""
+        self._executor.shutdown(wait=True)
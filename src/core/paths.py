@@ -0,0 +1,18 @@
+import os
+from pathlib import Path
+
+# Environment variable naming the data file, overridden by --data
+DATA_PATH_ENV = "UNIVERSITY_DATA"
+# Directory holding the default data file
+PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+DEFAULT_DATA_FILE = "students.data"
+
+
+def resolve_data_path(explicit: str = None) -> str:
+    """The student data file every entry point uses.
+
+    An explicit path (e.g. --data) wins, then $UNIVERSITY_DATA, then
+    students.data in the project root, so the CLI, the GUI and the API
+    server share one file wherever they are started from.
+    """
+    return explicit or os.environ.get(DATA_PATH_ENV) or str(PROJECT_ROOT / DEFAULT_DATA_FILE)
@@ -0,0 +1,47 @@
+import subprocess
+import sys
+import time
+from typing import List, NamedTuple, Tuple
+
+
+class ImportTiming(NamedTuple):
+    """One module's line from ``python -X importtime``, in microseconds."""
+    module: str
+    depth: int
+    self_us: int
+    cumulative_us: int
+
+
+def parse_import_times(output: str) -> List[ImportTiming]:
+    """Parse the stderr of ``python -X importtime`` into per-module timings."""
+    timings = []
+    for line in output.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:"):].split("|")
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            # Column header
+            continue
+        name = fields[2].rstrip()
+        # Nested imports are indented two spaces per level after the separator
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        timings.append(ImportTiming(name.strip(), depth, int(fields[0]), int(fields[1])))
+    return timings
+
+
+def measure_startup(args: List[str], cwd: str = None) -> Tuple[float, List[ImportTiming]]:
+    """Run a fresh interpreter with -X importtime and the given arguments.
+
+    Returns the wall-clock seconds the process took and its import timings.
+    """
+    start = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", *args],
+        cwd=cwd,
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        text=True,
+        check=True,
+    )
+    return time.perf_counter() - start, parse_import_times(result.stderr)
@@ -1,12 +1,33 @@
+import sys
+import time
+
+# Taken before any other import so startup time covers module loading
+_STARTED_AT = time.perf_counter()
+
 import flet as ft
-from src.views.flet_ui.app_view import AppView
+
+# Like the CLI's --startup-report, print the time to the first page update
+REPORT_STARTUP = "--startup-report" in sys.argv[1:]
+
+
+def report_startup(seconds: float):
+    print(f"Time to first page update: {seconds * 1000:.1f} ms")
 
 
 def main(page: ft.Page):
     """Main entry point for the GUI application."""
     try:
+        # Imported here so the views load only once a page exists
+        from src.core.paths import resolve_data_path
+        from src.views.flet_ui.app_view import AppView
+
         # Create and initialize app view
-        app = AppView(page)
+        app = AppView(
+            page,
+            data_path=resolve_data_path(),
+            started_at=_STARTED_AT,
+            on_startup=report_startup if REPORT_STARTUP else None,
+        )
         app.initialize()
     except Exception as e:
         print(f"Error initializing application: {e}")
@@ -15,4 +36,4 @@ def main(page: ft.Page):
 
 
 if __name__ == "__main__":
-    ft.app(target=main)
\ No newline at end of file
+    ft.app(target=main)
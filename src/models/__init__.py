@@ -1,8 +1,37 @@
 """Data models for the university application."""
 
-from .base_model import BaseModel
-from .database import Database
-from .student import Student
-from .subject import Subject
+import importlib
 
-__all__ = ["BaseModel", "Student", "Subject", "Database"]
+# Exports are imported on first use so loading one model stays cheap
+_EXPORTS = {
+    "BaseModel": ".base_model",
+    "Student": ".student",
+    "Subject": ".subject",
+    "Database": ".database",
+    "StaleRecordError": ".database",
+    "AsyncDatabase": ".async_database",
+    "EventBus": ".events",
+    "ChangeLogTailer": ".events",
+    "QueryEngine": ".query",
+    "parse_query": ".query",
+}
+
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        return getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+__all__ = [
+    "BaseModel",
+    "Student",
+    "Subject",
+    "Database",
+    "StaleRecordError",
+    "AsyncDatabase",
+    "EventBus",
+    "ChangeLogTailer",
+    "QueryEngine",
+    "parse_query",
+]
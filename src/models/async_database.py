@@ -0,0 +1,64 @@
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List, Optional, Tuple
+
+from src.models.database import Database
+from src.models.leaderboard import Standing
+from src.models.student import Student
+from src.models.summary import Summary
+
+
+class AsyncDatabase:
+    """Awaitable facade over Database for event-loop driven views.
+
+    Every call runs on a dedicated single-threaded I/O executor, so file
+    access never blocks the caller's event loop. The executor does not
+    own the Database: job threads may call it too, and its own lock keeps
+    their calls apart.
+    """
+
+    def __init__(self, database: Database = None, executor: ThreadPoolExecutor = None):
+        """Initialize with the database to wrap and an optional executor."""
+        self.database = database or Database()
+        self.executor = executor or ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="database-io"
+        )
+
+    async def run(self, func: Callable, *args, **kwargs):
+        """Run any blocking callable on the I/O executor and await its result."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self.executor, functools.partial(func, *args, **kwargs)
+        )
+
+    async def load_all_students(self) -> List[Student]:
+        return await self.run(self.database.load_all_students)
+
+    async def get_student_by_email(self, email: str) -> Optional[Student]:
+        return await self.run(self.database.get_student_by_email, email)
+
+    async def add_student(self, student: Student) -> bool:
+        return await self.run(self.database.add_student, student)
+
+    async def update_student(self, student: Student) -> bool:
+        return await self.run(self.database.update_student, student)
+
+    async def remove_student(self, student_id: str) -> bool:
+        return await self.run(self.database.remove_student, student_id)
+
+    async def clear_all(self):
+        return await self.run(self.database.clear_all)
+
+    async def read_summary(self) -> Summary:
+        return await self.run(self.database.read_summary)
+
+    async def verify_summary(self) -> Tuple[Summary, bool]:
+        return await self.run(self.database.verify_summary)
+
+    async def get_standing(self, student: Student) -> Standing:
+        return await self.run(self.database.get_standing, student)
+
+    def shutdown(self):
+        """Stop the I/O executor once pending calls finish."""
+        self.executor.shutdown(wait=True)
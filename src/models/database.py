@@ -1,75 +1,492 @@
+import functools
 import json
 import os
-from typing import List, Optional
+import tempfile
+import threading
+import weakref
+from contextlib import contextmanager
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 
+from src.core.constants import CHANGE_LOG_LIMIT
+from src.models.events import (
+    ChangeLog,
+    EventBus,
+    RosterReset,
+    StudentAdded,
+    StudentRemoved,
+    update_events,
+)
+from src.models.ids import StudentIdAllocator, format_student_id
+from src.models.indexes import RosterEntry, StudentIndexes
+from src.models.leaderboard import Standing
+from src.models.snapshot import Snapshot
 from src.models.student import Student
+from src.models.summary import Summary
+from src.models.version_stamp import VersionStamp
+
+
+class StaleRecordError(Exception):
+    """A write was based on an older version of the record than the one stored."""
+
+
+def synchronized(method):
+    """Run a Database method while holding its lock."""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self.lock:
+            return method(self, *args, **kwargs)
+    return wrapper
+
+
+def exclusive(method):
+    """Run a Database write while holding its lock and the cross-process write lock.
+
+    Other processes cannot write between the method's refresh and its
+    write, so every change is based on the latest stored data.
+    """
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self.lock, self.version_stamp.locked():
+            return method(self, *args, **kwargs)
+    return wrapper
 
 
 class Database:
     """Handles persistence of student data to/from file storage."""
 
-    def __init__(self, filename: str = "students.data"):
-        """Initialize database with specified filename."""
-        self.filename = filename
+    # Data file used when no filename is given; entry points may override it
+    DEFAULT_PATH = "students.data"
+
+    def __init__(self, filename: str = None):
+        """Initialize database with specified filename (defaults to DEFAULT_PATH)."""
+        self.filename = filename or self.DEFAULT_PATH
+        self.summary_filename = f"{self.filename}.summary"
+        # Bumped by every writer so other processes notice each write
+        self.version_stamp = VersionStamp(f"{self.filename}.version")
         self._ensure_file_exists()
 
+        # In-memory copy of the file, keyed by row number in file order
+        self._rows: Dict[int, dict] = {}
+        self._next_row = 0
+        self._stamp = None
+        # Bumped on every change to the cached rows, including reloads
+        self._generation = 0
+        self._indexes = StudentIndexes()
+        self._summary = Summary()
+        self._student_ids = StudentIdAllocator()
+        # Newest snapshot handed out, while any reader still holds it
+        self._snapshot: Optional[weakref.ref] = None
+        # Held by every public method; hold it to make several calls atomic
+        self.lock = threading.RLock()
+        # Open session() blocks per thread; only the thread running a
+        # session holds its writes back. _dirty: the cached rows hold
+        # changes not yet on disk
+        self._sessions = threading.local()
+        self._dirty = False
+
+        # Change events: delivered in-process through the bus once applied,
+        # and appended to the change log for other processes once written
+        self.events = EventBus()
+        self.change_log = ChangeLog(f"{self.filename}.changes", CHANGE_LOG_LIMIT)
+        self.origin = f"{os.getpid()}:{id(self):x}"
+        self._unlogged: List[tuple] = []
+
     def _ensure_file_exists(self):
         """Create the data file if it doesn't exist."""
         if not os.path.exists(self.filename):
             with open(self.filename, "w") as f:
                 json.dump([], f)
 
-    def load_all_students(self) -> List[Student]:
-        """Load all students from the database file."""
+    def _file_stamp(self):
+        """Identify the current file contents by write counter, modification time and size.
+
+        The counter catches writes too close together for the modification
+        time to tell apart; the stat catches edits made outside the app.
+        """
+        try:
+            st = os.stat(self.filename)
+        except FileNotFoundError:
+            return None
+        return self.version_stamp.read(), st.st_mtime_ns, st.st_size
+
+    def _refresh(self):
+        """Reload the in-memory rows if the file changed since last read."""
+        if self._dirty:
+            # Unwritten session changes are newer than anything on disk
+            return
+        stamp = self._file_stamp()
+        if stamp is not None and stamp == self._stamp:
+            return
         try:
             with open(self.filename, "r") as f:
                 data = json.load(f)
-                return [Student.from_dict(student_data) for student_data in data]
         except (json.JSONDecodeError, FileNotFoundError):
-            return []
+            data = []
+        self._reset_rows(data)
+        self._stamp = stamp
+
+    def _detach(self):
+        """Copy the row table and average index if a live snapshot shares them.
+
+        The copies are shallow: records are never changed in place, so old
+        and new versions share every record that did not change.
+        """
+        snapshot = self._snapshot() if self._snapshot is not None else None
+        if snapshot is not None and snapshot.rows is self._rows:
+            self._rows = dict(self._rows)
+            self._indexes.averages = list(self._indexes.averages)
+
+    def _reset_rows(self, records: Iterable[dict]):
+        """Replace every cached row and rebuild the indexes."""
+        # A snapshot may still be reading the old average index
+        self._indexes.averages = []
+        self._rows = {}
+        self._next_row = 0
+        self._generation += 1
+        self._indexes.clear()
+        self._summary = Summary()
+        self._student_ids.reset()
+        for record in records:
+            self._insert_row(record)
+
+    def _insert_row(self, record: dict) -> int:
+        self._detach()
+        row = self._next_row
+        self._next_row += 1
+        self._generation += 1
+        self._rows[row] = record
+        self._indexes.add(row, record)
+        self._summary.add(record)
+        self._student_ids.observe(record["id"])
+        return row
+
+    def _replace_row(self, row: int, record: dict):
+        self._detach()
+        old = self._rows[row]
+        self._indexes.remove(row, old)
+        self._summary.remove(old)
+        self._generation += 1
+        self._rows[row] = record
+        self._indexes.add(row, record)
+        self._summary.add(record)
+
+    def _delete_row(self, row: int):
+        self._detach()
+        record = self._rows.pop(row)
+        self._generation += 1
+        self._indexes.remove(row, record)
+        self._summary.remove(record)
+
+    def _changed(self, events: List[tuple]):
+        """Persist the cached rows, then announce the change."""
+        self._unlogged.extend(events)
+        self._persist()
+        self.events.publish_all(events)
+
+    @property
+    def _session_depth(self) -> int:
+        """How many session() blocks the calling thread has open."""
+        return getattr(self._sessions, "depth", 0)
+
+    def _persist(self):
+        """Write the cached rows and the summary sidecar back to disk."""
+        if self._session_depth:
+            self._dirty = True
+            return
+        self._write()
+
+    def _write(self):
+        self._dirty = False
+        temp = None
+        try:
+            # Write aside and swap in, so readers never see a half-written file
+            fd, temp = tempfile.mkstemp(
+                dir=os.path.dirname(os.path.abspath(self.filename)),
+                prefix=os.path.basename(self.filename),
+            )
+            with os.fdopen(fd, "w") as f:
+                json.dump(list(self._rows.values()), f, indent=2)
+            os.replace(temp, self.filename)
+        except BaseException:
+            if temp is not None and os.path.exists(temp):
+                os.remove(temp)
+            # Drop the changes that never reached disk: reload the file on
+            # the next read and tell subscribers to do the same
+            self._stamp = None
+            self._unlogged = []
+            self.events.publish(RosterReset())
+            raise
+        self.version_stamp.bump()
+        self._stamp = self._file_stamp()
+        self._summary.save(self.summary_filename)
+        self.change_log.append(self._unlogged, self.origin)
+        self._unlogged = []
+
+    @contextmanager
+    def session(self):
+        """Keep changes in memory for the whole block and write them once at the end.
+
+        Only changes made by the calling thread are held back; other
+        threads keep writing straight through, so their writes are on disk
+        when they return. The cross-process write lock is held for the
+        whole block: the cached rows are only written back over the file
+        at the end, so no other process may write in between. Their writes
+        wait until the block ends, so keep it short; they see none of its
+        changes before.
+        """
+        with self.version_stamp.locked():
+            self._sessions.depth = self._session_depth + 1
+            try:
+                yield self
+            finally:
+                self._sessions.depth -= 1
+                if not self._sessions.depth:
+                    self.flush()
+
+    @synchronized
+    def flush(self):
+        """Write any changes held back by an open session."""
+        if self._dirty:
+            with self.version_stamp.locked():
+                self._write()
 
+    @synchronized
+    def read_summary(self) -> Summary:
+        """Read headline numbers from the sidecar without loading students.
+
+        The sidecar is rebuilt from the data file if it is missing.
+        """
+        if self._dirty:
+            # The sidecar lags behind an open session; use the live copy
+            return Summary.from_dict(self._summary.to_dict())
+        summary = Summary.load(self.summary_filename)
+        if summary is None:
+            summary, _ = self.verify_summary()
+        return summary
+
+    @synchronized
+    def verify_summary(self) -> Tuple[Summary, bool]:
+        """Recompute the summary from the data file and repair the sidecar.
+
+        Returns the recomputed summary and whether the sidecar was correct.
+        """
+        self.flush()
+        self._stamp = None
+        self._refresh()
+        computed = Summary.compute(self._rows.values())
+        stored = Summary.load(self.summary_filename)
+        valid = stored is not None and stored.matches(computed)
+        if not valid:
+            computed.save(self.summary_filename)
+        self._summary = computed
+        return computed, valid
+
+    @synchronized
+    def generation(self) -> int:
+        """Counter that changes whenever the stored students do."""
+        self._refresh()
+        return self._generation
+
+    @synchronized
+    def get_indexes(self) -> StudentIndexes:
+        """Return the up-to-date secondary indexes."""
+        self._refresh()
+        return self._indexes
+
+    @synchronized
+    def get_records(self, rows: Iterable[int]) -> List[dict]:
+        """Return the stored records for the given row numbers."""
+        self._refresh()
+        return [self._rows[row] for row in rows if row in self._rows]
+
+    @synchronized
+    def get_subject_roster(self, subject_id: str) -> List[RosterEntry]:
+        """Return (student_id, mark, grade) for everyone enrolled in a subject."""
+        return self.get_indexes().subject_roster(subject_id)
+
+    @synchronized
+    def get_standing(self, student: Student) -> Standing:
+        """Return the rank and percentile of a student's average mark."""
+        return self.get_indexes().leaderboard.standing(student.get_average_mark())
+
+    @staticmethod
+    def to_students(records: Iterable[dict]) -> List[Student]:
+        """Build fresh Student objects from stored records."""
+        return [Student.from_dict(record) for record in records]
+
+    @synchronized
+    def snapshot(self) -> Snapshot:
+        """Pin the current version of the stored students for consistent reads.
+
+        Costs O(1): the snapshot shares the live tables, and the next change
+        copies them instead while the snapshot is held. Readers taking a
+        snapshot of the same version share one.
+        """
+        self._refresh()
+        snapshot = self._snapshot() if self._snapshot is not None else None
+        if snapshot is None or snapshot.generation != self._generation:
+            snapshot = Snapshot(
+                self._rows,
+                self._indexes.averages,
+                Summary.from_dict(self._summary.to_dict()),
+                self._generation,
+            )
+            self._snapshot = weakref.ref(snapshot)
+        return snapshot
+
+    def load_all_students(self) -> List[Student]:
+        """Load all students from the database file."""
+        return list(self.snapshot().students())
+
+    def iter_by_average(self) -> Iterator[dict]:
+        """Stream stored records best average first, file order within ties.
+
+        Reads a snapshot, so changes made while streaming are not seen.
+        """
+        return self.snapshot().iter_by_average()
+
+    def iter_records(self, chunk_size: int = 1 << 16) -> Iterator[dict]:
+        """Stream raw student records from the data file.
+
+        Unlike load_all_students this never holds more than one chunk of
+        the file, so it works for rosters that do not fit in memory.
+        """
+        self.flush()
+        decoder = json.JSONDecoder()
+        try:
+            f = open(self.filename, "r")
+        except FileNotFoundError:
+            return
+        with f:
+            buffer = f.read(chunk_size)
+            pos = 0
+            while True:
+                # Skip the array brackets, separators and whitespace
+                while pos < len(buffer) and buffer[pos] in " \t\r\n[,":
+                    pos += 1
+                if pos == len(buffer):
+                    buffer = f.read(chunk_size)
+                    pos = 0
+                    if not buffer:
+                        return
+                    continue
+                if buffer[pos] == "]":
+                    return
+                try:
+                    record, end = decoder.raw_decode(buffer, pos)
+                except json.JSONDecodeError:
+                    more = f.read(chunk_size)
+                    if not more:
+                        return
+                    buffer = buffer[pos:] + more
+                    pos = 0
+                    continue
+                yield record
+                pos = end
+
+    def iter_students(self) -> Iterator[Student]:
+        """Stream students from the data file one at a time."""
+        for record in self.iter_records():
+            yield Student.from_dict(record)
+
+    @exclusive
     def save_all_students(self, students: List[Student]):
         """Save all students to the database file."""
-        with open(self.filename, "w") as f:
-            json.dump([s.to_dict() for s in students], f, indent=2)
+        self._reset_rows(s.to_dict() for s in students)
+        self._changed([RosterReset()])
 
+    @exclusive
     def add_student(self, student: Student) -> bool:
-        """Add a new student to the database."""
-        students = self.load_all_students()
-        if any(s.email == student.email for s in students):
+        """Add a new student to the database.
+
+        A student without an ID, or with one already in use, is given the
+        next free ID. IDs are never reused, even after their student is
+        removed: the highest one issued is kept in the version sidecar.
+        """
+        self._refresh()
+        if self._indexes.with_email(student.email):
             return False
-        students.append(student)
-        self.save_all_students(students)
+        if not student.id or student.id in self._indexes.ids:
+            # Rows reloaded after a removal no longer show the newest ID
+            self._student_ids.observe(format_student_id(self.version_stamp.id_mark()))
+            student.id = self._student_ids.allocate(self._indexes.ids)
+        if student.id.isdigit():
+            self.version_stamp.raise_id_mark(int(student.id))
+        record = student.to_dict()
+        self._insert_row(record)
+        self._changed([StudentAdded(record)])
         return True
 
+    @synchronized
     def get_student_by_email(self, email: str) -> Optional[Student]:
         """Find a student by email address."""
-        students = self.load_all_students()
-        for student in students:
-            if student.email == email:
-                return student
-        return None
+        self._refresh()
+        rows = self._indexes.with_email(email)
+        return Student.from_dict(self._rows[rows[0]]) if rows else None
 
+    @synchronized
+    def get_record(self, student_id: str) -> Optional[dict]:
+        """Return the stored record for a student ID; treat it as read-only."""
+        self._refresh()
+        rows = self._indexes.with_id(student_id)
+        return self._rows[rows[0]] if rows else None
+
+    @synchronized
+    def get_student(self, student_id: str) -> Optional[Student]:
+        """Find a student by ID."""
+        record = self.get_record(student_id)
+        return Student.from_dict(record) if record is not None else None
+
+    @exclusive
     def update_student(self, student: Student) -> bool:
-        """Update an existing student's information."""
-        students = self.load_all_students()
-        for i, s in enumerate(students):
-            if s.id == student.id:
-                students[i] = student
-                self.save_all_students(students)
-                return True
-        return False
+        """Update an existing student's information.
+
+        The student must carry the version it was loaded at; if the stored
+        record has moved on since, StaleRecordError is raised instead of
+        overwriting the newer change.
+        """
+        self._refresh()
+        rows = self._indexes.with_id(student.id)
+        if not rows:
+            return False
+        row = rows[0]
+        old = self._rows[row]
+        if old.get("version", 0) != student.version:
+            raise StaleRecordError(
+                f"Student {student.id} is at version {old.get('version', 0)}, "
+                f"not {student.version}"
+            )
+        record = student.to_dict()
+        record["version"] = student.version + 1
+        self._replace_row(row, record)
+        self._changed(update_events(old, record))
+        # Only once stored, so a failed write leaves the caller's copy as it was
+        student.version += 1
+        return True
+
+    @exclusive
+    def remove_student(self, student_id: str, version: int = None) -> bool:
+        """Remove a student from the database by ID.
 
-    def remove_student(self, student_id: str) -> bool:
-        """Remove a student from the database by ID."""
-        students = self.load_all_students()
-        initial_count = len(students)
-        students = [s for s in students if s.id != student_id]
-        if len(students) < initial_count:
-            self.save_all_students(students)
+        When a version is given the removal only goes ahead if the stored
+        record is still at that version; otherwise StaleRecordError is raised.
+        """
+        self._refresh()
+        matches = self._indexes.with_id(student_id)
+        if matches:
+            if version is not None:
+                stored = self._rows[matches[0]].get("version", 0)
+                if stored != version:
+                    raise StaleRecordError(
+                        f"Student {student_id} is at version {stored}, not {version}"
+                    )
+            for row in matches:
+                self._delete_row(row)
+            self._changed([StudentRemoved(student_id)])
             return True
         return False
 
+    @synchronized
     def clear_all(self):
         """Remove all students from the database."""
         self.save_all_students([])
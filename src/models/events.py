@@ -0,0 +1,248 @@
+import json
+import os
+import tempfile
+import threading
+import traceback
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional, Tuple, Type
+
+from src.models.student import Student
+
+
+class StudentAdded(NamedTuple):
+    """A student was registered."""
+
+    record: dict
+
+    @property
+    def student(self) -> Student:
+        return Student.from_dict(self.record)
+
+
+class StudentUpdated(NamedTuple):
+    """A stored student changed; record is the new version."""
+
+    record: dict
+
+    @property
+    def student(self) -> Student:
+        return Student.from_dict(self.record)
+
+
+class StudentRemoved(NamedTuple):
+    """A student was deleted."""
+
+    student_id: str
+
+
+class SubjectEnrolled(NamedTuple):
+    """A student gained a subject (also reported as StudentUpdated)."""
+
+    student_id: str
+    subject: dict
+
+
+class SubjectRemoved(NamedTuple):
+    """A student dropped a subject (also reported as StudentUpdated)."""
+
+    student_id: str
+    subject_id: str
+
+
+class RosterReset(NamedTuple):
+    """Every student may have changed; subscribers should reload."""
+
+
+EVENT_TYPES: Dict[str, Type[tuple]] = {
+    cls.__name__: cls
+    for cls in (StudentAdded, StudentUpdated, StudentRemoved,
+                SubjectEnrolled, SubjectRemoved, RosterReset)
+}
+
+Subscriber = Callable[[tuple], None]
+
+
+def update_events(old: dict, new: dict) -> List[tuple]:
+    """Events describing the change from one stored record to the next."""
+    events: List[tuple] = [StudentUpdated(new)]
+    old_ids = {s["id"] for s in old.get("subjects", [])}
+    new_ids = {s["id"] for s in new.get("subjects", [])}
+    events.extend(
+        SubjectEnrolled(new["id"], s) for s in new.get("subjects", []) if s["id"] not in old_ids
+    )
+    events.extend(
+        SubjectRemoved(new["id"], s["id"]) for s in old.get("subjects", []) if s["id"] not in new_ids
+    )
+    return events
+
+
+class EventBus:
+    """In-process publish/subscribe for change events.
+
+    Callbacks run synchronously on the publishing thread, after the change
+    is visible in the database. Database publishes while holding its
+    lock, so events arrive in order, but callbacks should hand slow work
+    off rather than wait on other threads. A failing callback is reported
+    and skipped so it cannot undo or block a stored change.
+    """
+
+    def __init__(self):
+        self._subscribers: List[Tuple[Subscriber, Tuple[type, ...]]] = []
+        self._lock = threading.Lock()
+
+    def subscribe(self, callback: Subscriber, *event_types: type) -> Callable[[], None]:
+        """Call back on every event, or only the given types; returns an unsubscribe function."""
+        entry = (callback, event_types)
+        with self._lock:
+            self._subscribers = self._subscribers + [entry]
+
+        def unsubscribe():
+            with self._lock:
+                self._subscribers = [s for s in self._subscribers if s is not entry]
+        return unsubscribe
+
+    def publish(self, event: tuple):
+        """Deliver one event to its subscribers."""
+        # The list is replaced, never mutated, so this read needs no lock
+        for callback, event_types in self._subscribers:
+            if event_types and not isinstance(event, event_types):
+                continue
+            try:
+                callback(event)
+            except Exception:
+                traceback.print_exc()
+
+    def publish_all(self, events: Iterable[tuple]):
+        for event in events:
+            self.publish(event)
+
+    def __bool__(self) -> bool:
+        return bool(self._subscribers)
+
+
+class ChangeLog:
+    """Append-only JSON-lines file of change events next to the data file.
+
+    Each line holds one event and the origin of the Database that wrote it.
+    Once the file passes max_bytes it is replaced by a fresh one, and
+    readers treat that as a RosterReset.
+    """
+
+    def __init__(self, filename: str, max_bytes: int):
+        self.filename = filename
+        self.max_bytes = max_bytes
+
+    def append(self, events: Iterable[tuple], origin: str):
+        """Write events after the data file itself has been written."""
+        lines = [
+            json.dumps({"origin": origin, "type": type(event).__name__, **event._asdict()})
+            for event in events
+        ]
+        if not lines:
+            return
+        text = "\n".join(lines) + "\n"
+        if self.size() > self.max_bytes:
+            # Start afresh under a new inode so tailers can tell
+            fd, temp = tempfile.mkstemp(
+                dir=os.path.dirname(os.path.abspath(self.filename)),
+                prefix=os.path.basename(self.filename),
+            )
+            with os.fdopen(fd, "w") as f:
+                f.write(text)
+            os.replace(temp, self.filename)
+            return
+        with open(self.filename, "a") as f:
+            f.write(text)
+
+    def stat(self) -> Tuple[int, int]:
+        """(inode, size) of the log, or (0, 0) before anything was written."""
+        try:
+            st = os.stat(self.filename)
+        except OSError:
+            return 0, 0
+        return st.st_ino, st.st_size
+
+    def size(self) -> int:
+        return self.stat()[1]
+
+
+def parse_event(line: str) -> Tuple[Optional[str], Optional[tuple]]:
+    """Decode one change log line into (origin, event); unknown lines give (None, None)."""
+    try:
+        fields = json.loads(line)
+        event_type = EVENT_TYPES[fields.pop("type")]
+        origin = fields.pop("origin", None)
+        return origin, event_type(**fields)
+    except (ValueError, KeyError, TypeError):
+        return None, None
+
+
+class ChangeLogTailer:
+    """Follows another process's changes by tailing the change log.
+
+    Events written by the local Database (its origin) are skipped, since
+    its own bus has already delivered them. Reading starts at the current
+    end of the log; poll() can be called directly or from start()'s thread.
+    """
+
+    def __init__(self, change_log: ChangeLog, bus: EventBus, origin: str = None,
+                 interval: float = 0.5):
+        self.change_log = change_log
+        self.bus = bus
+        self.origin = origin
+        self.interval = interval
+        self._inode, self._offset = change_log.stat()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def poll(self) -> int:
+        """Publish any events appended since the last poll; returns how many."""
+        try:
+            f = open(self.change_log.filename, "rb")
+        except FileNotFoundError:
+            return 0
+        with f:
+            st = os.fstat(f.fileno())
+            if self._inode and (st.st_ino != self._inode or st.st_size < self._offset):
+                # The log was started afresh; earlier unread events are gone
+                self._inode, self._offset = st.st_ino, st.st_size
+                self.bus.publish(RosterReset())
+                return 1
+            self._inode = st.st_ino
+            if st.st_size == self._offset:
+                return 0
+            f.seek(self._offset)
+            chunk = f.read(st.st_size - self._offset)
+
+        # Leave a line that is still being written for the next poll
+        end = chunk.rfind(b"\n") + 1
+        self._offset += end
+
+        published = 0
+        for line in chunk[:end].decode().splitlines():
+            origin, event = parse_event(line)
+            if event is None or (self.origin is not None and origin == self.origin):
+                continue
+            self.bus.publish(event)
+            published += 1
+        return published
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            try:
+                self.poll()
+            except OSError:
+                # The log may be mid-rewrite; try again next interval
+                pass
+
+    def start(self):
+        """Poll in a daemon thread until stop()."""
+        if self._thread is None:
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="change-log", daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
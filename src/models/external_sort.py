@@ -0,0 +1,74 @@
+import heapq
+import json
+import tempfile
+from typing import IO, Iterable, Iterator, List, Tuple
+
+from src.models.indexes import record_average
+from src.models.subject import grade_for_mark
+
+# Rough per-entry cost of the sort key tuple on top of the serialised record
+_ENTRY_OVERHEAD = 128
+
+
+def _spill(batch: List[Tuple[float, int, str]]) -> IO[str]:
+    """Sort a batch and write it to a temporary run file."""
+    batch.sort()
+    run = tempfile.TemporaryFile("w+", encoding="utf-8")
+    for key, seq, line in batch:
+        run.write(f"{json.dumps(key)}\t{seq}\t{line}\n")
+    run.seek(0)
+    return run
+
+
+def _read_run(run: IO[str]) -> Iterator[Tuple[float, int, str]]:
+    for line in run:
+        key, seq, record = line.rstrip("\n").split("\t", 2)
+        yield float(key), int(seq), record
+
+
+def sort_by_average(records: Iterable[dict], memory_budget: int) -> Iterator[dict]:
+    """Yield records by descending average mark using bounded memory.
+
+    Records are buffered until roughly memory_budget bytes, then sorted
+    and spilled to a temporary run file; the runs are k-way merged.
+    Students with equal averages keep their storage order.
+    """
+    runs: List[IO[str]] = []
+    batch: List[Tuple[float, int, str]] = []
+    batch_bytes = 0
+    try:
+        for seq, record in enumerate(records):
+            line = json.dumps(record)
+            batch.append((-record_average(record), seq, line))
+            batch_bytes += len(line) + _ENTRY_OVERHEAD
+            if batch_bytes >= memory_budget:
+                runs.append(_spill(batch))
+                batch = []
+                batch_bytes = 0
+
+        if not runs:
+            batch.sort()
+            for _, _, line in batch:
+                yield json.loads(line)
+            return
+
+        if batch:
+            runs.append(_spill(batch))
+            batch = []
+        for _, _, line in heapq.merge(*(_read_run(run) for run in runs)):
+            yield json.loads(line)
+    finally:
+        for run in runs:
+            run.close()
+
+
+def iter_grade_groups(records: Iterable[dict], memory_budget: int) -> Iterator[Tuple[str, dict]]:
+    """Yield (grade, record) pairs ordered HD to Z, best average first."""
+    for record in sort_by_average(records, memory_budget):
+        yield grade_for_mark(record_average(record)), record
+
+
+def iter_partition(records: Iterable[dict], memory_budget: int) -> Iterator[Tuple[bool, dict]]:
+    """Yield (is_passing, record) pairs, passing students first."""
+    for record in sort_by_average(records, memory_budget):
+        yield record_average(record) >= 50, record
@@ -0,0 +1,75 @@
+import random
+from typing import Collection, Container
+
+# Largest IDs that fit the six-digit student and three-digit subject formats
+STUDENT_ID_MAX = 999_999
+SUBJECT_ID_MAX = 999
+
+
+def format_student_id(number: int) -> str:
+    return f"{number:06d}"
+
+
+def format_subject_id(number: int) -> str:
+    return f"{number:03d}"
+
+
+class StudentIdAllocator:
+    """Hands out unused student IDs in sequence: 000001, 000002, ...
+
+    The sequence continues after the highest ID observed, so IDs stay
+    dense. Database also observes the highest ID ever issued for its
+    file, so a removed student's ID is not handed out again. Once the
+    sequence passes STUDENT_ID_MAX (e.g. after old random IDs near the
+    top), free IDs are filled in from the bottom. Every candidate is
+    checked against the ID index in O(1).
+    """
+
+    def __init__(self):
+        self._next = 1
+        # Where the search for free IDs below the sequence resumes
+        self._gap = 1
+
+    def reset(self):
+        """Forget every ID seen, e.g. before the rows are reloaded."""
+        self._next = 1
+        self._gap = 1
+
+    def observe(self, student_id: str):
+        """Account for a stored ID so the sequence continues after it."""
+        try:
+            number = int(student_id)
+        except (TypeError, ValueError):
+            return
+        if number >= self._next:
+            self._next = number + 1
+
+    def allocate(self, taken: Container[str]) -> str:
+        """Return an ID not in taken (an index keyed by student ID)."""
+        while self._next <= STUDENT_ID_MAX:
+            candidate = format_student_id(self._next)
+            self._next += 1
+            if candidate not in taken:
+                return candidate
+        for start in (self._gap, 1):
+            for number in range(start, STUDENT_ID_MAX + 1):
+                candidate = format_student_id(number)
+                if candidate not in taken:
+                    self._gap = number + 1
+                    return candidate
+        raise ValueError("Every student ID is in use")
+
+
+def allocate_subject_id(taken: Collection[str] = (), rng: random.Random = None) -> str:
+    """Draw a random subject ID the student is not already enrolled in.
+
+    Subject IDs name courses shared across students, so they stay random
+    rather than sequential; taken only needs the student's own subjects.
+    """
+    if len(taken) >= SUBJECT_ID_MAX:
+        raise ValueError("Every subject ID is in use")
+    rng = rng or random
+    while True:
+        candidate = format_subject_id(rng.randint(1, SUBJECT_ID_MAX))
+        if candidate not in taken:
+            return candidate
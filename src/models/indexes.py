@@ -0,0 +1,160 @@
+from bisect import bisect_left, insort
+from typing import Dict, KeysView, List, NamedTuple, Tuple
+
+from src.models.leaderboard import Leaderboard
+
+# Sorts after any real character, used to close a name prefix range.
+_PREFIX_END = "\U0010ffff"
+
+
+class RosterEntry(NamedTuple):
+    """One student's result in a subject."""
+
+    student_id: str
+    mark: float
+    grade: str
+
+
+def record_average(record: dict) -> float:
+    """Calculate the average mark of a stored student record."""
+    subjects = record.get("subjects") or []
+    if not subjects:
+        return 0.0
+    return sum(s["mark"] for s in subjects) / len(subjects)
+
+
+class StudentIndexes:
+    """Secondary indexes over stored student records.
+
+    Every entry is keyed by the database row number of the record, so
+    students sharing an ID are still indexed separately.
+    """
+
+    def __init__(self):
+        self.averages: List[Tuple[float, int]] = []
+        self.names: List[Tuple[str, int]] = []
+        # subject ID -> row -> that row's results in the subject
+        self.subjects: Dict[str, Dict[int, List[RosterEntry]]] = {}
+        self.grades: Dict[str, Dict[int, int]] = {}
+        # student ID / email -> rows holding it
+        self.ids: Dict[str, Dict[int, None]] = {}
+        self.emails: Dict[str, Dict[int, None]] = {}
+        self.leaderboard = Leaderboard()
+
+    def clear(self):
+        """Drop every index entry."""
+        self.leaderboard.clear()
+        self.averages.clear()
+        self.names.clear()
+        self.subjects.clear()
+        self.grades.clear()
+        self.ids.clear()
+        self.emails.clear()
+
+    def add(self, row: int, record: dict):
+        """Index a record stored at the given row."""
+        average = record_average(record)
+        self.leaderboard.add(average)
+        insort(self.averages, (average, row))
+        insort(self.names, (record["name"].lower(), row))
+        self.ids.setdefault(record["id"], {})[row] = None
+        self.emails.setdefault(record["email"], {})[row] = None
+        for subject in record.get("subjects") or []:
+            entry = RosterEntry(record["id"], subject["mark"], subject["grade"])
+            self.subjects.setdefault(subject["id"], {}).setdefault(row, []).append(entry)
+            grade_rows = self.grades.setdefault(subject["grade"], {})
+            grade_rows[row] = grade_rows.get(row, 0) + 1
+
+    def remove(self, row: int, record: dict):
+        """Remove the entries of a record stored at the given row."""
+        average = record_average(record)
+        self.leaderboard.remove(average)
+        self._remove_sorted(self.averages, (average, row))
+        self._remove_sorted(self.names, (record["name"].lower(), row))
+        self._discard(self.ids, record["id"], row)
+        self._discard(self.emails, record["email"], row)
+        for subject in record.get("subjects") or []:
+            self._discard(self.subjects, subject["id"], row)
+            grade_rows = self.grades.get(subject["grade"])
+            if grade_rows and row in grade_rows:
+                grade_rows[row] -= 1
+                if not grade_rows[row]:
+                    self._discard(self.grades, subject["grade"], row)
+
+    @staticmethod
+    def _remove_sorted(entries: List[tuple], entry: tuple):
+        i = bisect_left(entries, entry)
+        if i < len(entries) and entries[i] == entry:
+            del entries[i]
+
+    @staticmethod
+    def _discard(index: Dict[str, dict], key: str, row: int):
+        rows = index.get(key)
+        if rows is None:
+            return
+        rows.pop(row, None)
+        if not rows:
+            del index[key]
+
+    def average_range(self, low: float = None, high: float = None,
+                      include_low: bool = True, include_high: bool = True) -> List[int]:
+        """Rows whose average lies within the given bounds."""
+        start, end = self._average_bounds(low, high, include_low, include_high)
+        return [row for _, row in self.averages[start:end]]
+
+    def count_average_range(self, low: float = None, high: float = None,
+                            include_low: bool = True, include_high: bool = True) -> int:
+        """Number of rows whose average lies within the given bounds."""
+        start, end = self._average_bounds(low, high, include_low, include_high)
+        return max(0, end - start)
+
+    def _average_bounds(self, low, high, include_low, include_high) -> Tuple[int, int]:
+        start = 0
+        end = len(self.averages)
+        if low is not None:
+            # Row numbers are never negative, so -1 / inf bracket every row.
+            start = bisect_left(self.averages, (low, -1 if include_low else float("inf")))
+        if high is not None:
+            end = bisect_left(self.averages, (high, float("inf") if include_high else -1))
+        return start, end
+
+    def name_prefix(self, prefix: str) -> List[int]:
+        """Rows whose name starts with prefix (case-insensitive)."""
+        start, end = self._name_bounds(prefix)
+        return [row for _, row in self.names[start:end]]
+
+    def count_name_prefix(self, prefix: str) -> int:
+        """Number of rows whose name starts with prefix."""
+        start, end = self._name_bounds(prefix)
+        return end - start
+
+    def _name_bounds(self, prefix: str) -> Tuple[int, int]:
+        prefix = prefix.lower()
+        start = bisect_left(self.names, (prefix, -1))
+        end = bisect_left(self.names, (prefix + _PREFIX_END, -1))
+        return start, end
+
+    def enrolled_in(self, subject_id: str) -> KeysView[int]:
+        """Rows enrolled in the given subject."""
+        return self.subjects.get(subject_id, {}).keys()
+
+    def with_grade(self, grade: str) -> KeysView[int]:
+        """Rows holding at least one subject with the given grade."""
+        return self.grades.get(grade, {}).keys()
+
+    def with_id(self, student_id: str) -> List[int]:
+        """Rows storing the given student ID, in file order."""
+        return sorted(self.ids.get(student_id, ()))
+
+    def with_email(self, email: str) -> List[int]:
+        """Rows storing the given email address, in file order."""
+        return sorted(self.emails.get(email, ()))
+
+    def subject_roster(self, subject_id: str) -> List[RosterEntry]:
+        """Every student result recorded for the given subject."""
+        rows = self.subjects.get(subject_id, {})
+        return [entry for row in sorted(rows) for entry in rows[row]]
+
+    def subject_ids(self) -> List[str]:
+        """IDs of every subject with at least one enrolment."""
+        return sorted(self.subjects)
@@ -0,0 +1,87 @@
+from typing import List, NamedTuple
+
+# Averages are quantised to 0.1 steps over 0.0-100.0
+BUCKETS_PER_MARK = 10
+MAX_MARK = 100
+
+
+class Standing(NamedTuple):
+    """A student's position on the leaderboard."""
+
+    rank: int
+    total: int
+    percentile: float
+
+
+class FenwickTree:
+    """Binary indexed tree of counts supporting prefix sums in O(log M)."""
+
+    def __init__(self, size: int):
+        self.size = size
+        self._tree: List[int] = [0] * (size + 1)
+
+    def add(self, index: int, delta: int):
+        """Add delta to the count at a zero-based index."""
+        i = index + 1
+        while i <= self.size:
+            self._tree[i] += delta
+            i += i & -i
+
+    def prefix_sum(self, index: int) -> int:
+        """Sum of counts at zero-based indexes 0..index inclusive."""
+        total = 0
+        i = min(index, self.size - 1) + 1
+        while i > 0:
+            total += self._tree[i]
+            i -= i & -i
+        return total
+
+    def clear(self):
+        """Reset every count to zero."""
+        self._tree = [0] * (self.size + 1)
+
+
+class Leaderboard:
+    """Order statistics over student averages for rank and percentile queries."""
+
+    def __init__(self):
+        self._counts = FenwickTree(MAX_MARK * BUCKETS_PER_MARK + 1)
+        self.total = 0
+
+    @staticmethod
+    def _bucket(average: float) -> int:
+        bucket = int(round(average * BUCKETS_PER_MARK))
+        return max(0, min(bucket, MAX_MARK * BUCKETS_PER_MARK))
+
+    def clear(self):
+        """Forget every recorded average."""
+        self._counts.clear()
+        self.total = 0
+
+    def add(self, average: float):
+        """Record a student's average."""
+        self._counts.add(self._bucket(average), 1)
+        self.total += 1
+
+    def remove(self, average: float):
+        """Forget a previously recorded average."""
+        self._counts.add(self._bucket(average), -1)
+        self.total -= 1
+
+    def count_at_most(self, average: float) -> int:
+        """Number of students whose average is at or below the given one."""
+        return self._counts.prefix_sum(self._bucket(average))
+
+    def rank(self, average: float) -> int:
+        """1-based rank, where students sharing a bucket share a rank."""
+        return self.total - self.count_at_most(average) + 1
+
+    def percentile(self, average: float) -> float:
+        """Percentage of students whose average is at or below the given one."""
+        if not self.total:
+            return 0.0
+        return 100.0 * self.count_at_most(average) / self.total
+
+    def standing(self, average: float) -> Standing:
+        """Rank, roster size and percentile for an average."""
+        return Standing(self.rank(average), self.total, self.percentile(average))
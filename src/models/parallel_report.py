@@ -0,0 +1,145 @@
+import heapq
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from src.models.indexes import record_average
+from src.models.reports import GRADE_ORDER, RosterReport
+from src.models.subject import grade_for_mark
+
+# Lines the database writer (json.dump with indent=2) uses around each record
+_RECORD_START = b"  {"
+_RECORD_ENDS = (b"  }", b"  },")
+
+# Records per chunk when the file has to be split by record range
+_RECORD_BATCH = 10_000
+
+
+def _empty_partial() -> dict:
+    return {
+        "count": 0,
+        "passing": 0,
+        "grade_counts": {grade: 0 for grade in GRADE_ORDER},
+        "runs": {grade: [] for grade in GRADE_ORDER},
+    }
+
+
+def _aggregate(records: Iterable[Tuple[int, dict]]) -> dict:
+    """Compute bucket counts and per-bucket sorted runs for some records.
+
+    Each run entry is (-average, storage order, student_id) so runs from
+    different chunks merge into best-first, file-order-stable output.
+    """
+    partial = _empty_partial()
+    for order, record in records:
+        average = record_average(record)
+        grade = grade_for_mark(average)
+        partial["count"] += 1
+        partial["passing"] += average >= 50
+        partial["grade_counts"][grade] += 1
+        partial["runs"][grade].append((-average, order, record["id"]))
+    for run in partial["runs"].values():
+        run.sort()
+    return partial
+
+
+def _scan_byte_range(filename: str, start: int, end: int) -> Iterator[Tuple[int, dict]]:
+    """Yield (offset, record) for every record that starts within [start, end)."""
+    with open(filename, "rb") as f:
+        offset = max(start - 1, 0)
+        f.seek(offset)
+        if start > 0:
+            # Finish the line the range begins in
+            offset += len(f.readline())
+
+        lines: Optional[List[bytes]] = None
+        record_start = 0
+        for line in f:
+            stripped = line.rstrip(b"\r\n")
+            if lines is None:
+                if stripped == _RECORD_START:
+                    if offset >= end:
+                        return
+                    lines = [line]
+                    record_start = offset
+            else:
+                lines.append(line)
+                if stripped in _RECORD_ENDS:
+                    yield record_start, json.loads(b"".join(lines).rstrip().rstrip(b","))
+                    lines = None
+            offset += len(line)
+
+
+def _aggregate_byte_range(filename: str, start: int, end: int) -> dict:
+    return _aggregate(_scan_byte_range(filename, start, end))
+
+
+def _aggregate_records(first_order: int, records: List[dict]) -> dict:
+    return _aggregate(enumerate(records, first_order))
+
+
+def _is_record_per_line_layout(filename: str) -> bool:
+    """Check for the indented layout written by Database, which can be split by bytes."""
+    with open(filename, "rb") as f:
+        head = f.read(8)
+    return head.startswith(b"[\n" + _RECORD_START) or head.strip() == b"[]"
+
+
+class ParallelReportExecutor:
+    """Map-reduce roster report across worker processes."""
+
+    def __init__(self, workers: int = None, chunks_per_worker: int = 4):
+        """Initialize with a worker count (defaults to the CPU count)."""
+        self.workers = workers or os.cpu_count() or 1
+        self.chunks_per_worker = chunks_per_worker
+
+    def _byte_ranges(self, filename: str) -> List[Tuple[int, int]]:
+        size = os.path.getsize(filename)
+        chunks = max(1, self.workers * self.chunks_per_worker)
+        step = max(1, -(-size // chunks))
+        return [(start, min(start + step, size)) for start in range(0, size, step)]
+
+    def run(self, database) -> RosterReport:
+        """Build the roster report for a database's data file."""
+        # Workers read the file itself, so it must hold every change
+        database.flush()
+        filename = database.filename
+        with ProcessPoolExecutor(max_workers=self.workers) as executor:
+            if _is_record_per_line_layout(filename):
+                futures = [
+                    executor.submit(_aggregate_byte_range, filename, start, end)
+                    for start, end in self._byte_ranges(filename)
+                ]
+            else:
+                futures = []
+                batch: List[dict] = []
+                first_order = 0
+                for order, record in enumerate(database.iter_records()):
+                    if not batch:
+                        first_order = order
+                    batch.append(record)
+                    if len(batch) >= _RECORD_BATCH:
+                        futures.append(executor.submit(_aggregate_records, first_order, batch))
+                        batch = []
+                if batch:
+                    futures.append(executor.submit(_aggregate_records, first_order, batch))
+            partials = [future.result() for future in futures]
+        return self.merge(partials)
+
+    @staticmethod
+    def merge(partials: List[dict]) -> RosterReport:
+        """Combine partial aggregates from the workers."""
+        count = sum(p["count"] for p in partials)
+        passing = sum(p["passing"] for p in partials)
+        grade_counts: Dict[str, int] = {
+            grade: sum(p["grade_counts"][grade] for p in partials) for grade in GRADE_ORDER
+        }
+        groups = {
+            grade: [
+                (student_id, -neg_average)
+                for neg_average, _, student_id in heapq.merge(*(p["runs"][grade] for p in partials))
+            ]
+            for grade in GRADE_ORDER
+        }
+        return RosterReport(count, passing, grade_counts, groups)
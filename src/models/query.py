@@ -0,0 +1,198 @@
+import re
+from abc import ABC, abstractmethod
+from typing import Iterable, List, Optional, Tuple
+
+from src.models.indexes import StudentIndexes, record_average
+
+
+class Predicate(ABC):
+    """A filter over stored student records that can be served by an index."""
+
+    @abstractmethod
+    def matches(self, record: dict) -> bool:
+        """Check the predicate against a single record."""
+        pass
+
+    @abstractmethod
+    def estimate(self, indexes: StudentIndexes) -> int:
+        """Number of candidate rows the index would produce."""
+        pass
+
+    @abstractmethod
+    def candidates(self, indexes: StudentIndexes) -> Iterable[int]:
+        """Candidate rows according to the index."""
+        pass
+
+
+class AverageRange(Predicate):
+    """Average mark within [low, high]; either bound may be omitted."""
+
+    def __init__(self, low: float = None, high: float = None,
+                 include_low: bool = True, include_high: bool = True):
+        self.low = low
+        self.high = high
+        self.include_low = include_low
+        self.include_high = include_high
+
+    def matches(self, record: dict) -> bool:
+        avg = record_average(record)
+        if self.low is not None:
+            if avg < self.low or (avg == self.low and not self.include_low):
+                return False
+        if self.high is not None:
+            if avg > self.high or (avg == self.high and not self.include_high):
+                return False
+        return True
+
+    def estimate(self, indexes: StudentIndexes) -> int:
+        return indexes.count_average_range(
+            self.low, self.high, self.include_low, self.include_high
+        )
+
+    def candidates(self, indexes: StudentIndexes) -> Iterable[int]:
+        return indexes.average_range(
+            self.low, self.high, self.include_low, self.include_high
+        )
+
+    def __repr__(self):
+        return f"AverageRange(low={self.low}, high={self.high})"
+
+
+class EnrolledIn(Predicate):
+    """Enrolled in the subject with the given ID."""
+
+    def __init__(self, subject_id: str):
+        self.subject_id = subject_id
+
+    def matches(self, record: dict) -> bool:
+        return any(s["id"] == self.subject_id for s in record.get("subjects") or [])
+
+    def estimate(self, indexes: StudentIndexes) -> int:
+        return len(indexes.enrolled_in(self.subject_id))
+
+    def candidates(self, indexes: StudentIndexes) -> Iterable[int]:
+        return indexes.enrolled_in(self.subject_id)
+
+    def __repr__(self):
+        return f"EnrolledIn({self.subject_id!r})"
+
+
+class HasGrade(Predicate):
+    """Holds at least one subject with the given grade."""
+
+    def __init__(self, grade: str):
+        self.grade = grade.upper()
+
+    def matches(self, record: dict) -> bool:
+        return any(s["grade"] == self.grade for s in record.get("subjects") or [])
+
+    def estimate(self, indexes: StudentIndexes) -> int:
+        return len(indexes.with_grade(self.grade))
+
+    def candidates(self, indexes: StudentIndexes) -> Iterable[int]:
+        return indexes.with_grade(self.grade)
+
+    def __repr__(self):
+        return f"HasGrade({self.grade!r})"
+
+
+class NamePrefix(Predicate):
+    """Name starts with the given prefix (case-insensitive)."""
+
+    def __init__(self, prefix: str):
+        self.prefix = prefix
+
+    def matches(self, record: dict) -> bool:
+        return record["name"].lower().startswith(self.prefix.lower())
+
+    def estimate(self, indexes: StudentIndexes) -> int:
+        return indexes.count_name_prefix(self.prefix)
+
+    def candidates(self, indexes: StudentIndexes) -> Iterable[int]:
+        return indexes.name_prefix(self.prefix)
+
+    def __repr__(self):
+        return f"NamePrefix({self.prefix!r})"
+
+
+class QueryEngine:
+    """Answers conjunctive student queries using the database indexes."""
+
+    def __init__(self, database):
+        """Initialize with the database to query."""
+        self.database = database
+
+    def plan(self, predicates: List[Predicate]) -> Tuple[Optional[Predicate], List[Predicate]]:
+        """Pick the most selective predicate to drive the lookup.
+
+        Returns the driving predicate and the residual predicates that are
+        checked against each candidate record.
+        """
+        if not predicates:
+            return None, []
+        indexes = self.database.get_indexes()
+        driver = min(predicates, key=lambda p: p.estimate(indexes))
+        residual = [p for p in predicates if p is not driver]
+        return driver, residual
+
+    def find(self, *predicates: Predicate) -> list:
+        """Find students matching every predicate, in storage order."""
+        with self.database.lock:
+            driver, residual = self.plan(list(predicates))
+            if driver is None:
+                return self.database.load_all_students()
+            rows = sorted(driver.candidates(self.database.get_indexes()))
+            records = self.database.get_records(rows)
+        return self.database.to_students(
+            r for r in records if all(p.matches(r) for p in residual)
+        )
+
+
+_TERM_PATTERN = re.compile(r"^\s*(avg|average|subject|grade|name)\s*(>=|<=|\^=|=|>|<)\s*(.+?)\s*$",
+                           re.IGNORECASE)
+
+
+def parse_query(text: str) -> List[Predicate]:
+    """Parse a filter such as "avg>=85 and name^=Li" into predicates.
+
+    Supported terms: avg (>=, >, <=, <, =), subject=ID, grade=G and
+    name^=PREFIX, joined by "and" or commas.
+    """
+    predicates = []
+    for term in re.split(r",|\band\b", text, flags=re.IGNORECASE):
+        if not term.strip():
+            continue
+        match = _TERM_PATTERN.match(term)
+        if not match:
+            raise ValueError(f"Invalid filter term: {term.strip()}")
+
+        field, op, value = match.group(1).lower(), match.group(2), match.group(3)
+        if field in ("avg", "average"):
+            try:
+                number = float(value)
+            except ValueError:
+                raise ValueError(f"Invalid average value: {value}")
+            if op == ">=":
+                predicates.append(AverageRange(low=number))
+            elif op == ">":
+                predicates.append(AverageRange(low=number, include_low=False))
+            elif op == "<=":
+                predicates.append(AverageRange(high=number))
+            elif op == "<":
+                predicates.append(AverageRange(high=number, include_high=False))
+            elif op == "=":
+                predicates.append(AverageRange(low=number, high=number))
+            else:
+                raise ValueError(f"Unsupported operator for average: {op}")
+        elif field == "subject" and op == "=":
+            predicates.append(EnrolledIn(value))
+        elif field == "grade" and op == "=":
+            predicates.append(HasGrade(value))
+        elif field == "name" and op == "^=":
+            predicates.append(NamePrefix(value))
+        else:
+            raise ValueError(f"Unsupported operator for {field}: {op}")
+
+    if not predicates:
+        raise ValueError("Empty filter")
+    return predicates
@@ -0,0 +1,90 @@
+import math
+from statistics import median
+from typing import Dict, Iterable, List, Tuple
+
+from src.models.indexes import RosterEntry
+
+GRADE_ORDER = ["HD", "D", "C", "P", "Z"]
+
+
+class SubjectReport:
+    """Summary statistics for the students enrolled in one subject."""
+
+    def __init__(self, subject_id: str, roster: List[RosterEntry], count: int,
+                 mean: float, median: float, std_dev: float,
+                 grade_distribution: Dict[str, int]):
+        self.subject_id = subject_id
+        self.roster = roster
+        self.count = count
+        self.mean = mean
+        self.median = median
+        self.std_dev = std_dev
+        self.grade_distribution = grade_distribution
+
+    @classmethod
+    def from_roster(cls, subject_id: str, roster: Iterable[RosterEntry]) -> "SubjectReport":
+        """Compute the report in a single pass over the roster."""
+        entries = []
+        marks = []
+        distribution = {grade: 0 for grade in GRADE_ORDER}
+        count = 0
+        mean = 0.0
+        m2 = 0.0
+        for entry in roster:
+            # Welford's update keeps mean and variance numerically stable
+            count += 1
+            delta = entry.mark - mean
+            mean += delta / count
+            m2 += delta * (entry.mark - mean)
+            distribution[entry.grade] = distribution.get(entry.grade, 0) + 1
+            entries.append(entry)
+            marks.append(entry.mark)
+
+        return cls(
+            subject_id=subject_id,
+            roster=entries,
+            count=count,
+            mean=mean,
+            median=median(marks) if marks else 0.0,
+            std_dev=math.sqrt(m2 / count) if count else 0.0,
+            grade_distribution=distribution,
+        )
+
+    def to_dict(self) -> dict:
+        return {
+            "subject_id": self.subject_id,
+            "count": self.count,
+            "mean": self.mean,
+            "median": self.median,
+            "std_dev": self.std_dev,
+            "grade_distribution": dict(self.grade_distribution),
+            "roster": [entry._asdict() for entry in self.roster],
+        }
+
+
+class RosterReport:
+    """Grade buckets and pass/fail counts for the whole roster."""
+
+    def __init__(self, count: int, passing: int, grade_counts: Dict[str, int],
+                 groups: Dict[str, List[Tuple[str, float]]]):
+        self.count = count
+        self.passing = passing
+        self.grade_counts = grade_counts
+        # grade -> [(student_id, average)], best average first
+        self.groups = groups
+
+    @property
+    def failing(self) -> int:
+        return self.count - self.passing
+
+    def to_dict(self) -> dict:
+        return {
+            "count": self.count,
+            "passing": self.passing,
+            "failing": self.failing,
+            "grade_counts": dict(self.grade_counts),
+            "groups": {
+                grade: [{"student_id": sid, "average": avg} for sid, avg in students]
+                for grade, students in self.groups.items()
+            },
+        }
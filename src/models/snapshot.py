@@ -0,0 +1,51 @@
+from typing import Dict, Iterator, List, Tuple
+
+from src.models.student import Student
+from src.models.summary import Summary
+
+
+class Snapshot:
+    """Point-in-time view of the stored students.
+
+    Shares the database's row table and average index instead of copying
+    them; the database copies them before its next change while a
+    snapshot still holds them. Nothing here may be mutated, and a version
+    is freed as soon as the last snapshot of it is dropped.
+    """
+
+    def __init__(self, rows: Dict[int, dict], averages: List[Tuple[float, int]],
+                 summary: Summary, generation: int):
+        self.rows = rows
+        self.averages = averages
+        self.summary = summary
+        self.generation = generation
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def records(self) -> Iterator[dict]:
+        """Stored records in file order."""
+        return iter(self.rows.values())
+
+    def students(self) -> Iterator[Student]:
+        """Fresh Student objects in file order."""
+        for record in self.rows.values():
+            yield Student.from_dict(record)
+
+    def iter_by_average(self) -> Iterator[dict]:
+        """Records best average first, file order within ties.
+
+        Walks the average index instead of sorting, so the first records
+        are available immediately.
+        """
+        entries = self.averages
+        end = len(entries)
+        while end:
+            # The index is ascending by (average, row); emit each run of equal
+            # averages in row order
+            start = end - 1
+            while start and entries[start - 1][0] == entries[end - 1][0]:
+                start -= 1
+            for _, row in entries[start:end]:
+                yield self.rows[row]
+            end = start
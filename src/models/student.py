@@ -1,4 +1,3 @@
-import random
 from typing import List
 
 from src.models.base_model import BaseModel
@@ -12,11 +11,14 @@ class Student(BaseModel):
 
     def __init__(self, name: str, email: str, password: str):
         """Initialize a new student."""
-        self.id = f"{random.randint(1, 999999):06d}"
+        # Assigned by the database when the student is added
+        self.id = ""
         self.name = name
         self.email = email
         self.password = password
         self.subjects: List[Subject] = []
+        # Bumped by the database on every stored update
+        self.version = 0
 
     def enrol_subject(self, subject: Subject) -> bool:
         """Enrol in a new subject if not already at maximum."""
@@ -48,6 +50,7 @@ class Student(BaseModel):
             "email": self.email,
             "password": self.password,
             "subjects": [s.to_dict() for s in self.subjects],
+            "version": self.version,
         }
 
     @classmethod
@@ -55,4 +58,5 @@ class Student(BaseModel):
         student = cls(data["name"], data["email"], data["password"])
         student.id = data["id"]
         student.subjects = [Subject.from_dict(s) for s in data["subjects"]]
+        student.version = data.get("version", 0)
         return student
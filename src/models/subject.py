@@ -1,6 +1,21 @@
 import random
 
 from src.models.base_model import BaseModel
+from src.models.ids import allocate_subject_id
+
+
+def grade_for_mark(mark: float) -> str:
+    """Calculate grade letter for a mark."""
+    if mark >= 85:
+        return "HD"
+    elif mark >= 75:
+        return "D"
+    elif mark >= 65:
+        return "C"
+    elif mark >= 50:
+        return "P"
+    else:
+        return "Z"
 
 
 class Subject(BaseModel):
@@ -8,22 +23,13 @@ class Subject(BaseModel):
 
     def __init__(self, subject_id: str = None, mark: float = None):
         """Initialize a new subject."""
-        self.id = subject_id or f"{random.randint(1, 999):03d}"
+        self.id = subject_id or allocate_subject_id()
         self.mark = mark or random.randint(25, 100)
         self.grade = self._calculate_grade()
 
     def _calculate_grade(self) -> str:
         """Calculate grade based on mark."""
-        if self.mark >= 85:
-            return "HD"
-        elif self.mark >= 75:
-            return "D"
-        elif self.mark >= 65:
-            return "C"
-        elif self.mark >= 50:
-            return "P"
-        else:
-            return "Z"
+        return grade_for_mark(self.mark)
 
     def to_dict(self) -> dict:
         return {"id": self.id, "mark": self.mark, "grade": self.grade}
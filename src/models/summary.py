@@ -0,0 +1,93 @@
+import json
+import math
+from typing import Dict, Iterable, Optional
+
+from src.models.base_model import BaseModel
+from src.models.indexes import record_average
+from src.models.reports import GRADE_ORDER
+from src.models.subject import grade_for_mark
+
+
+class Summary(BaseModel):
+    """Headline roster numbers kept in a sidecar next to the data file."""
+
+    def __init__(self, count: int = 0, passing: int = 0, average_sum: float = 0.0,
+                 grade_distribution: Dict[str, int] = None):
+        self.count = count
+        self.passing = passing
+        self.average_sum = average_sum
+        self.grade_distribution = grade_distribution or {grade: 0 for grade in GRADE_ORDER}
+
+    @property
+    def pass_rate(self) -> float:
+        """Percentage of students whose average is a pass."""
+        return 100.0 * self.passing / self.count if self.count else 0.0
+
+    @property
+    def mean_average(self) -> float:
+        """Mean of every student's average mark."""
+        return self.average_sum / self.count if self.count else 0.0
+
+    def add(self, record: dict):
+        """Account for a stored record."""
+        self._apply(record, 1)
+
+    def remove(self, record: dict):
+        """Stop accounting for a stored record."""
+        self._apply(record, -1)
+
+    def _apply(self, record: dict, sign: int):
+        average = record_average(record)
+        grade = grade_for_mark(average)
+        self.count += sign
+        self.passing += sign if average >= 50 else 0
+        self.average_sum += sign * average
+        self.grade_distribution[grade] = self.grade_distribution.get(grade, 0) + sign
+
+    @classmethod
+    def compute(cls, records: Iterable[dict]) -> "Summary":
+        """Recompute the summary from scratch."""
+        summary = cls()
+        for record in records:
+            summary.add(record)
+        return summary
+
+    def matches(self, other: "Summary") -> bool:
+        """Compare two summaries, allowing float drift in the running sum."""
+        return (
+            self.count == other.count
+            and self.passing == other.passing
+            and self.grade_distribution == other.grade_distribution
+            and math.isclose(self.average_sum, other.average_sum, abs_tol=1e-6)
+        )
+
+    def to_dict(self) -> dict:
+        return {
+            "count": self.count,
+            "passing": self.passing,
+            "average_sum": self.average_sum,
+            "grade_distribution": dict(self.grade_distribution),
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "Summary":
+        return cls(
+            count=data["count"],
+            passing=data["passing"],
+            average_sum=data["average_sum"],
+            grade_distribution=dict(data["grade_distribution"]),
+        )
+
+    def save(self, filename: str):
+        """Write the summary sidecar file."""
+        with open(filename, "w") as f:
+            f.write(self.to_json())
+
+    @classmethod
+    def load(cls, filename: str) -> Optional["Summary"]:
+        """Read the summary sidecar file, or None if missing or unreadable."""
+        try:
+            with open(filename, "r") as f:
+                return cls.from_dict(json.load(f))
+        except (json.JSONDecodeError, FileNotFoundError, KeyError):
+            return None
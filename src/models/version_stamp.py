@@ -0,0 +1,120 @@
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+
+class VersionStamp:
+    """Write counter shared by every process using a data file.
+
+    The counter lives in a small sidecar that writers overwrite in place
+    after each write and readers check with a single positioned read of a
+    descriptor kept open, so it is far cheaper than re-reading the data.
+    Unlike a modification time it changes on every write, however close
+    together or same-sized.
+
+    A second field after the counter holds the highest student ID ever
+    issued for the file, so that no process hands out an ID again after
+    the student holding it is removed.
+    """
+
+    # Fixed-width decimal so an in-place overwrite replaces every byte
+    WIDTH = 20
+    # Byte offsets of the write counter and the issued ID high-water mark
+    COUNTER = 0
+    ID_MARK = WIDTH
+
+    def __init__(self, filename: str):
+        self.filename = filename
+        self._fd = None
+        # flock is not counted, so nested holders are counted here and
+        # only the outermost one takes and releases it
+        self._holders = 0
+        self._guard = threading.Lock()
+
+    def _open(self) -> int:
+        if self._fd is None:
+            self._fd = os.open(self.filename, os.O_RDWR | os.O_CREAT, 0o644)
+        return self._fd
+
+    def _read_field(self, offset: int) -> int:
+        fd = self._open()
+        if hasattr(os, "pread"):
+            data = os.pread(fd, self.WIDTH, offset)
+        else:
+            os.lseek(fd, offset, os.SEEK_SET)
+            data = os.read(fd, self.WIDTH)
+        try:
+            return int(data)
+        except ValueError:
+            # Empty, or caught mid-write; the next check sees the new value
+            return 0
+
+    def _write_field(self, offset: int, value: int):
+        data = f"{value:0{self.WIDTH}d}".encode()
+        fd = self._open()
+        if hasattr(os, "pwrite"):
+            os.pwrite(fd, data, offset)
+        else:
+            os.lseek(fd, offset, os.SEEK_SET)
+            os.write(fd, data)
+
+    def read(self) -> int:
+        """Current counter (0 before the first write)."""
+        return self._read_field(self.COUNTER)
+
+    def bump(self) -> int:
+        """Advance the counter after a write and return the new value.
+
+        Seeding from the clock keeps values from two writers that raced
+        on the same old value distinct.
+        """
+        value = max(self.read() + 1, time.time_ns())
+        self._write_field(self.COUNTER, value)
+        return value
+
+    def id_mark(self) -> int:
+        """Highest student ID number issued so far (0 if none)."""
+        return self._read_field(self.ID_MARK)
+
+    def raise_id_mark(self, number: int):
+        """Record that a student ID number was issued; call under locked()."""
+        if number > self.id_mark():
+            self._write_field(self.ID_MARK, number)
+
+    @contextmanager
+    def locked(self):
+        """Hold an exclusive lock shared with every other process using the file.
+
+        The lock may be taken again while held, from any thread of this
+        process; it is released when the outermost holder leaves. Without
+        flock (Windows) there is no cross-process lock, and writers rely on
+        the version checks alone.
+        """
+        if fcntl is None:
+            yield
+            return
+        with self._guard:
+            if not self._holders:
+                fcntl.flock(self._open(), fcntl.LOCK_EX)
+            self._holders += 1
+        try:
+            yield
+        finally:
+            with self._guard:
+                self._holders -= 1
+                if not self._holders:
+                    fcntl.flock(self._fd, fcntl.LOCK_UN)
+
+    def close(self):
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+    def __del__(self):
+        self.close()
@@ -0,0 +1,5 @@
+"""Local HTTP/JSON API for the university application."""
+
+from .http_server import ApiServer
+
+__all__ = ["ApiServer"]
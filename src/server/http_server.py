@@ -0,0 +1,345 @@
+import asyncio
+import json
+import re
+import traceback
+from http import HTTPStatus
+from typing import Any, Callable, Dict, List, Optional, Pattern, Tuple
+from urllib.parse import parse_qs, unquote, urlsplit
+
+from src.models.async_database import AsyncDatabase
+from src.services.payloads import Payload, PayloadCache, student_data
+from src.services.university_service import (
+    AuthenticationError,
+    ConflictError,
+    NotFoundError,
+    ServiceError,
+    UniversityService,
+    ValidationError,
+)
+
+ERROR_STATUS = {
+    ValidationError: HTTPStatus.BAD_REQUEST,
+    AuthenticationError: HTTPStatus.UNAUTHORIZED,
+    NotFoundError: HTTPStatus.NOT_FOUND,
+    ConflictError: HTTPStatus.CONFLICT,
+}
+
+# Largest request body accepted, in bytes
+MAX_BODY = 1 << 20
+
+
+class Request:
+    """One parsed HTTP request."""
+
+    def __init__(self, method: str, target: str, version: str, headers: Dict[str, str], body: bytes):
+        self.method = method
+        url = urlsplit(target)
+        self.path = unquote(url.path)
+        self.query = {k: v[-1] for k, v in parse_qs(url.query).items()}
+        self.version = version
+        self.headers = headers
+        self.body = body
+
+    @property
+    def keep_alive(self) -> bool:
+        connection = self.headers.get("connection", "").lower()
+        if self.version == "HTTP/1.0":
+            return connection == "keep-alive"
+        return connection != "close"
+
+    def json(self) -> Dict[str, Any]:
+        """The body as a JSON object (empty when there is no body)."""
+        if not self.body:
+            return {}
+        try:
+            data = json.loads(self.body)
+        except ValueError:
+            raise ValidationError("Request body is not valid JSON")
+        if not isinstance(data, dict):
+            raise ValidationError("Request body must be a JSON object")
+        return data
+
+
+class BadRequest(Exception):
+    """The request could not be parsed; the connection is closed after replying."""
+
+
+Handler = Callable[..., Tuple[int, Any]]
+
+
+class ApiServer:
+    """Local HTTP/JSON API over UniversityService, built on asyncio streams.
+
+    Connections are kept alive between requests. Every service call runs
+    on the single database I/O thread, so all requests share one Database
+    and its in-memory cache without locking.
+
+    Student and report bodies come from a PayloadCache and carry strong
+    ETags; a GET whose If-None-Match still matches is answered with 304.
+
+    Changes are group-committed: write requests run in a database
+    session that the next flush ends, and each is answered once that
+    flush has reached disk, so concurrent writers share one file rewrite.
+    The session holds the cross-process write lock only until then.
+    """
+
+    def __init__(self, service: UniversityService = None, host: str = "127.0.0.1",
+                 port: int = 8000, keep_alive_timeout: float = 15.0):
+        """Initialize with the service to expose and the address to listen on."""
+        self.service = service or UniversityService()
+        self.async_database = AsyncDatabase(self.service.database)
+        self.payloads = PayloadCache(self.service)
+        self.host = host
+        self.port = port
+        self.keep_alive_timeout = keep_alive_timeout
+        self.requests_served = 0
+        self._server: Optional[asyncio.AbstractServer] = None
+        # Session collecting the writes that the next flush commits
+        self._session = None
+        self._commit: Optional[asyncio.Future] = None
+        self.routes: List[Tuple[str, Pattern, Handler]] = []
+
+        self.route("POST", r"/students", self.register)
+        self.route("GET", r"/students", self.list_students)
+        self.route("POST", r"/login", self.login)
+        self.route("GET", r"/students/(?P<student_id>\d+)", self.get_student)
+        self.route("DELETE", r"/students/(?P<student_id>\d+)", self.remove_student)
+        self.route("GET", r"/students/(?P<student_id>\d+)/standing", self.standing)
+        self.route("POST", r"/students/(?P<student_id>\d+)/subjects", self.enrol)
+        self.route("DELETE", r"/students/(?P<student_id>\d+)/subjects/(?P<subject_id>\d+)",
+                   self.remove_subject)
+        self.route("GET", r"/reports/groups", self.group_report)
+        self.route("GET", r"/reports/partition", self.partition_report)
+        self.route("GET", r"/reports/summary", self.summary)
+        self.route("GET", r"/reports/subjects/(?P<subject_id>\d+)", self.subject_report)
+
+    def route(self, method: str, pattern: str, handler: Handler):
+        """Register a handler for a method and a full-path regex."""
+        self.routes.append((method, re.compile(pattern + "$"), handler))
+
+    # Handlers run on the database thread and return (status, JSON payload)
+
+    def register(self, request: Request):
+        data = request.json()
+        student = self.service.register(
+            data.get("name", ""), data.get("email", ""), data.get("password", "")
+        )
+        return HTTPStatus.CREATED, student_data(student)
+
+    def login(self, request: Request):
+        data = request.json()
+        student = self.service.login(data.get("email", ""), data.get("password", ""))
+        return HTTPStatus.OK, student_data(student)
+
+    def list_students(self, request: Request):
+        if "q" in request.query:
+            students = self.service.query(request.query["q"])
+        else:
+            students = self.service.list_students()
+        return HTTPStatus.OK, [student_data(s) for s in students]
+
+    def get_student(self, request: Request, student_id: str):
+        return HTTPStatus.OK, self.payloads.student(student_id)
+
+    def remove_student(self, request: Request, student_id: str):
+        if_match = request.headers.get("if-match")
+        if if_match and not self.payloads.student(student_id).matches(if_match, weak=False):
+            return HTTPStatus.PRECONDITION_FAILED, {"error": f"Student {student_id} has changed"}
+        self.service.remove_student(student_id)
+        return HTTPStatus.NO_CONTENT, None
+
+    def standing(self, request: Request, student_id: str):
+        return HTTPStatus.OK, self.service.standing(student_id)._asdict()
+
+    def enrol(self, request: Request, student_id: str):
+        student, subject = self.service.enrol(student_id)
+        return HTTPStatus.CREATED, {
+            "student": student_data(student),
+            "subject": {"id": subject.id, "mark": subject.mark, "grade": subject.grade},
+        }
+
+    def remove_subject(self, request: Request, student_id: str, subject_id: str):
+        return HTTPStatus.OK, student_data(self.service.remove_subject(student_id, subject_id))
+
+    def group_report(self, request: Request):
+        return HTTPStatus.OK, self.payloads.report("groups")
+
+    def partition_report(self, request: Request):
+        return HTTPStatus.OK, self.payloads.report("partition")
+
+    def summary(self, request: Request):
+        return HTTPStatus.OK, self.payloads.report("summary")
+
+    def subject_report(self, request: Request, subject_id: str):
+        return HTTPStatus.OK, self.service.subject_report(subject_id).to_dict()
+
+    # Protocol
+
+    def _dispatch(self, request: Request) -> Tuple[int, Any]:
+        """Find and run the handler for a request (on the database thread)."""
+        path_matched = False
+        for method, pattern, handler in self.routes:
+            match = pattern.match(request.path)
+            if match is None:
+                continue
+            if method != request.method:
+                path_matched = True
+                continue
+            try:
+                status, payload = handler(request, **match.groupdict())
+            except ServiceError as e:
+                status = next(
+                    (s for cls, s in ERROR_STATUS.items() if isinstance(e, cls)),
+                    HTTPStatus.BAD_REQUEST,
+                )
+                return status, {"error": str(e)}
+            except Exception:
+                # Log the failure, keep its details from the client and
+                # keep serving others
+                traceback.print_exc()
+                return HTTPStatus.INTERNAL_SERVER_ERROR, {"error": "Internal server error"}
+            if isinstance(payload, Payload) and payload.matches(request.headers.get("if-none-match")):
+                return HTTPStatus.NOT_MODIFIED, payload
+            return status, payload
+        if path_matched:
+            return HTTPStatus.METHOD_NOT_ALLOWED, {"error": "Method not allowed"}
+        return HTTPStatus.NOT_FOUND, {"error": "Not found"}
+
+    def _dispatch_write(self, request: Request) -> Tuple[int, Any]:
+        """Run a changing request inside the session of the next commit."""
+        if self._session is None:
+            self._session = self.service.database.session()
+            self._session.__enter__()
+        return self._dispatch(request)
+
+    def _end_session(self):
+        """Write the open session's changes and release the write lock."""
+        session, self._session = self._session, None
+        if session is not None:
+            session.__exit__(None, None, None)
+
+    async def _read_request(self, reader: asyncio.StreamReader) -> Optional[Request]:
+        """Read one request, or return None when the client closed the connection."""
+        line = await reader.readline()
+        if not line:
+            return None
+        try:
+            method, target, version = line.decode("latin-1").split()
+        except ValueError:
+            raise BadRequest("Malformed request line")
+
+        headers: Dict[str, str] = {}
+        while True:
+            line = await reader.readline()
+            if line in (b"\r\n", b"\n"):
+                break
+            if not line:
+                return None
+            name, sep, value = line.decode("latin-1").partition(":")
+            if not sep:
+                raise BadRequest("Malformed header")
+            headers[name.strip().lower()] = value.strip()
+
+        try:
+            length = int(headers.get("content-length", 0))
+        except ValueError:
+            raise BadRequest("Invalid Content-Length")
+        if length < 0 or length > MAX_BODY:
+            raise BadRequest("Request body too large")
+        body = await reader.readexactly(length) if length else b""
+        return Request(method.upper(), target, version, headers, body)
+
+    @staticmethod
+    def _encode_response(status: int, payload: Any, keep_alive: bool) -> bytes:
+        status = HTTPStatus(status)
+        if isinstance(payload, Payload):
+            # 304 repeats the ETag but never carries a body
+            body = b"" if status == HTTPStatus.NOT_MODIFIED else payload.body
+        else:
+            body = b"" if payload is None else json.dumps(payload).encode()
+        head = [
+            f"HTTP/1.1 {status.value} {status.phrase}",
+            f"Content-Length: {len(body)}",
+            "Connection: keep-alive" if keep_alive else "Connection: close",
+        ]
+        if isinstance(payload, Payload):
+            head.append(f"ETag: {payload.etag}")
+        if body:
+            head.append("Content-Type: application/json")
+        return ("\r\n".join(head) + "\r\n\r\n").encode("latin-1") + body
+
+    async def handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """Serve requests on one connection until it closes or goes idle."""
+        try:
+            while True:
+                try:
+                    request = await asyncio.wait_for(
+                        self._read_request(reader), self.keep_alive_timeout
+                    )
+                except BadRequest as e:
+                    writer.write(self._encode_response(HTTPStatus.BAD_REQUEST, {"error": str(e)}, False))
+                    await writer.drain()
+                    break
+                if request is None:
+                    break
+
+                if request.method == "GET":
+                    status, payload = await self.async_database.run(self._dispatch, request)
+                else:
+                    status, payload = await self.async_database.run(self._dispatch_write, request)
+                    try:
+                        await self._committed()
+                    except Exception:
+                        # The change never reached disk; say so instead of
+                        # dropping the connection
+                        traceback.print_exc()
+                        status, payload = (
+                            HTTPStatus.INTERNAL_SERVER_ERROR, {"error": "Internal server error"}
+                        )
+                self.requests_served += 1
+                writer.write(self._encode_response(status, payload, request.keep_alive))
+                await writer.drain()
+                if not request.keep_alive:
+                    break
+        except (asyncio.TimeoutError, asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    async def _committed(self):
+        """Wait until every change made so far is written to disk."""
+        if self._commit is None:
+            self._commit = asyncio.ensure_future(self._flush())
+        await asyncio.shield(self._commit)
+
+    async def _flush(self):
+        # The I/O thread runs jobs in order, so the flush covers every
+        # request handled before it; later writers wait for the next one
+        flushed = asyncio.get_running_loop().run_in_executor(
+            self.async_database.executor, self._end_session
+        )
+        self._commit = None
+        await flushed
+
+    async def start(self):
+        """Start listening; returns once the socket is bound."""
+        self._server = await asyncio.start_server(
+            self.handle_connection, self.host, self.port, backlog=1024
+        )
+        # Port 0 asks the OS for a free port; report the real one
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    async def serve_forever(self):
+        """Start (if needed) and serve until cancelled."""
+        if self._server is None:
+            await self.start()
+        async with self._server:
+            await self._server.serve_forever()
+
+    async def close(self):
+        """Stop accepting connections and release the database thread."""
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+        await self.async_database.run(self._end_session)
+        self.async_database.shutdown()
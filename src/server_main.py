@@ -0,0 +1,48 @@
+import argparse
+import asyncio
+import sys
+
+from src.cli_main import setup_environment
+from src.core.paths import DATA_PATH_ENV, resolve_data_path
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    """Parse command line options."""
+    parser = argparse.ArgumentParser(prog="python -m src.server_main",
+                                     description="University application (local HTTP/JSON API)")
+    parser.add_argument("--host", default="127.0.0.1", help="address to listen on (default: 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=8000, help="port to listen on (default: 8000)")
+    parser.add_argument("--data", metavar="PATH",
+                        help=f"student data file (default: ${DATA_PATH_ENV} or students.data in the project root)")
+    return parser.parse_args(argv)
+
+
+async def serve(host: str, port: int, data_path: str):
+    """Run the API server until interrupted."""
+    from src.models.database import Database
+    from src.server.http_server import ApiServer
+    from src.services.university_service import UniversityService
+
+    server = ApiServer(UniversityService(Database(data_path)), host, port)
+    await server.start()
+    print(f"Serving on http://{server.host}:{server.port} (data: {data_path})")
+    try:
+        await server.serve_forever()
+    finally:
+        await server.close()
+
+
+def main(argv=None):
+    """Main entry point for the API server."""
+    args = parse_args(argv)
+    setup_environment()
+    data_path = resolve_data_path(args.data)
+    try:
+        asyncio.run(serve(args.host, args.port, data_path))
+    except KeyboardInterrupt:
+        print("\nServer stopped.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,23 @@
+"""Headless application services shared by every front end."""
+
+from .payloads import Payload, PayloadCache, student_data
+from .university_service import (
+    AuthenticationError,
+    ConflictError,
+    NotFoundError,
+    ServiceError,
+    UniversityService,
+    ValidationError,
+)
+
+__all__ = [
+    "UniversityService",
+    "ServiceError",
+    "ValidationError",
+    "AuthenticationError",
+    "NotFoundError",
+    "ConflictError",
+    "Payload",
+    "PayloadCache",
+    "student_data",
+]
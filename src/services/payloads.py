@@ -0,0 +1,134 @@
+import json
+import zlib
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, NamedTuple, Tuple
+
+from src.core.constants import PAYLOAD_CACHE_SIZE
+from src.models.student import Student
+from src.services.university_service import NotFoundError, UniversityService
+
+
+def student_data(student) -> Dict[str, Any]:
+    """Plain-data form of a student for structured output (no password)."""
+    return {
+        "id": student.id,
+        "name": student.name,
+        "email": student.email,
+        "average": round(student.get_average_mark(), 2),
+        "passing": student.is_passing(),
+        "subjects": [
+            {"id": s.id, "mark": s.mark, "grade": s.grade} for s in student.subjects
+        ],
+    }
+
+
+class Payload(NamedTuple):
+    """A serialised JSON body and its strong ETag."""
+
+    etag: str
+    body: bytes
+
+    def matches(self, header: str, weak: bool = True) -> bool:
+        """Check an If-None-Match (weak) or If-Match (strong) header value against this payload."""
+        if not header:
+            return False
+        tags = [tag.strip() for tag in header.split(",")]
+        if weak:
+            # If-None-Match uses the weak comparison, so W/"x" matches "x"
+            tags = [tag[2:] if tag.startswith("W/") else tag for tag in tags]
+        return "*" in tags or self.etag in tags
+
+
+def encode(data: Any, tag: str) -> Payload:
+    """Serialise data to JSON with an ETag that changes whenever the bytes do."""
+    body = json.dumps(data).encode()
+    return Payload(f'"{tag}-{zlib.crc32(body):08x}"', body)
+
+
+def group_data(service: UniversityService) -> Dict[str, List[dict]]:
+    groups: Dict[str, List[dict]] = {}
+    for grade, student in service.group_report():
+        groups.setdefault(grade, []).append(student_data(student))
+    return groups
+
+
+def partition_data(service: UniversityService) -> Dict[str, List[dict]]:
+    partition: Dict[str, List[dict]] = {"passing": [], "failing": []}
+    for passing, student in service.partition_report():
+        partition["passing" if passing else "failing"].append(student_data(student))
+    return partition
+
+
+def summary_data(service: UniversityService) -> dict:
+    return service.summary().to_dict()
+
+
+class PayloadCache:
+    """Serialised JSON for students and reports, reused until the data changes.
+
+    A student's body is tagged with its ID and record version and reused
+    while the database still holds the same record; report bodies are
+    reused while the database generation is unchanged. A hit skips
+    building Student objects and json.dumps entirely.
+
+    Not thread-safe: use it from the thread that owns the database.
+    """
+
+    REPORTS: Dict[str, Callable[[UniversityService], Any]] = {
+        "groups": group_data,
+        "partition": partition_data,
+        "summary": summary_data,
+    }
+
+    def __init__(self, service: UniversityService = None, max_students: int = PAYLOAD_CACHE_SIZE):
+        """Initialize with the service to read from and the number of students to keep."""
+        self.service = service or UniversityService()
+        self.max_students = max_students
+        # student ID -> (stored record, payload), least recently used first
+        self._students: "OrderedDict[str, Tuple[dict, Payload]]" = OrderedDict()
+        # report name -> (database generation, payload)
+        self._reports: Dict[str, Tuple[int, Payload]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def student(self, student_id: str) -> Payload:
+        """Serialised student_data for one student."""
+        record = self.service.get_record(student_id)
+        cached = self._students.get(student_id)
+        # The database replaces a record on every change, so the same
+        # object means the same contents
+        if cached is not None and cached[0] is record:
+            self._students.move_to_end(student_id)
+            self.hits += 1
+            return cached[1]
+
+        self.misses += 1
+        payload = encode(
+            student_data(Student.from_dict(record)),
+            f"{record['id']}.{record.get('version', 0)}",
+        )
+        self._students[student_id] = (record, payload)
+        self._students.move_to_end(student_id)
+        if len(self._students) > self.max_students:
+            self._students.popitem(last=False)
+        return payload
+
+    def report(self, name: str) -> Payload:
+        """Serialised report by name: groups, partition or summary."""
+        if name not in self.REPORTS:
+            raise NotFoundError(f"Unknown report {name}")
+        generation = self.service.database.generation()
+        cached = self._reports.get(name)
+        if cached is not None and cached[0] == generation:
+            self.hits += 1
+            return cached[1]
+
+        self.misses += 1
+        payload = encode(self.REPORTS[name](self.service), name)
+        self._reports[name] = (generation, payload)
+        return payload
+
+    def clear(self):
+        """Drop every cached body."""
+        self._students.clear()
+        self._reports.clear()
@@ -0,0 +1,241 @@
+from typing import Iterator, List, Tuple
+
+from src.core.constants import (
+    EMAIL_PATTERN,
+    IN_MEMORY_ROSTER_LIMIT,
+    PASSWORD_PATTERN,
+    REPORT_WORKERS,
+    SORT_MEMORY_BUDGET,
+)
+from src.core.jobs import Job
+from src.models import external_sort
+from src.models.database import Database, StaleRecordError
+from src.models.ids import allocate_subject_id
+from src.models.indexes import record_average
+from src.models.leaderboard import Standing
+from src.models.parallel_report import ParallelReportExecutor
+from src.models.query import QueryEngine, parse_query
+from src.models.reports import RosterReport, SubjectReport
+from src.models.student import Student
+from src.models.subject import Subject, grade_for_mark
+from src.models.summary import Summary
+
+INVALID_EMAIL = "Invalid email format. Must end with @university.com"
+INVALID_PASSWORD = (
+    "Invalid password format. Must start with uppercase, "
+    "contain at least 5 letters followed by 3+ digits"
+)
+
+
+class ServiceError(Exception):
+    """A request the service could not carry out; the message is user-facing."""
+
+
+class ValidationError(ServiceError):
+    """Input was missing or malformed."""
+
+
+class AuthenticationError(ServiceError):
+    """Credentials did not match a student."""
+
+
+class NotFoundError(ServiceError):
+    """The student, subject or report does not exist."""
+
+
+class ConflictError(ServiceError):
+    """The change clashes with stored data."""
+
+
+class UniversityService:
+    """Student and admin operations without any user interaction.
+
+    Every method takes plain arguments and either returns its result or
+    raises a ServiceError, so the CLI, the Flet views and batch mode can
+    share one code path.
+    """
+
+    def __init__(self, database: Database = None):
+        """Initialize with the database to work on."""
+        self.database = database or Database()
+        self.query_engine = QueryEngine(self.database)
+        self.in_memory_limit = IN_MEMORY_ROSTER_LIMIT
+        self.memory_budget = SORT_MEMORY_BUDGET
+        self.report_workers = REPORT_WORKERS
+
+    # Students
+
+    def register(self, name: str, email: str, password: str) -> Student:
+        """Create a student account."""
+        if not all([name, email, password]):
+            raise ValidationError("All fields are required!")
+        if not EMAIL_PATTERN.match(email):
+            raise ValidationError(INVALID_EMAIL)
+        if not PASSWORD_PATTERN.match(password):
+            raise ValidationError(INVALID_PASSWORD)
+
+        student = Student(name=name, email=email, password=password)
+        if not self.database.add_student(student):
+            raise ConflictError("Student already exists!")
+        return student
+
+    def login(self, email: str, password: str) -> Student:
+        """Return the student with these credentials."""
+        student = self.database.get_student_by_email(email)
+        if student is None or student.password != password:
+            raise AuthenticationError("Invalid credentials!")
+        return student
+
+    def get_record(self, student_id: str) -> dict:
+        """Return a student's stored record by ID; treat it as read-only."""
+        record = self.database.get_record(student_id)
+        if record is None:
+            raise NotFoundError(f"Student {student_id} not found!")
+        return record
+
+    def get_student(self, student_id: str) -> Student:
+        """Return a student by ID."""
+        return Student.from_dict(self.get_record(student_id))
+
+    def save(self, student: Student):
+        """Store changes to a student loaded earlier.
+
+        Raises ConflictError if the student was changed elsewhere since it
+        was loaded, rather than overwriting that change.
+        """
+        try:
+            saved = self.database.update_student(student)
+        except StaleRecordError:
+            raise ConflictError(
+                f"Student {student.id} was changed elsewhere; reload and try again"
+            )
+        if not saved:
+            raise NotFoundError(f"Student {student.id} not found!")
+
+    # Each change loads, edits and saves under the database lock, so
+    # threads in this process never conflict with one another
+
+    def enrol(self, student_id: str) -> Tuple[Student, Subject]:
+        """Enrol a student in a new random subject.
+
+        Returns the updated student and the new subject.
+        """
+        with self.database.lock:
+            student = self.get_student(student_id)
+            subject = Subject(allocate_subject_id({s.id for s in student.subjects}))
+            if not student.enrol_subject(subject):
+                raise ConflictError(f"Maximum subjects ({Student.MAX_SUBJECTS}) already enrolled!")
+            self.save(student)
+        return student, subject
+
+    def remove_subject(self, student_id: str, subject_id: str) -> Student:
+        """Drop one of a student's subjects and return the updated student."""
+        with self.database.lock:
+            student = self.get_student(student_id)
+            if not student.remove_subject(subject_id):
+                raise NotFoundError(f"Subject {subject_id} not found!")
+            self.save(student)
+        return student
+
+    def change_password(self, student_id: str, password: str) -> Student:
+        """Set a new password and return the updated student."""
+        if not PASSWORD_PATTERN.match(password or ""):
+            raise ValidationError(INVALID_PASSWORD)
+        with self.database.lock:
+            student = self.get_student(student_id)
+            student.password = password
+            self.save(student)
+        return student
+
+    def standing(self, student_id: str) -> Standing:
+        """Rank and percentile of a student's average mark."""
+        return self.database.get_standing(self.get_student(student_id))
+
+    # Admin
+
+    def list_students(self, job: Job = None) -> List[Student]:
+        """Every student in file order, reporting progress to a job if given."""
+        snapshot = self.database.snapshot()
+        if job is None:
+            return list(snapshot.students())
+        return list(job.track(snapshot.students(), len(snapshot)))
+
+    def remove_student(self, student_id: str, version: int = None):
+        """Delete a student, only if still at the given version when one is given."""
+        try:
+            removed = self.database.remove_student(student_id, version)
+        except StaleRecordError:
+            raise ConflictError(f"Student {student_id} was changed elsewhere; reload and try again")
+        if not removed:
+            raise NotFoundError(f"Student {student_id} not found!")
+
+    def clear(self):
+        """Delete every student."""
+        self.database.clear_all()
+
+    def query(self, expression: str) -> List[Student]:
+        """Students matching a filter such as ``avg>=85, subject=123``."""
+        try:
+            predicates = parse_query(expression)
+        except ValueError as e:
+            raise ValidationError(str(e))
+        return self.query_engine.find(*predicates)
+
+    def _use_external_sort(self) -> bool:
+        """Check whether the roster is too large to sort in memory."""
+        return self.database.read_summary().count > self.in_memory_limit
+
+    def _iter_best_first(self, job: Job = None) -> Iterator[dict]:
+        """Stream records best average first, file order within ties.
+
+        Small rosters come straight off a snapshot's average index. Larger
+        ones are streamed from the data file through the external sort
+        without being loaded; the file is replaced on every write, never
+        rewritten in place, so the open file is a consistent version too.
+        Either way the stream is a point-in-time view however long it runs,
+        and writers are never held up by it.
+
+        A job gets progress reports, and can cancel, while the records are
+        sorted, which is done by the time the first one comes out. The
+        records themselves are not tracked, so the caller may read them at
+        its own pace and on another thread.
+        """
+        if self._use_external_sort():
+            records = self.database.iter_records()
+            if job is not None:
+                records = job.track(records, self.database.read_summary().count)
+            return external_sort.sort_by_average(records, self.memory_budget)
+        snapshot = self.database.snapshot()
+        if job is not None:
+            # The average index is already sorted
+            job.report(len(snapshot), len(snapshot))
+        return snapshot.iter_by_average()
+
+    def group_report(self, job: Job = None) -> Iterator[Tuple[str, Student]]:
+        """Stream (grade, student) pairs: each grade's students follow one another, HD first."""
+        for record in self._iter_best_first(job):
+            yield grade_for_mark(record_average(record)), Student.from_dict(record)
+
+    def partition_report(self, job: Job = None) -> Iterator[Tuple[bool, Student]]:
+        """Stream (is_passing, student) pairs, passing students first."""
+        for record in self._iter_best_first(job):
+            yield record_average(record) >= 50, Student.from_dict(record)
+
+    def subject_report(self, subject_id: str) -> SubjectReport:
+        """Statistics for the students enrolled in a subject."""
+        roster = self.database.get_subject_roster(subject_id)
+        if not roster:
+            raise NotFoundError(f"No students enrolled in subject {subject_id}")
+        return SubjectReport.from_roster(subject_id, roster)
+
+    def roster_report(self) -> RosterReport:
+        """Grade and pass/fail totals, built across worker processes."""
+        return ParallelReportExecutor(self.report_workers).run(self.database)
+
+    def summary(self) -> Summary:
+        """Headline numbers from the summary sidecar."""
+        return self.database.read_summary()
+
+    def verify_summary(self) -> Tuple[Summary, bool]:
+        """Recompute the summary and repair the sidecar if it was stale."""
+        return self.database.verify_summary()
@@ -0,0 +1,116 @@
+from collections import deque
+from typing import Any, Dict, Iterator, List, Tuple
+
+from src.core.jobs import JobCancelledError
+from src.services.payloads import student_data
+from src.views.base_view import BaseView
+
+
+class BatchView(BaseView):
+    """Headless view for scripted commands.
+
+    Prompts are answered from the command's arguments instead of the
+    keyboard, and everything a controller displays is recorded as data
+    for the command's result.
+    """
+
+    def __init__(self):
+        self._inputs: deque = deque()
+        self.messages: List[str] = []
+        self.errors: List[str] = []
+        self.data: Dict[str, Any] = {}
+
+    def begin(self, inputs: List[str] = ()):
+        """Start recording a new command, answering prompts with inputs."""
+        self._inputs = deque(inputs)
+        self.messages = []
+        self.errors = []
+        self.data = {}
+
+    def result(self) -> Dict[str, Any]:
+        """Everything recorded since begin()."""
+        return {
+            "ok": not self.errors,
+            "messages": self.messages,
+            "errors": self.errors,
+            "data": self.data,
+        }
+
+    def display(self, data: Any = None):
+        pass
+
+    def display_error(self, message: str):
+        self.errors.append(message)
+
+    def display_success(self, message: str):
+        self.messages.append(message)
+
+    def get_input(self, prompt: str) -> str:
+        """Next command argument, or an empty answer once they run out."""
+        return self._inputs.popleft() if self._inputs else ""
+
+    def confirm_action(self, message: str) -> bool:
+        """Scripted commands are deliberate, so confirmations are accepted."""
+        return True
+
+    # Student views
+
+    def display_registration_form(self) -> Dict[str, str]:
+        return {
+            "name": self.get_input("Enter name"),
+            "email": self.get_input("Enter email"),
+            "password": self.get_input("Enter password"),
+        }
+
+    def display_login_form(self) -> Dict[str, str]:
+        return {
+            "email": self.get_input("Enter email"),
+            "password": self.get_input("Enter password"),
+        }
+
+    def display_student_details(self, student):
+        self.data["student"] = student_data(student)
+
+    def display_subjects(self, student):
+        self.data["student"] = student_data(student)
+
+    def display_enrolment_result(self, subject):
+        self.data["subject"] = {"id": subject.id, "mark": subject.mark, "grade": subject.grade}
+
+    def display_standing(self, standing):
+        self.data["standing"] = standing._asdict()
+
+    # Admin views
+
+    def display_all_students(self, students: List[Any]):
+        self.data["students"] = [student_data(s) for s in students]
+
+    def display_grade_group_stream(self, stream: Iterator[Tuple[str, Any]]):
+        groups: Dict[str, List[Dict[str, Any]]] = {}
+        for grade, student in stream:
+            groups.setdefault(grade, []).append(student_data(student))
+        self.data["groups"] = groups
+
+    def display_partition_stream(self, stream: Iterator[Tuple[bool, Any]]):
+        passing, failing = [], []
+        for is_passing, student in stream:
+            (passing if is_passing else failing).append(student_data(student))
+        self.data["passing"] = passing
+        self.data["failing"] = failing
+
+    def display_roster_report(self, report):
+        self.data["report"] = report.to_dict()
+
+    def display_summary(self, summary):
+        self.data["summary"] = summary.to_dict()
+
+    def display_subject_report(self, report):
+        self.data["report"] = report.to_dict()
+
+    def wait_for_job(self, job):
+        """Block until the job ends; there is no progress display."""
+        try:
+            return job.result()
+        except JobCancelledError as e:
+            self.display_error(str(e))
+            return None
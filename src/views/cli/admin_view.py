@@ -1,47 +1,66 @@
-from typing import List, Dict, Any
+import sys
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import Any, Iterator, List, Tuple
+
+from .renderer import ScreenWriter
 from ..base_view import BaseView
+from ...core.jobs import Job, JobCancelledError
 
 
 class AdminCliView(BaseView):
     """CLI view for admin-related operations."""
 
+    def __init__(self, page_size: int = None):
+        """Initialize with the number of lines per page for long listings."""
+        self.writer = ScreenWriter(page_size=page_size)
+
     def display(self, data: Any = None):
         print("\nAdmin System")
         print("-" * 50)
+        print("(a) aggregate report: Grade and pass/fail totals")
         print("(c) clear database: Clear all data")
+        print("(d) dashboard: Show summary numbers")
         print("(g) group students: Group by grade")
         print("(p) partition students: Partition PASS/FAIL")
+        print("(q) query students: Filter by average, subject, grade or name")
         print("(r) remove student: Remove by ID")
         print("(s) show: Show all students")
+        print("(t) subject report: Statistics for one subject")
+        print("(v) verify summary: Recompute summary from data")
         print("(x) exit")
         print("-" * 50)
 
     def _format_header(self, title: str):
         """Format a section header."""
-        print(f"\n{title}")
-        print("=" * 50)
+        self.writer.write(f"\n{title}")
+        self.writer.write("=" * 50)
+
+    def _section(self, title: str):
+        self.writer.write(f"\n{title}")
+        self.writer.write("-" * 50)
 
     def _display_student_info(self, student):
         """Display student information in a formatted way."""
+        write = self.writer.write
         # Basic information
-        print(f"Student ID: {student.id}")
-        print(f"Name: {student.name}")
-        print(f"Email: {student.email}")
+        write(f"Student ID: {student.id}")
+        write(f"Name: {student.name}")
+        write(f"Email: {student.email}")
 
         # Subject information
         if student.subjects:
-            print("\nEnrolled Subjects:")
-            print("-" * 20)
+            write("\nEnrolled Subjects:")
+            write("-" * 20)
             for subject in student.subjects:
-                print(f"Subject {subject.id}")
-                print(f"  Mark: {subject.mark:.1f}")
-                print(f"  Grade: {subject.grade}")
-            print("-" * 20)
-            print(f"Average Mark: {student.get_average_mark():.1f}")
-            print(f"Overall Status: {'PASS' if student.is_passing() else 'FAIL'}")
+                write(f"Subject {subject.id}")
+                write(f"  Mark: {subject.mark:.1f}")
+                write(f"  Grade: {subject.grade}")
+            write("-" * 20)
+            write(f"Average Mark: {student.get_average_mark():.1f}")
+            write(f"Overall Status: {'PASS' if student.is_passing() else 'FAIL'}")
         else:
-            print("\nNo subjects enrolled")
-        print("\n" + "-" * 50)
+            write("\nNo subjects enrolled")
+        write("\n" + "-" * 50)
 
     def display_all_students(self, students: List[Any]):
         """Display all students in the system."""
@@ -49,47 +68,138 @@ class AdminCliView(BaseView):
             print("\nNo students found.")
             return
 
+        self.writer.begin()
         self._format_header("All Students")
         for student in students:
             self._display_student_info(student)
+        self.writer.flush()
 
-    def display_grade_groups(self, groups: Dict[str, List[Any]]):
-        """Display students grouped by grade."""
-        if not groups:
-            print("\nNo students found.")
-            return
-
+    def display_grade_group_stream(self, stream: Iterator[Tuple[str, Any]]):
+        """Display grade groups as they arrive, best grade first; Ctrl+C stops the listing."""
+        self.writer.begin()
         self._format_header("Students Grouped by Average Grade")
-
-        # Display groups in specific order
-        grade_order = ['HD', 'D', 'C', 'P', 'Z']
-        for grade in grade_order:
-            if grade in groups and groups[grade]:
-                print(f"\nGrade {grade} Students:")
-                print("-" * 50)
-
-                for student in groups[grade]:
-                    self._display_student_info(student)
-
-    def display_partitioned_students(self, passing: List[Any], failing: List[Any]):
-        """Display students partitioned by pass/fail status."""
-        self._format_header("Student Pass/Fail Partition")
-
-        if passing:
-            print("\nPassing Students:")
-            print("-" * 50)
-            for student in passing:
+        current = None
+        try:
+            for grade, student in stream:
+                if grade != current:
+                    current = grade
+                    self._section(f"Grade {grade} Students:")
+                    # Show each section as soon as it starts
+                    self.writer.flush()
                 self._display_student_info(student)
-        else:
-            print("\nNo passing students.")
+        except KeyboardInterrupt:
+            self.writer.write("\nListing stopped.")
+            self.writer.flush()
+            return
+        if current is None:
+            self.writer.write("\nNo students found.")
+        self.writer.flush()
 
-        if failing:
-            print("\nFailing Students:")
-            print("-" * 50)
-            for student in failing:
+    def display_partition_stream(self, stream: Iterator[Tuple[bool, Any]]):
+        """Display the pass/fail partition as it arrives, passing first; Ctrl+C stops the listing."""
+        self.writer.begin()
+        self._format_header("Student Pass/Fail Partition")
+        seen_passing = seen_failing = False
+        try:
+            for passing, student in stream:
+                if passing and not seen_passing:
+                    seen_passing = True
+                    self._section("Passing Students:")
+                    self.writer.flush()
+                elif not passing and not seen_failing:
+                    if not seen_passing:
+                        self.writer.write("\nNo passing students.")
+                    seen_failing = True
+                    self._section("Failing Students:")
+                    self.writer.flush()
                 self._display_student_info(student)
+        except KeyboardInterrupt:
+            self.writer.write("\nListing stopped.")
+            self.writer.flush()
+            return
+        if not seen_passing and not seen_failing:
+            self.writer.write("\nNo passing students.")
+        if not seen_failing:
+            self.writer.write("\nNo failing students.")
+        self.writer.flush()
+
+    def display_roster_report(self, report, top: int = 10):
+        """Display grade bucket totals with the best students in each."""
+        write = self.writer.write
+        self.writer.begin()
+        self._format_header("Roster Report")
+        write(f"Students: {report.count}")
+        write(f"Passing: {report.passing}")
+        write(f"Failing: {report.failing}")
+        for grade, students in report.groups.items():
+            write(f"\nGrade {grade}: {report.grade_counts[grade]} students")
+            for student_id, average in students[:top]:
+                write(f"  {student_id:<10}{average:>6.1f}")
+            if len(students) > top:
+                write(f"  ... {len(students) - top} more")
+        self.writer.flush()
+
+    def display_summary(self, summary):
+        """Display headline roster numbers."""
+        write = self.writer.write
+        self.writer.begin()
+        self._format_header("Dashboard")
+        write(f"Students: {summary.count}")
+        write(f"Pass Rate: {summary.pass_rate:.1f}%")
+        write(f"Mean Average: {summary.mean_average:.1f}")
+        write("Grade Distribution:")
+        for grade, count in summary.grade_distribution.items():
+            write(f"  {grade:<3} {count}")
+        self.writer.flush()
+
+    def display_subject_report(self, report):
+        """Display per-subject statistics and roster."""
+        write = self.writer.write
+        self.writer.begin()
+        self._format_header(f"Subject {report.subject_id} Report")
+        write(f"Enrolled: {report.count}")
+        write(f"Mean Mark: {report.mean:.1f}")
+        write(f"Median Mark: {report.median:.1f}")
+        write(f"Std Deviation: {report.std_dev:.1f}")
+        write("\nGrade Distribution:")
+        for grade, count in report.grade_distribution.items():
+            write(f"  {grade:<3} {count}")
+
+        write("\nRoster:")
+        self.writer.table(
+            ["Student ID", "Mark", "Grade"],
+            [(entry.student_id, f"{entry.mark:.1f}", entry.grade) for entry in report.roster],
+            widths=(11, 8, 5),
+            aligns="<><",
+        )
+        self.writer.flush()
+
+    def _display_progress(self, job: Job):
+        """Redraw the progress line for a running job."""
+        if job.fraction is None:
+            line = f"{job.name}: {job.done} records"
         else:
-            print("\nNo failing students.")
+            line = f"{job.name}: {job.done}/{job.total} records ({job.fraction:.0%})"
+        sys.stdout.write(f"\r{line}  ")
+        sys.stdout.flush()
+
+    def wait_for_job(self, job: Job):
+        """Show a progress line until the job ends; Ctrl+C cancels it."""
+        while True:
+            try:
+                result = job.result(timeout=0.1)
+                break
+            except FutureTimeoutError:
+                self._display_progress(job)
+            except KeyboardInterrupt:
+                job.cancel()
+            except JobCancelledError as e:
+                print()
+                self.display_error(str(e))
+                return None
+        self._display_progress(job)
+        print()
+        return result
 
     def display_error(self, message: str):
         """Display error message."""
@@ -1,6 +1,7 @@
 from typing import List, Any
 
 from src.views.base_view import BaseView
+from src.views.cli.renderer import ScreenWriter
 
 
 class BaseCliView(BaseView):
@@ -36,11 +37,8 @@ class BaseCliView(BaseView):
         response = input(f"{message} (y/n): ").strip().lower()
         return response == 'y'
 
-    def display_table(self, headers: List[str], rows: List[List[Any]], widths: List[int]):
-        """Display data in tabular format."""
-        header_format = " ".join("{:<" + str(w) + "}" for w in widths)
-        print(header_format.format(*headers))
-        print("-" * sum(widths))
-        row_format = " ".join("{:<" + str(w) + "}" for w in widths)
-        for row in rows:
-            print(row_format.format(*row))
+    def display_table(self, headers: List[str], rows: List[List[Any]], widths: List[int] = None):
+        """Display data in tabular format, sizing columns from the data unless widths are given."""
+        writer = ScreenWriter()
+        writer.table(headers, rows, widths)
+        writer.flush()
@@ -0,0 +1,95 @@
+import sys
+from functools import lru_cache
+from typing import Any, Callable, Iterable, List, Optional, Sequence, TextIO, Tuple
+
+
+@lru_cache(maxsize=256)
+def row_format(widths: Tuple[int, ...], aligns: str = None) -> Callable[..., str]:
+    """Compiled formatter for a table row, cached per column layout.
+
+    aligns has one of "<", ">" or "^" per column (default: all left).
+    """
+    aligns = aligns or "<" * len(widths)
+    return " ".join(f"{{:{align}{width}}}" for align, width in zip(aligns, widths)).format
+
+
+def auto_widths(headers: Sequence[str], rows: Iterable[Sequence[Any]]) -> Tuple[int, ...]:
+    """Column widths that fit the headers and every cell."""
+    widths = [len(str(h)) for h in headers]
+    for row in rows:
+        for i, cell in enumerate(row):
+            size = len(str(cell))
+            if size > widths[i]:
+                widths[i] = size
+    return tuple(widths)
+
+
+class ScreenWriter:
+    """Buffered line output with optional paging.
+
+    Lines are collected and written in large chunks instead of one
+    syscall per print. When page_size is set and both stdin and stdout
+    are terminals, output pauses every page_size lines, like less.
+    """
+
+    def __init__(self, stream: TextIO = None, page_size: int = None, chunk_lines: int = 1024):
+        """Initialize with the target stream (default stdout) and page size."""
+        self.stream = stream
+        self.page_size = page_size
+        self.chunk_lines = chunk_lines
+        self._buffer: List[str] = []
+        self._page_lines = 0
+        self._quit = False
+
+    @property
+    def _out(self) -> TextIO:
+        return self.stream or sys.stdout
+
+    def _paging(self) -> bool:
+        return bool(self.page_size) and self._out.isatty() and sys.stdin.isatty()
+
+    def begin(self):
+        """Start a new listing: reset the page count and any earlier quit."""
+        self._page_lines = 0
+        self._quit = False
+
+    def write(self, line: str = ""):
+        """Queue one line of output."""
+        if self._quit:
+            return
+        self._buffer.append(line)
+        self._page_lines += 1
+        if self.page_size and self._page_lines >= self.page_size and self._paging():
+            self._pause()
+        elif len(self._buffer) >= self.chunk_lines:
+            self.flush()
+
+    def write_lines(self, lines: Iterable[str]):
+        """Queue several lines of output."""
+        for line in lines:
+            self.write(line)
+
+    def flush(self):
+        """Write every queued line to the stream."""
+        if self._buffer:
+            self._buffer.append("")
+            self._out.write("\n".join(self._buffer))
+            self._buffer.clear()
+        self._out.flush()
+
+    def _pause(self):
+        self.flush()
+        self._page_lines = 0
+        answer = input("-- More -- (Enter to continue, q to stop) ")
+        if answer.strip().lower() == "q":
+            self._quit = True
+
+    def table(self, headers: Sequence[str], rows: Sequence[Sequence[Any]],
+              widths: Optional[Sequence[int]] = None, aligns: str = None):
+        """Queue a table, sizing columns from the data unless widths are given."""
+        widths = tuple(widths) if widths else auto_widths(headers, rows)
+        fmt = row_format(widths, aligns)
+        self.write(row_format(widths)(*headers))
+        self.write("-" * sum(widths))
+        for row in rows:
+            self.write(fmt(*row))
@@ -1,5 +1,6 @@
 from typing import Any
 
+from src.models.leaderboard import Standing
 from src.models.student import Student
 from src.models.subject import Subject
 from src.views.cli.base_cli_view import BaseCliView
@@ -39,3 +40,8 @@ class SubjectCliView(BaseCliView):
         print(f"Successfully enrolled in subject {subject.id}")
         print(f"Mark: {subject.mark:.1f}")
         print(f"Grade: {subject.grade}")
+
+    def display_standing(self, standing: Standing):
+        """Display the student's rank and percentile."""
+        print(f"Rank: {standing.rank} of {standing.total}")
+        print(f"Percentile: {standing.percentile:.1f}")
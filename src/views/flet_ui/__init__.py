@@ -1,10 +1,22 @@
 """Flet UI views for the university application."""
 
-from .app_view import AppView
-from .login_view import LoginView
-from .admin_view import AdminView
-from .student_view import StudentView
-from .subject_view import SubjectView
+import importlib
+
+# Views are imported on first use so startup only loads what it shows
+_VIEW_MODULES = {
+    'AppView': '.app_view',
+    'LoginView': '.login_view',
+    'AdminView': '.admin_view',
+    'StudentView': '.student_view',
+    'SubjectView': '.subject_view',
+}
+
+
+def __getattr__(name):
+    if name in _VIEW_MODULES:
+        return getattr(importlib.import_module(_VIEW_MODULES[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     'AppView',
@@ -12,4 +24,4 @@ __all__ = [
     'AdminView',
     'StudentView',
     'SubjectView'
-]
\ No newline at end of file
+]
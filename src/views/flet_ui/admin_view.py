@@ -1,20 +1,103 @@
+import asyncio
+import itertools
+import threading
+import time
+
 import flet as ft
 from typing import Dict, List, Optional
 
 from ..base_view import BaseView
+from .components import STATUS_STYLES, StudentRenderer, grade_color, mark_color
+from ...core.jobs import Job, JobCancelledError
 from ...controllers.admin_controller import AdminController
+from ...models.events import RosterReset, StudentAdded, StudentRemoved, StudentUpdated
 from ...models.student import Student
 
 
 class AdminView(BaseView):
     """Admin view for managing students and viewing statistics."""
 
+    # Minimum seconds between progress bar redraws
+    PROGRESS_INTERVAL = 0.1
+    # Student table paging
+    PAGE_SIZES = (10, 25, 50, 100)
+    DEFAULT_PAGE_SIZE = 25
+    # Students per page of a grade or pass/fail report dialog
+    REPORT_PAGE_SIZE = 100
+
     def __init__(self, app_view):
         self.app_view = app_view
         self.page = app_view.page
-        self.admin_controller = AdminController(self)
+        self.async_database = app_view.async_database
+        self.admin_controller = AdminController(self, app_view.database)
+
+        # Background job progress
+        self.current_job: Optional[Job] = None
+        self._last_progress_update = 0.0
+        self.progress_bar = ft.ProgressBar(width=400)
+        self.progress_text = ft.Text("")
+        self.progress_row = ft.Row(
+            controls=[
+                self.progress_text,
+                self.progress_bar,
+                ft.TextButton("Cancel", on_click=self._cancel_job),
+            ],
+            alignment=ft.MainAxisAlignment.CENTER,
+            visible=False,
+        )
+
+        # Follow changes made through other views and other processes:
+        # events are queued and applied together on the database I/O thread
+        self._summary_refresh_queued = False
+        self._table_events: List[tuple] = []
+        self._table_events_lock = threading.Lock()
+        app_view.database.events.subscribe(
+            self._on_database_change, StudentAdded, StudentUpdated, StudentRemoved, RosterReset
+        )
+
+        # Memoised student panels and pooled section headers
+        self.renderer = StudentRenderer()
+
+        # Table paging state; only the visible page gets controls. Once a
+        # listing is loaded, change events keep it current
+        self.table_loaded = False
+        self.table_students: List[Student] = []
+        self.row_map: Dict[str, ft.DataRow] = {}
+        self.table_page_index = 0
+        self.table_page_size = self.DEFAULT_PAGE_SIZE
+        self.prev_page_button = ft.IconButton(
+            icon=ft.icons.CHEVRON_LEFT,
+            on_click=lambda _: self._change_table_page(-1),
+        )
+        self.next_page_button = ft.IconButton(
+            icon=ft.icons.CHEVRON_RIGHT,
+            on_click=lambda _: self._change_table_page(1),
+        )
+        self.pager_text = ft.Text("")
+        self.page_size_dropdown = ft.Dropdown(
+            width=100,
+            value=str(self.table_page_size),
+            options=[ft.dropdown.Option(str(size)) for size in self.PAGE_SIZES],
+            on_change=self._change_page_size,
+        )
+        self.pager_row = ft.Row(
+            controls=[
+                self.prev_page_button,
+                self.pager_text,
+                self.next_page_button,
+                ft.Text("Rows per page:"),
+                self.page_size_dropdown,
+            ],
+            alignment=ft.MainAxisAlignment.CENTER,
+            visible=False,
+        )
 
         # Create UI controls
+        self.summary_panel = ft.Row(
+            wrap=True,
+            spacing=10,
+            alignment=ft.MainAxisAlignment.CENTER,
+        )
         self.student_list = ft.DataTable(
             columns=[
                 ft.DataColumn(ft.Text("ID")),
@@ -33,83 +116,93 @@ class AdminView(BaseView):
             rows=[]
         )
 
-    def _get_mark_color(self, mark: float) -> str:
-        """Get color based on mark value."""
-        if mark >= 85:
-            return ft.colors.GREEN
-        elif mark >= 75:
-            return ft.colors.BLUE
-        elif mark >= 65:
-            return ft.colors.ORANGE
-        elif mark >= 50:
-            return ft.colors.ORANGE_700
-        return ft.colors.RED
-
-    def _get_grade_color(self, grade: str) -> str:
-        """Get color based on grade."""
-        grade_colors = {
-            'HD': ft.colors.GREEN,
-            'D': ft.colors.BLUE,
-            'C': ft.colors.ORANGE,
-            'P': ft.colors.ORANGE_700,
-            'Z': ft.colors.RED
-        }
-        return grade_colors.get(grade, ft.colors.BLACK)
+    def _display_progress(self, job: Job):
+        """Show a job's progress; called from the job's worker thread."""
+        now = time.monotonic()
+        if now - self._last_progress_update < self.PROGRESS_INTERVAL and job.done != job.total:
+            return
+        self._last_progress_update = now
+        self.progress_bar.value = job.fraction
+        self.progress_text.value = f"{job.name}: {job.done}/{job.total or '?'} records"
+        self.app_view.update()
+
+    def _cancel_job(self, e):
+        """Cancel the running job at its next progress check."""
+        if self.current_job:
+            self.current_job.cancel()
+
+    async def _run_job(self, name: str, func, *args):
+        """Run an admin operation as a background job with a progress bar.
+
+        Returns the operation's result, or None if it was cancelled.
+        """
+        job = self.admin_controller.job_runner.submit(
+            name, func, *args,
+            timeout=self.admin_controller.job_timeout,
+            on_progress=self._display_progress,
+        )
+        self.current_job = job
+        self.progress_bar.value = None
+        self.progress_text.value = f"{name}..."
+        self.progress_row.visible = True
+        # Show the progress bar before waiting on the job
+        self.app_view.flush()
+        try:
+            return await asyncio.wrap_future(job.future)
+        except JobCancelledError as ex:
+            self.display_error(str(ex))
+            return None
+        finally:
+            self.current_job = None
+            self.progress_row.visible = False
+            self.app_view.update()
 
     def display(self, data=None):
         """Display the admin view."""
 
-        def handle_show_students(e):
-            self.page.show_loading = True
-            self.page.update()
-            try:
-                students = self.admin_controller.database.load_all_students()
+        @self.app_view.batched("Show All Students")
+        async def handle_show_students(e):
+            students = await self._run_job("Show All Students", self.admin_controller.load_students)
+            if students is not None:
                 self.display_all_students(students)
-            finally:
-                self.page.show_loading = False
-                self.page.update()
 
-        def handle_group_students(e):
-            self.page.show_loading = True
-            self.page.update()
-            try:
-                self.admin_controller.group_students()
-            finally:
-                self.page.show_loading = False
-                self.page.update()
+        @self.app_view.batched("Group by Grade")
+        async def handle_group_students(e):
+            stream = await self._run_job("Group by Grade", self.admin_controller.start_grade_groups)
+            if stream is not None:
+                self.display_grade_group_stream(stream)
 
-        def handle_partition_students(e):
-            self.page.show_loading = True
-            self.page.update()
-            try:
-                self.admin_controller.partition_students()
-            finally:
-                self.page.show_loading = False
-                self.page.update()
+        @self.app_view.batched("Partition")
+        async def handle_partition_students(e):
+            stream = await self._run_job("Partition", self.admin_controller.start_partition)
+            if stream is not None:
+                self.display_partition_stream(stream)
 
         def handle_remove_student(e):
-            def handle_remove_confirm(e):
+            @self.app_view.batched("Remove Student")
+            async def handle_remove_confirm(e):
                 nonlocal student_id_field
                 dialog.open = False
-                self.page.update()
+                self.app_view.update()
 
                 student_id = student_id_field.value
                 if student_id:
                     self.page.show_loading = True
-                    self.page.update()
+                    # Show the spinner before waiting on the database
+                    self.app_view.flush()
                     try:
-                        if self.admin_controller.database.remove_student(student_id):
+                        if await self.async_database.remove_student(student_id):
                             self.display_success(f"Student {student_id} removed successfully!")
-                            handle_show_students(None)
+                            await self.async_database.run(self.admin_controller.show_summary)
                         else:
                             self.display_error(f"Student {student_id} not found!")
                     finally:
                         self.page.show_loading = False
-                        self.page.update()
+                        self.app_view.update()
 
             def handle_remove_cancel(e):
                 dialog.open = False
-                self.page.update()
+                self.app_view.update()
 
             student_id_field = ft.TextField(
                 label="Student ID",
@@ -133,29 +226,133 @@ class AdminView(BaseView):
 
             self.page.dialog = dialog
             dialog.open = True
-            self.page.update()
+            self.app_view.update()
+
+        def handle_query_students(e):
+            @self.app_view.batched("Query Students")
+            async def handle_query_confirm(e):
+                dialog.open = False
+                self.app_view.update()
+
+                expression = query_field.value
+                if expression:
+                    self.page.show_loading = True
+                    # Show the spinner before waiting on the database
+                    self.app_view.flush()
+                    try:
+                        await self.async_database.run(
+                            self.admin_controller.query_students, expression
+                        )
+                    finally:
+                        self.page.show_loading = False
+                        self.app_view.update()
+
+            def handle_query_cancel(e):
+                dialog.open = False
+                self.app_view.update()
+
+            query_field = ft.TextField(
+                label="Filter",
+                hint_text="e.g. avg>=85 and name^=Li",
+                width=300
+            )
+
+            dialog = ft.AlertDialog(
+                modal=True,
+                title=ft.Text("Query Students"),
+                content=ft.Column([
+                    ft.Text("Terms: avg>=N, subject=ID, grade=G, name^=PREFIX (joined by 'and')"),
+                    query_field,
+                ], tight=True),
+                actions=[
+                    ft.TextButton("Cancel", on_click=handle_query_cancel),
+                    ft.TextButton("Search", on_click=handle_query_confirm),
+                ],
+                actions_alignment=ft.MainAxisAlignment.END,
+            )
+
+            self.page.dialog = dialog
+            dialog.open = True
+            self.app_view.update()
+
+        def handle_subject_report(e):
+            @self.app_view.batched("Subject Report")
+            async def handle_report_confirm(e):
+                dialog.open = False
+                self.app_view.update()
+
+                subject_id = subject_id_field.value
+                if subject_id:
+                    self.page.show_loading = True
+                    # Show the spinner before waiting on the database
+                    self.app_view.flush()
+                    try:
+                        await self.async_database.run(
+                            self.admin_controller.subject_report, subject_id
+                        )
+                    finally:
+                        self.page.show_loading = False
+                        self.app_view.update()
+
+            def handle_report_cancel(e):
+                dialog.open = False
+                self.app_view.update()
+
+            subject_id_field = ft.TextField(
+                label="Subject ID",
+                hint_text="Enter subject ID to report on",
+                width=300
+            )
+
+            dialog = ft.AlertDialog(
+                modal=True,
+                title=ft.Text("Subject Report"),
+                content=ft.Column([
+                    ft.Text("Please enter the ID of the subject:"),
+                    subject_id_field,
+                ], tight=True),
+                actions=[
+                    ft.TextButton("Cancel", on_click=handle_report_cancel),
+                    ft.TextButton("Report", on_click=handle_report_confirm),
+                ],
+                actions_alignment=ft.MainAxisAlignment.END,
+            )
+
+            self.page.dialog = dialog
+            dialog.open = True
+            self.app_view.update()
+
+        @self.app_view.batched("Verify Summary")
+        async def handle_verify_summary(e):
+            self.page.show_loading = True
+            # Show the spinner before waiting on the database
+            self.app_view.flush()
+            try:
+                await self.async_database.run(self.admin_controller.verify_summary)
+            finally:
+                self.page.show_loading = False
+                self.app_view.update()
 
         def handle_clear_database(e):
-            def handle_clear_confirm(e):
+            @self.app_view.batched("Clear Database")
+            async def handle_clear_confirm(e):
                 dialog.open = False
-                self.page.update()
+                self.app_view.update()
 
-                self.page.show_loading = True
-                self.page.update()
                 try:
-                    self.admin_controller.database.clear_all()
-                    self.display_success("Database cleared successfully!")
-                    self.student_list.rows.clear()
-                    self.page.update()
+                    if await self._run_job("Clear Database", self.admin_controller.wipe_database):
+                        self.display_success("Database cleared successfully!")
+                        self.table_students = []
+                        self._render_table_page()
+                        await self.async_database.run(self.admin_controller.show_summary)
                 except Exception as ex:
                     self.display_error(f"Error clearing database: {str(ex)}")
                 finally:
-                    self.page.show_loading = False
-                    self.page.update()
+                    self.app_view.update()
 
             def handle_clear_cancel(e):
                 dialog.open = False
-                self.page.update()
+                self.app_view.update()
 
             dialog = ft.AlertDialog(
                 modal=True,
@@ -178,8 +375,9 @@ class AdminView(BaseView):
 
             self.page.dialog = dialog
             dialog.open = True
-            self.page.update()
+            self.app_view.update()
 
+        @self.app_view.batched("Back to Login")
         def handle_back(e):
             self.app_view.navigate_to_login()
 
@@ -195,10 +393,22 @@ class AdminView(BaseView):
             text="Partition Pass/Fail",
             on_click=handle_partition_students
         )
+        query_button = ft.ElevatedButton(
+            text="Query Students",
+            on_click=handle_query_students
+        )
+        report_button = ft.ElevatedButton(
+            text="Subject Report",
+            on_click=handle_subject_report
+        )
         remove_button = ft.ElevatedButton(
             text="Remove Student",
             on_click=handle_remove_student
         )
+        verify_button = ft.TextButton(
+            text="Verify Summary",
+            on_click=handle_verify_summary
+        )
         clear_button = ft.ElevatedButton(
             text="Clear Database",
             color=ft.colors.RED,
@@ -228,6 +438,11 @@ class AdminView(BaseView):
             rows=[],
         )
 
+        self.table_loaded = False
+        self.table_students = []
+        self.row_map = {}
+        self._update_pager()
+
         # 创建可滚动的表格容器
         table_container = ft.Container(
             content=self.student_list,
@@ -245,6 +460,8 @@ class AdminView(BaseView):
                     show_button,
                     group_button,
                     partition_button,
+                    query_button,
+                    report_button,
                     remove_button,
                     clear_button,
                 ],
@@ -269,7 +486,17 @@ class AdminView(BaseView):
                     alignment=ft.alignment.center,
                     padding=ft.padding.only(bottom=20),
                 ),
+                ft.Container(
+                    content=ft.Column(
+                        controls=[self.summary_panel, verify_button],
+                        horizontal_alignment=ft.CrossAxisAlignment.CENTER,
+                    ),
+                    alignment=ft.alignment.center,
+                    padding=ft.padding.only(bottom=20),
+                ),
                 button_row,
+                self.progress_row,
+                self.pager_row,
                 ft.Container(
                     content=ft.Column(
                         controls=[table_container],
@@ -307,297 +534,402 @@ class AdminView(BaseView):
             self.page.clean()
             self.page.add(main_content)
 
-        self.page.update()
+        # Headline numbers come from the summary sidecar only
+        self.admin_controller.show_summary()
 
     def display_all_students(self, students: List[Student]):
-        """Display all students in the data table."""
-        self.student_list.rows.clear()
+        """Display all students in the data table, one page at a time."""
+        self.table_students = students
+        self.table_page_index = 0
+        self.table_loaded = True
 
         if not students:
+            self._reconcile_rows([])
+            self._update_pager()
             self.display_error("No students found")
             return
 
-        try:
-            for student in students:
-                avg_mark = student.get_average_mark()
-                is_passing = student.is_passing()
-
-                self.student_list.rows.append(
-                    ft.DataRow(
-                        cells=[
-                            ft.DataCell(
-                                ft.Container(
-                                    content=ft.Text(student.id),
-                                    padding=ft.padding.all(5),
-                                )
-                            ),
-                            ft.DataCell(
-                                ft.Container(
-                                    content=ft.Text(student.name),
-                                    padding=ft.padding.all(5),
-                                )
-                            ),
-                            ft.DataCell(
-                                ft.Container(
-                                    content=ft.Text(student.email),
-                                    padding=ft.padding.all(5),
-                                )
-                            ),
-                            ft.DataCell(
-                                ft.Container(
-                                    content=ft.Text(
-                                        f"{avg_mark:.1f}",
-                                        color=self._get_mark_color(avg_mark),
-                                        weight=ft.FontWeight.BOLD
-                                    ),
-                                    padding=ft.padding.all(5),
-                                )
-                            ),
-                            ft.DataCell(
-                                ft.Container(
-                                    content=ft.Text(
-                                        "PASS" if is_passing else "FAIL",
-                                        color=ft.colors.WHITE,
-                                        weight=ft.FontWeight.BOLD
-                                    ),
-                                    bgcolor=ft.colors.GREEN if is_passing else ft.colors.RED,
-                                    padding=ft.padding.symmetric(horizontal=10, vertical=5),
-                                    border_radius=3,
-                                    alignment=ft.alignment.center,
-                                )
-                            ),
-                            ft.DataCell(self._format_subject_details(student)),
-                        ]
-                    )
-                )
+        self._render_table_page()
+
+    def apply_student_changes(self, added: List[Student] = (), updated: List[Student] = (),
+                              removed: List[str] = ()):
+        """Apply a change set to the table instead of reloading every student."""
+        removed_ids = set(removed)
+        updates = {student.id: student for student in updated}
+        students = [
+            updates.get(student.id, student)
+            for student in self.table_students
+            if student.id not in removed_ids
+        ]
+        students.extend(added)
+        self.table_students = students
+        self.table_page_index = min(self.table_page_index, self._page_count() - 1)
+        self._render_table_page()
+
+    def _on_database_change(self, event):
+        """Keep a loaded table and the summary in step with changes from any view or process.
+
+        Runs on the thread that made the change, possibly while it holds
+        the database lock, so it only queues work: the table and summary
+        are brought up to date on the database I/O thread once the change
+        is finished.
+        """
+        if self.table_loaded:
+            with self._table_events_lock:
+                self._table_events.append(event)
+                queued = len(self._table_events) > 1
+            if not queued:
+                # One pass applies every event queued before it runs
+                self.async_database.executor.submit(self._apply_table_events)
+        if not self._summary_refresh_queued:
+            # One refresh covers every change made before it runs
+            self._summary_refresh_queued = True
+            self.async_database.executor.submit(self._refresh_summary)
+
+    def _apply_table_events(self):
+        """Apply the queued change events to the table as one change set."""
+        with self._table_events_lock:
+            events, self._table_events = self._table_events, []
+        if any(isinstance(event, RosterReset) for event in events):
+            self._reload_table()
+            return
+
+        # Latest stored record per student, None once removed
+        latest: Dict[str, Optional[dict]] = {}
+        for event in events:
+            if isinstance(event, (StudentAdded, StudentUpdated)):
+                latest[event.record["id"]] = event.record
+            elif isinstance(event, StudentRemoved):
+                latest[event.student_id] = None
+        shown = {student.id for student in self.table_students}
+        self.apply_student_changes(
+            added=[Student.from_dict(r) for i, r in latest.items() if r is not None and i not in shown],
+            updated=[Student.from_dict(r) for i, r in latest.items() if r is not None and i in shown],
+            removed=[i for i, r in latest.items() if r is None],
+        )
+
+    def _reload_table(self):
+        students = self.admin_controller.database.load_all_students()
+        self.table_students = students
+        self.table_page_index = min(self.table_page_index, self._page_count() - 1)
+        self._render_table_page()
+
+    def _refresh_summary(self):
+        self._summary_refresh_queued = False
+        self.admin_controller.show_summary()
+
+    def _page_count(self) -> int:
+        return max(1, -(-len(self.table_students) // self.table_page_size))
 
+    def _render_table_page(self):
+        """Build rows for the visible page only, so cost is independent of roster size."""
+        start = self.table_page_index * self.table_page_size
+        visible = self.table_students[start:start + self.table_page_size]
+        try:
+            self._reconcile_rows(visible)
         except Exception as e:
             self.display_error(f"Error displaying students: {str(e)}")
         finally:
-            self.page.update()
-
-    def _format_subject_details(self, student: Student) -> ft.Container:
-        """Create a formatted container of subject information."""
-        subject_rows = []
-
-        if student.subjects:
-            for subject in student.subjects:
-                subject_info = ft.Container(
-                    content=ft.Column([
-                        ft.Row([
-                            ft.Container(
-                                content=ft.Text(
-                                    f"Subject {subject.id}",
-                                    weight=ft.FontWeight.BOLD,
-                                    size=14
-                                ),
-                                bgcolor=ft.colors.BLUE_GREY_50,
-                                padding=5,
-                                border_radius=3
-                            )
-                        ]),
-                        ft.Row([
-                            ft.Container(
-                                content=ft.Row([
-                                    ft.Text("Mark: "),
-                                    ft.Text(
-                                        f"{subject.mark:.1f}",
-                                        color=self._get_mark_color(subject.mark),
-                                        weight=ft.FontWeight.BOLD
-                                    )
-                                ]),
-                                padding=5
-                            ),
-                            ft.Container(
-                                content=ft.Row([
-                                    ft.Text("Grade: "),
-                                    ft.Text(
-                                        subject.grade,
-                                        color=self._get_grade_color(subject.grade),
-                                        weight=ft.FontWeight.BOLD
-                                    )
-                                ]),
-                                padding=5
-                            )
-                        ])
-                    ]),
-                    border=ft.border.all(1, ft.colors.GREY_300),
-                    border_radius=5,
-                    margin=ft.margin.only(bottom=5),
-                    padding=5
-                )
-                subject_rows.append(subject_info)
-        else:
-            subject_rows.append(
-                ft.Container(
-                    content=ft.Text(
-                        "No subjects enrolled",
-                        italic=True,
-                        color=ft.colors.GREY_700
-                    ),
-                    padding=10
-                )
+            self._update_pager()
+            self.app_view.update()
+
+    def _update_pager(self):
+        """Refresh the paging controls for the current table page."""
+        total = len(self.table_students)
+        pages = self._page_count()
+        self.prev_page_button.disabled = self.table_page_index == 0
+        self.next_page_button.disabled = self.table_page_index >= pages - 1
+        if total:
+            first = self.table_page_index * self.table_page_size + 1
+            last = min(total, first + self.table_page_size - 1)
+            self.pager_text.value = (
+                f"Page {self.table_page_index + 1} of {pages} ({first}-{last} of {total} students)"
             )
+        else:
+            self.pager_text.value = ""
+        self.pager_row.visible = total > 0
+
+    def _change_table_page(self, delta: int):
+        index = min(max(0, self.table_page_index + delta), self._page_count() - 1)
+        if index != self.table_page_index:
+            self.table_page_index = index
+            self._render_table_page()
+
+    def _change_page_size(self, e):
+        """Switch page size, keeping the first visible student on screen."""
+        first = self.table_page_index * self.table_page_size
+        self.table_page_size = int(e.control.value)
+        self.table_page_index = first // self.table_page_size
+        self._render_table_page()
+
+    @staticmethod
+    def _row_fingerprint(student: Student) -> tuple:
+        """Everything a student row displays, used to detect changed rows."""
+        return (
+            student.name,
+            student.email,
+            tuple((s.id, s.mark, s.grade) for s in student.subjects),
+        )
 
-        return ft.Container(
-            content=ft.Column(
-                controls=subject_rows,
-                spacing=5,
-                scroll=ft.ScrollMode.AUTO
-            ),
-            width=300
+    def _reconcile_rows(self, students: List[Student]):
+        """Make the table show students, reusing rows keyed by student ID.
+
+        Unchanged rows are kept as-is, changed rows are patched in place and
+        only new students get fresh controls, so the update Flet sends is
+        proportional to what changed.
+        """
+        rows = []
+        row_map: Dict[str, ft.DataRow] = {}
+        for student in students:
+            fingerprint = self._row_fingerprint(student)
+            row = self.row_map.get(student.id)
+            if row is None or student.id in row_map:
+                row = self._build_student_row(student)
+            elif row.data != fingerprint:
+                self._update_student_row(row, student)
+            row.data = fingerprint
+            rows.append(row)
+            row_map.setdefault(student.id, row)
+        self.student_list.rows = rows
+        self.row_map = row_map
+
+    def _update_student_row(self, row: ft.DataRow, student: Student):
+        """Patch the cells of an existing row for a changed student."""
+        avg_mark = student.get_average_mark()
+        is_passing = student.is_passing()
+        _, name_cell, email_cell, avg_cell, status_cell, subjects_cell = row.cells
+
+        name_cell.content.content.value = student.name
+        email_cell.content.content.value = student.email
+        avg_cell.content.content.value = f"{avg_mark:.1f}"
+        avg_cell.content.content.color = mark_color(avg_mark)
+        status_text, status_color = STATUS_STYLES[is_passing]
+        status_cell.content.content.value = status_text
+        status_cell.content.bgcolor = status_color
+        subjects_cell.content = self.renderer.subject_details(student)
+
+    def _build_student_row(self, student: Student) -> ft.DataRow:
+        """Create the table row for one student."""
+        avg_mark = student.get_average_mark()
+        status_text, status_color = STATUS_STYLES[student.is_passing()]
+
+        return ft.DataRow(
+            cells=[
+                ft.DataCell(
+                    ft.Container(
+                        content=ft.Text(student.id),
+                        padding=ft.padding.all(5),
+                    )
+                ),
+                ft.DataCell(
+                    ft.Container(
+                        content=ft.Text(student.name),
+                        padding=ft.padding.all(5),
+                    )
+                ),
+                ft.DataCell(
+                    ft.Container(
+                        content=ft.Text(student.email),
+                        padding=ft.padding.all(5),
+                    )
+                ),
+                ft.DataCell(
+                    ft.Container(
+                        content=ft.Text(
+                            f"{avg_mark:.1f}",
+                            color=mark_color(avg_mark),
+                            weight=ft.FontWeight.BOLD
+                        ),
+                        padding=ft.padding.all(5),
+                    )
+                ),
+                ft.DataCell(
+                    ft.Container(
+                        content=ft.Text(
+                            status_text,
+                            color=ft.colors.WHITE,
+                            weight=ft.FontWeight.BOLD
+                        ),
+                        bgcolor=status_color,
+                        padding=ft.padding.symmetric(horizontal=10, vertical=5),
+                        border_radius=3,
+                        alignment=ft.alignment.center,
+                    )
+                ),
+                ft.DataCell(self.renderer.subject_details(student)),
+            ]
         )
 
-    def display_grade_groups(self, grade_groups: Dict[str, List[Student]]):
-        """Display students grouped by grade."""
+    def _open_report_dialog(self, title: str, heading: str) -> ft.Column:
+        """Open an empty report dialog and return the column to fill in."""
         dialog = None
 
         def close_dialog(e):
             dialog.open = False
-            self.page.update()
+            self.app_view.update()
 
         content = ft.Column(
-            controls=[ft.Text("Students Grouped by Average Grade", size=20)],
+            controls=[ft.Text(heading, size=20)],
             scroll=ft.ScrollMode.AUTO,
             spacing=10,
             height=400
         )
-
+        dialog = ft.AlertDialog(
+            title=ft.Text(title),
+            content=content,
+            actions=[
+                ft.TextButton("Close", on_click=close_dialog)
+            ],
+        )
+        self.page.dialog = dialog
+        dialog.open = True
+        self.app_view.update()
+        return content
+
+    def _stream_report(self, content: ft.Column, stream, section):
+        """Show a streamed report in content one page of students at a time.
+
+        section(key) gives the header text, header colour and card colour
+        for the section a streamed key starts. Like the student table,
+        only the current page has controls: "Next page" replaces it with
+        the following students. The stream only runs forward, so there is
+        no way back short of running the report again.
+        """
+        heading = content.controls[0]
+        shown = 0
+        current = card_color = None
+        pager_text = ft.Text("")
+        next_button = ft.TextButton("Next page")
+
+        def show_page(e=None):
+            nonlocal shown, current, card_color
+            self.renderer.begin_render()
+            controls = [heading]
+            first = shown + 1
+            for key, student in itertools.islice(stream, self.REPORT_PAGE_SIZE):
+                # Repeat the section header at the top of every page
+                if shown < first or key != current:
+                    current = key
+                    text, bgcolor, card_color = section(key)
+                    controls.append(self.renderer.section_header(text, bgcolor))
+                controls.append(self.renderer.student_card(student, card_color))
+                shown += 1
+            if not shown:
+                controls.append(ft.Text("No students found", italic=True))
+            elif shown >= first:
+                pager_text.value = f"Students {first}-{shown}"
+                # A short page means the stream has ended
+                next_button.visible = shown - first + 1 == self.REPORT_PAGE_SIZE
+                controls.append(ft.Row([pager_text, next_button], alignment=ft.MainAxisAlignment.CENTER))
+            else:
+                pager_text.value = f"No students after {shown}"
+                next_button.visible = False
+                controls.append(ft.Row([pager_text], alignment=ft.MainAxisAlignment.CENTER))
+            content.controls = controls
+            self.app_view.update()
+
+        next_button.on_click = show_page
+        show_page()
+
+    def display_grade_group_stream(self, stream):
+        """Display grade groups section by section as they are produced."""
         try:
-            # Sort grades in a specific order: HD, D, C, P, Z
-            grade_order = ['HD', 'D', 'C', 'P', 'Z']
-
-            for grade in grade_order:
-                if grade in grade_groups and grade_groups[grade]:
-                    # Add grade header
-                    content.controls.append(
-                        ft.Container(
-                            content=ft.Text(
-                                f"Grade {grade}",
-                                size=18,
-                                weight=ft.FontWeight.BOLD
-                            ),
-                            bgcolor=ft.colors.BLUE_GREY_100,
-                            padding=10,
-                            border_radius=5
-                        )
-                    )
-
-                    # Add students in this grade group
-                    for student in grade_groups[grade]:
-                        student_info = ft.Container(
-                            content=ft.Column([
-                                ft.Text(f"ID: {student.id}", weight=ft.FontWeight.BOLD),
-                                ft.Text(f"Name: {student.name}"),
-                                ft.Text(f"Email: {student.email}"),
-                                ft.Text(f"Average Mark: {student.get_average_mark():.1f}"),
-                                ft.Text("Subjects:", weight=ft.FontWeight.BOLD),
-                                ft.Column([
-                                    ft.Text(
-                                        f"  Subject {subject.id}: Mark = {subject.mark:.1f}, Grade = {subject.grade}"
-                                    ) for subject in student.subjects
-                                ], spacing=2)
-                            ]),
-                            padding=10,
-                            border=ft.border.all(1, ft.colors.GREY_400),
-                            border_radius=5,
-                            margin=ft.margin.only(bottom=10)
-                        )
-                        content.controls.append(student_info)
-
-            dialog = ft.AlertDialog(
-                title=ft.Text("Grade Groups"),
-                content=content,
-                actions=[
-                    ft.TextButton("Close", on_click=close_dialog)
-                ],
+            content = self._open_report_dialog("Grade Groups", "Students Grouped by Average Grade")
+            self._stream_report(
+                content, stream,
+                lambda grade: (f"Grade {grade}", ft.colors.BLUE_GREY_100, None),
             )
-
-            self.page.dialog = dialog
-            dialog.open = True
-            self.page.update()
-
         except Exception as e:
             self.display_error(f"Error displaying grade groups: {str(e)}")
 
-    def display_partitioned_students(self, passing: List[Student], failing: List[Student]):
-        """Display students partitioned by pass/fail status."""
+    def display_partition_stream(self, stream):
+        """Display passing then failing students as they are produced."""
+        sections = {
+            True: ("Passing Students", ft.colors.GREEN_100, STATUS_STYLES[True][1]),
+            False: ("Failing Students", ft.colors.RED_100, STATUS_STYLES[False][1]),
+        }
+        try:
+            content = self._open_report_dialog("Pass/Fail Partition", "Students by Pass/Fail Status")
+            self._stream_report(content, stream, sections.__getitem__)
+        except Exception as e:
+            self.display_error(f"Error displaying partitioned students: {str(e)}")
+
+    def _summary_card(self, label: str, value: str, color: str = None) -> ft.Container:
+        """Create a small dashboard card."""
+        return ft.Container(
+            content=ft.Column([
+                ft.Text(label, size=12, color=ft.colors.GREY_700),
+                ft.Text(value, size=20, weight=ft.FontWeight.BOLD, color=color),
+            ], horizontal_alignment=ft.CrossAxisAlignment.CENTER, spacing=2),
+            padding=10,
+            border=ft.border.all(1, ft.colors.GREY_300),
+            border_radius=5,
+            width=110,
+        )
+
+    def display_summary(self, summary):
+        """Display headline roster numbers in the dashboard panel."""
+        self.summary_panel.controls = [
+            self._summary_card("Students", str(summary.count)),
+            self._summary_card("Pass Rate", f"{summary.pass_rate:.1f}%"),
+            self._summary_card("Mean Average", f"{summary.mean_average:.1f}",
+                               mark_color(summary.mean_average)),
+        ] + [
+            self._summary_card(f"Grade {grade}", str(count), grade_color(grade))
+            for grade, count in summary.grade_distribution.items()
+        ]
+        self.app_view.update()
+
+    def display_subject_report(self, report):
+        """Display per-subject statistics and roster."""
         dialog = None
 
         def close_dialog(e):
             dialog.open = False
-            self.page.update()
+            self.app_view.update()
 
         content = ft.Column(
-            controls=[ft.Text("Students by Pass/Fail Status", size=20)],
+            controls=[
+                ft.Text(f"Subject {report.subject_id}", size=20),
+                ft.Text(f"Enrolled: {report.count}"),
+                ft.Text(f"Mean Mark: {report.mean:.1f}"),
+                ft.Text(f"Median Mark: {report.median:.1f}"),
+                ft.Text(f"Std Deviation: {report.std_dev:.1f}"),
+                ft.Text("Grade Distribution:", weight=ft.FontWeight.BOLD),
+                ft.Row([
+                    ft.Container(
+                        content=ft.Text(
+                            f"{grade}: {count}",
+                            color=grade_color(grade),
+                            weight=ft.FontWeight.BOLD
+                        ),
+                        padding=5
+                    ) for grade, count in report.grade_distribution.items()
+                ], wrap=True),
+                ft.Text("Roster:", weight=ft.FontWeight.BOLD),
+                ft.Column([
+                    ft.Text(
+                        f"  Student {entry.student_id}: Mark = {entry.mark:.1f}, Grade = {entry.grade}",
+                        color=mark_color(entry.mark)
+                    ) for entry in report.roster
+                ], spacing=2),
+            ],
             scroll=ft.ScrollMode.AUTO,
             spacing=10,
             height=400
         )
 
-        try:
-            # Helper function to create student info container
-            def create_student_container(student: Student, status: str):
-                return ft.Container(
-                    content=ft.Column([
-                        ft.Text(f"ID: {student.id}", weight=ft.FontWeight.BOLD),
-                        ft.Text(f"Name: {student.name}"),
-                        ft.Text(f"Email: {student.email}"),
-                        ft.Text(
-                            f"Average Mark: {student.get_average_mark():.1f}",
-                            color=ft.colors.GREEN if status == "Passing" else ft.colors.RED
-                        ),
-                        ft.Text("Subjects:", weight=ft.FontWeight.BOLD),
-                        ft.Column([
-                            ft.Text(
-                                f"  Subject {subject.id}: Mark = {subject.mark:.1f}, Grade = {subject.grade}"
-                            ) for subject in student.subjects
-                        ], spacing=2)
-                    ]),
-                    padding=10,
-                    border=ft.border.all(1, ft.colors.GREY_400),
-                    border_radius=5,
-                    margin=ft.margin.only(bottom=10)
-                )
-
-            # Add passing students
-            content.controls.append(
-                ft.Container(
-                    content=ft.Text("Passing Students", size=18, weight=ft.FontWeight.BOLD),
-                    bgcolor=ft.colors.GREEN_100,
-                    padding=10,
-                    border_radius=5
-                )
-            )
-            for student in passing:
-                content.controls.append(create_student_container(student, "Passing"))
-
-            # Add failing students
-            content.controls.append(
-                ft.Container(
-                    content=ft.Text("Failing Students", size=18, weight=ft.FontWeight.BOLD),
-                    bgcolor=ft.colors.RED_100,
-                    padding=10,
-                    border_radius=5
-                )
-            )
-            for student in failing:
-                content.controls.append(create_student_container(student, "Failing"))
-
-            dialog = ft.AlertDialog(
-                title=ft.Text("Pass/Fail Partition"),
-                content=content,
-                actions=[
-                    ft.TextButton("Close", on_click=close_dialog)
-                ],
-            )
-
-            self.page.dialog = dialog
-            dialog.open = True
-            self.page.update()
+        dialog = ft.AlertDialog(
+            title=ft.Text("Subject Report"),
+            content=content,
+            actions=[
+                ft.TextButton("Close", on_click=close_dialog)
+            ],
+        )
 
-        except Exception as e:
-            self.display_error(f"Error displaying partitioned students: {str(e)}")
+        self.page.dialog = dialog
+        dialog.open = True
+        self.app_view.update()
 
     def display_error(self, message: str):
         """Display error message."""
@@ -1,25 +1,60 @@
+import asyncio
+import contextvars
+import functools
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, Optional
+
 import flet as ft
-from typing import Optional
 
-from .login_view import LoginView
-from .admin_view import AdminView
-from .student_view import StudentView
 from ..base_view import BaseView
 from ...models.student import Student
 
 
+class _UpdateBatch:
+    """Pending state of one batched UI action."""
+
+    def __init__(self):
+        self.dirty = False
+
+
 class AppView(BaseView):
     """Main application view that handles navigation and state."""
 
-    def __init__(self, page: ft.Page):
+    def __init__(self, page: ft.Page, data_path: str = None, started_at: float = None,
+                 on_startup: Callable[[float], None] = None):
+        """Initialize with the page, the data file and the perf_counter() time the process started.
+
+        on_startup, if given, is called with startup_time once it is known.
+        """
         self.page = page
+        self.data_path = data_path
+
+        # Seconds from process start to the first page update, once sent
+        self.started_at = started_at
+        self.startup_time: Optional[float] = None
+        self.on_startup = on_startup
+
+        # page.update() round-trips: total, and per action for the last run of each
+        self.update_count = 0
+        self.round_trips: Dict[str, int] = {}
+        # Each handler (asyncio task or thread) batches independently
+        self._batch: contextvars.ContextVar[Optional[_UpdateBatch]] = contextvars.ContextVar(
+            "update_batch", default=None
+        )
         self.current_view: Optional[ft.View] = None
         self.current_student: Optional[Student] = None
 
-        # Initialize views
-        self.login_view = LoginView(self)
-        self.admin_view = AdminView(self)
-        self.student_view = StudentView(self)
+        # One database shared by every view, accessed off the UI thread;
+        # opened with the first view, after the first page update
+        self._database = None
+        self._async_database = None
+        self._change_feed = None
+
+        # Views (and their controllers) are built on first navigation
+        self._login_view = None
+        self._admin_view = None
+        self._student_view = None
 
         # Set up page properties
         self.page.title = "University Application"
@@ -43,8 +78,124 @@ class AppView(BaseView):
             alignment=ft.alignment.center,
         )
 
-        # 将主容器添加到页面
-        self.page.add(self.main_container)
+        # 将主容器添加到页面; sent like page.add(), but through _send_update
+        # so the first update is the one startup_time measures
+        self.page.controls.append(self.main_container)
+        self._send_update()
+
+    def _open_database(self):
+        """Open the shared database, its I/O thread and the feed of other processes' changes."""
+        from ...models.async_database import AsyncDatabase
+        from ...models.database import Database
+        from ...models.events import ChangeLogTailer
+
+        self._database = Database(self.data_path)
+        self._async_database = AsyncDatabase(self._database)
+        # Changes written by other processes (e.g. the CLI), republished on
+        # this database's event bus
+        self._change_feed = ChangeLogTailer(
+            self._database.change_log, self._database.events, origin=self._database.origin
+        )
+        self._change_feed.start()
+
+    @property
+    def database(self):
+        if self._database is None:
+            self._open_database()
+        return self._database
+
+    @property
+    def async_database(self):
+        if self._async_database is None:
+            self._open_database()
+        return self._async_database
+
+    @property
+    def change_feed(self):
+        if self._change_feed is None:
+            self._open_database()
+        return self._change_feed
+
+    @property
+    def login_view(self):
+        if self._login_view is None:
+            from .login_view import LoginView
+            self._login_view = LoginView(self)
+        return self._login_view
+
+    @property
+    def admin_view(self):
+        if self._admin_view is None:
+            from .admin_view import AdminView
+            self._admin_view = AdminView(self)
+        return self._admin_view
+
+    @property
+    def student_view(self):
+        if self._student_view is None:
+            from .student_view import StudentView
+            self._student_view = StudentView(self)
+        return self._student_view
+
+    def update(self):
+        """Send pending UI changes, or defer them while a batch is open."""
+        batch = self._batch.get()
+        if batch is not None:
+            batch.dirty = True
+            return
+        self._send_update()
+
+    def flush(self):
+        """Send pending changes now, e.g. before awaiting a long operation."""
+        batch = self._batch.get()
+        if batch is not None:
+            batch.dirty = False
+        self._send_update()
+
+    def _send_update(self):
+        self.update_count += 1
+        self.page.update()
+        if self.startup_time is None and self.started_at is not None:
+            self.startup_time = time.perf_counter() - self.started_at
+            if self.on_startup is not None:
+                self.on_startup(self.startup_time)
+
+    @contextmanager
+    def batch_updates(self, action: str = None):
+        """Coalesce every update inside the block into a single page.update()."""
+        if self._batch.get() is not None:
+            # Already batching; the outermost block sends the update
+            yield
+            return
+
+        start = self.update_count
+        token = self._batch.set(_UpdateBatch())
+        try:
+            yield
+        finally:
+            batch = self._batch.get()
+            self._batch.reset(token)
+            if batch.dirty:
+                self._send_update()
+            if action:
+                self.round_trips[action] = self.update_count - start
+
+    def batched(self, action: str) -> Callable:
+        """Decorator running a sync or async event handler inside batch_updates."""
+        def decorator(func):
+            if asyncio.iscoroutinefunction(func):
+                @functools.wraps(func)
+                async def async_wrapper(*args, **kwargs):
+                    with self.batch_updates(action):
+                        return await func(*args, **kwargs)
+                return async_wrapper
+
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                with self.batch_updates(action):
+                    return func(*args, **kwargs)
+            return wrapper
+        return decorator
 
     def initialize(self):
         """Initialize the application with the login view."""
@@ -68,42 +219,43 @@ class AppView(BaseView):
 
     def _update_view(self, data=None):
         """Update the current view with proper layout."""
-        # 清空主容器
-        self.main_container.content = None
-
-        # 创建新的内容容器
-        content = ft.Container(
-            content=ft.Column(
-                controls=[],
-                horizontal_alignment=ft.CrossAxisAlignment.CENTER,
-                spacing=20,
-            ),
-            width=900,
-            padding=20,
-        )
+        with self.batch_updates():
+            # 清空主容器
+            self.main_container.content = None
 
-        # 将内容容器添加到主容器
-        self.main_container.content = content
+            # 创建新的内容容器
+            content = ft.Container(
+                content=ft.Column(
+                    controls=[],
+                    horizontal_alignment=ft.CrossAxisAlignment.CENTER,
+                    spacing=20,
+                ),
+                width=900,
+                padding=20,
+            )
 
-        # 显示当前视图
-        if self.current_view:
-            self.current_view.display(data)
+            # 将内容容器添加到主容器
+            self.main_container.content = content
 
-        self.page.update()
+            # 显示当前视图
+            if self.current_view:
+                self.current_view.display(data)
+
+            self.update()
 
     def display(self, data=None):
         """Implement abstract display method."""
         # 由于 AppView 是一个容器视图，实际显示由当前活动的子视图处理
         if self.current_view:
             self.current_view.display(data)
-        self.page.update()
+        self.update()
 
     def display_error(self, message: str):
         """Display error dialog."""
 
         def close_dlg(_):
             dlg.open = False
-            self.page.update()
+            self.update()
 
         dlg = ft.AlertDialog(
             modal=True,
@@ -116,7 +268,7 @@ class AppView(BaseView):
         )
         self.page.dialog = dlg
         dlg.open = True
-        self.page.update()
+        self.update()
 
     def display_success(self, message: str):
         """Display success snackbar."""
@@ -125,7 +277,7 @@ class AppView(BaseView):
             bgcolor=ft.colors.GREEN_700,
         )
         self.page.snack_bar.open = True
-        self.page.update()
+        self.update()
 
     def get_input(self, prompt: str) -> str:
         """Get user input via dialog."""
@@ -135,7 +287,7 @@ class AppView(BaseView):
             nonlocal result
             result = text_field.value if e.control.text == "OK" else None
             dlg.open = False
-            self.page.update()
+            self.update()
 
         text_field = ft.TextField(
             label=prompt,
@@ -155,7 +307,7 @@ class AppView(BaseView):
 
         self.page.dialog = dlg
         dlg.open = True
-        self.page.update()
+        self.update()
         return result if result is not None else ""
 
     def confirm_action(self, message: str) -> bool:
@@ -166,7 +318,7 @@ class AppView(BaseView):
             nonlocal result
             result = e.control.text == "Yes"
             dlg.open = False
-            self.page.update()
+            self.update()
 
         dlg = ft.AlertDialog(
             modal=True,
@@ -181,5 +333,5 @@ class AppView(BaseView):
 
         self.page.dialog = dlg
         dlg.open = True
-        self.page.update()
+        self.update()
         return result
\ No newline at end of file
@@ -0,0 +1,217 @@
+from collections import OrderedDict
+from typing import Callable, Dict, List, Tuple
+
+import flet as ft
+
+from ...models.student import Student
+
+# Colour lookup tables, computed once instead of per subject per render
+GRADE_COLORS: Dict[str, str] = {
+    'HD': ft.colors.GREEN,
+    'D': ft.colors.BLUE,
+    'C': ft.colors.ORANGE,
+    'P': ft.colors.ORANGE_700,
+    'Z': ft.colors.RED,
+}
+
+
+def _mark_band_color(mark: int) -> str:
+    if mark >= 85:
+        return ft.colors.GREEN
+    elif mark >= 75:
+        return ft.colors.BLUE
+    elif mark >= 65:
+        return ft.colors.ORANGE
+    elif mark >= 50:
+        return ft.colors.ORANGE_700
+    return ft.colors.RED
+
+
+# Band thresholds are whole marks, so the floor of a mark picks its colour
+MARK_COLORS: Tuple[str, ...] = tuple(_mark_band_color(mark) for mark in range(101))
+
+STATUS_STYLES: Dict[bool, Tuple[str, str]] = {
+    True: ("PASS", ft.colors.GREEN),
+    False: ("FAIL", ft.colors.RED),
+}
+
+
+def mark_color(mark: float) -> str:
+    """Colour for a mark, from the precomputed band table."""
+    return MARK_COLORS[min(100, max(0, int(mark)))]
+
+
+def grade_color(grade: str) -> str:
+    """Colour for a grade letter."""
+    return GRADE_COLORS.get(grade, ft.colors.BLACK)
+
+
+class ControlPool:
+    """Recycles controls of one kind instead of allocating new ones per render."""
+
+    def __init__(self, factory: Callable[[], ft.Control]):
+        self._factory = factory
+        self._free: List[ft.Control] = []
+        self._in_use: List[ft.Control] = []
+
+    def acquire(self) -> ft.Control:
+        """Take a free control, creating one only when the pool is empty."""
+        control = self._free.pop() if self._free else self._factory()
+        self._in_use.append(control)
+        return control
+
+    def release_all(self):
+        """Return every control handed out since the last release."""
+        self._free.extend(self._in_use)
+        self._in_use.clear()
+
+
+class StudentRenderer:
+    """Builds student panels, memoised by student version.
+
+    Rendering a student whose stored version hasn't changed returns the
+    controls built last time, so redisplaying a report costs nothing for
+    unchanged students.
+    """
+
+    def __init__(self, max_entries: int = 2000):
+        self.max_entries = max_entries
+        self._cache: "OrderedDict[tuple, ft.Control]" = OrderedDict()
+        self._headers = ControlPool(
+            lambda: ft.Container(
+                content=ft.Text("", size=18, weight=ft.FontWeight.BOLD),
+                padding=10,
+                border_radius=5,
+            )
+        )
+
+    def _memo(self, kind: str, student: Student, variant, build: Callable[[], ft.Control]) -> ft.Control:
+        # Email is unique, so it separates students who happen to share an ID
+        key = (kind, student.id, student.email, student.version, variant)
+        control = self._cache.get(key)
+        if control is None:
+            control = build()
+            self._cache[key] = control
+            if len(self._cache) > self.max_entries:
+                self._cache.popitem(last=False)
+        else:
+            self._cache.move_to_end(key)
+        return control
+
+    def begin_render(self):
+        """Recycle pooled controls from the previous render."""
+        self._headers.release_all()
+
+    def section_header(self, text: str, bgcolor: str) -> ft.Container:
+        """A pooled section heading such as "Grade HD"."""
+        header = self._headers.acquire()
+        header.content.value = text
+        header.bgcolor = bgcolor
+        return header
+
+    def subject_details(self, student: Student) -> ft.Container:
+        """Panel listing a student's subjects, for the student table."""
+        return self._memo("subjects", student, None, lambda: self._build_subject_details(student))
+
+    def student_card(self, student: Student, average_color: str = None) -> ft.Container:
+        """Card with a student's details and subjects, for report dialogs."""
+        return self._memo(
+            "card", student, average_color,
+            lambda: self._build_student_card(student, average_color),
+        )
+
+    @staticmethod
+    def _build_subject_details(student: Student) -> ft.Container:
+        subject_rows = []
+
+        if student.subjects:
+            for subject in student.subjects:
+                subject_info = ft.Container(
+                    content=ft.Column([
+                        ft.Row([
+                            ft.Container(
+                                content=ft.Text(
+                                    f"Subject {subject.id}",
+                                    weight=ft.FontWeight.BOLD,
+                                    size=14
+                                ),
+                                bgcolor=ft.colors.BLUE_GREY_50,
+                                padding=5,
+                                border_radius=3
+                            )
+                        ]),
+                        ft.Row([
+                            ft.Container(
+                                content=ft.Row([
+                                    ft.Text("Mark: "),
+                                    ft.Text(
+                                        f"{subject.mark:.1f}",
+                                        color=mark_color(subject.mark),
+                                        weight=ft.FontWeight.BOLD
+                                    )
+                                ]),
+                                padding=5
+                            ),
+                            ft.Container(
+                                content=ft.Row([
+                                    ft.Text("Grade: "),
+                                    ft.Text(
+                                        subject.grade,
+                                        color=grade_color(subject.grade),
+                                        weight=ft.FontWeight.BOLD
+                                    )
+                                ]),
+                                padding=5
+                            )
+                        ])
+                    ]),
+                    border=ft.border.all(1, ft.colors.GREY_300),
+                    border_radius=5,
+                    margin=ft.margin.only(bottom=5),
+                    padding=5
+                )
+                subject_rows.append(subject_info)
+        else:
+            subject_rows.append(
+                ft.Container(
+                    content=ft.Text(
+                        "No subjects enrolled",
+                        italic=True,
+                        color=ft.colors.GREY_700
+                    ),
+                    padding=10
+                )
+            )
+
+        return ft.Container(
+            content=ft.Column(
+                controls=subject_rows,
+                spacing=5,
+                scroll=ft.ScrollMode.AUTO
+            ),
+            width=300
+        )
+
+    @staticmethod
+    def _build_student_card(student: Student, average_color: str = None) -> ft.Container:
+        return ft.Container(
+            content=ft.Column([
+                ft.Text(f"ID: {student.id}", weight=ft.FontWeight.BOLD),
+                ft.Text(f"Name: {student.name}"),
+                ft.Text(f"Email: {student.email}"),
+                ft.Text(
+                    f"Average Mark: {student.get_average_mark():.1f}",
+                    color=average_color
+                ),
+                ft.Text("Subjects:", weight=ft.FontWeight.BOLD),
+                ft.Column([
+                    ft.Text(
+                        f"  Subject {subject.id}: Mark = {subject.mark:.1f}, Grade = {subject.grade}"
+                    ) for subject in student.subjects
+                ], spacing=2)
+            ]),
+            padding=10,
+            border=ft.border.all(1, ft.colors.GREY_400),
+            border_radius=5,
+            margin=ft.margin.only(bottom=10)
+        )
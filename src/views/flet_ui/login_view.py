@@ -1,8 +1,6 @@
 import flet as ft
 from ..base_view import BaseView
-from ...controllers.student_controller import StudentController
-from ...models.database import Database
-from ...models.student import Student
+from ...services.university_service import ServiceError, UniversityService
 
 
 class LoginView(BaseView):
@@ -11,8 +9,8 @@ class LoginView(BaseView):
     def __init__(self, app_view):
         self.app_view = app_view
         self.page = app_view.page
-        self.student_controller = StudentController(self)
-        self.database = Database()
+        self.service = UniversityService(app_view.database)
+        self.async_database = app_view.async_database
 
         # Track current mode
         self.is_register_mode = False
@@ -68,15 +66,16 @@ class LoginView(BaseView):
         self.password_field.value = ""
         self.name_field.value = ""
 
-        self.page.update()
+        self.app_view.update()
 
-    def handle_submit(self, e):
+    async def handle_submit(self, e):
         """Handle form submission."""
-        if self.is_register_mode:
-            if self._handle_register():
-                self.switch_mode()
-        else:
-            self._handle_login()
+        with self.app_view.batch_updates("Login/Register"):
+            if self.is_register_mode:
+                if await self._handle_register():
+                    self.switch_mode()
+            else:
+                await self._handle_login()
 
     def display(self, data=None):
         """Display the login view."""
@@ -129,9 +128,9 @@ class LoginView(BaseView):
             self.page.clean()
             self.page.add(content)
 
-        self.page.update()
+        self.app_view.update()
 
-    def _handle_login(self):
+    async def _handle_login(self):
         """Handle login form submission."""
         email = self.email_field.value
         password = self.password_field.value
@@ -140,46 +139,29 @@ class LoginView(BaseView):
             self.display_error("All fields are required!")
             return False
 
-        student = self.database.get_student_by_email(email)
-        if student and student.password == password:
-            self.display_success("Login successful!")
-            self.app_view.navigate_to_student(student)
-            return True
-        else:
-            self.display_error("Invalid credentials!")
+        try:
+            student = await self.async_database.run(self.service.login, email, password)
+        except ServiceError as e:
+            self.display_error(str(e))
             return False
+        self.display_success("Login successful!")
+        self.app_view.navigate_to_student(student)
+        return True
 
-    def _handle_register(self):
+    async def _handle_register(self):
         """Handle registration form submission."""
-        name = self.name_field.value
-        email = self.email_field.value
-        password = self.password_field.value
-
-        if not all([name, email, password]):
-            self.display_error("All fields are required!")
-            return False
-
-        # Create a new student instance
-        student = Student(name=name, email=email, password=password)
-
-        # Validate email and password format
-        if not self.student_controller._validate_email(email):
-            return False
-        if not self.student_controller._validate_password(password):
-            return False
-
-        # Check if student already exists
-        if self.database.get_student_by_email(email):
-            self.display_error("Student already exists!")
-            return False
-
-        # Add student to database
-        if self.database.add_student(student):
-            self.display_success("Registration successful! Please login.")
-            return True
-        else:
-            self.display_error("Registration failed!")
+        try:
+            await self.async_database.run(
+                self.service.register,
+                self.name_field.value,
+                self.email_field.value,
+                self.password_field.value,
+            )
+        except ServiceError as e:
+            self.display_error(str(e))
             return False
+        self.display_success("Registration successful! Please login.")
+        return True
 
     def display_error(self, message: str):
         """Display error message."""
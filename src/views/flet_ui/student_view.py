@@ -1,10 +1,10 @@
 import flet as ft
-from typing import Optional
+from typing import Dict, Optional
 
 from ..base_view import BaseView
 from ...controllers.subject_controller import SubjectController
 from ...models.student import Student
-from ...core.constants import PASSWORD_PATTERN
+from ...services.university_service import ServiceError
 
 
 class StudentView(BaseView):
@@ -13,8 +13,9 @@ class StudentView(BaseView):
     def __init__(self, app_view):
         self.app_view = app_view
         self.page = app_view.page
-        self.subject_controller = SubjectController(self)
-        self.current_student: Optional[Student] = None
+        self.subject_controller = SubjectController(self, app_view.database)
+        self.service = self.subject_controller.service
+        self.async_database = app_view.async_database
 
         # Create UI controls
         self.subjects_table = ft.DataTable(
@@ -25,18 +26,35 @@ class StudentView(BaseView):
             ],
             rows=[]
         )
+        self.standing_text = ft.Text("", size=16, italic=True)
+
+        # Rows kept between refreshes so only changed subjects are re-sent
+        self.subject_rows: Dict[str, ft.DataRow] = {}
+        self.average_row = ft.DataRow(
+            cells=[
+                ft.DataCell(ft.Text("Average", italic=True)),
+                ft.DataCell(ft.Text("", italic=True)),
+                ft.DataCell(ft.Text("")),
+            ]
+        )
+
+    @property
+    def current_student(self) -> Optional[Student]:
+        """The logged-in student, as last returned by the service."""
+        return self.subject_controller.current_student
+
+    @current_student.setter
+    def current_student(self, student: Optional[Student]):
+        self.subject_controller.current_student = student
 
     def display(self, student: Student):
         """Display the student view."""
         self.current_student = student
-        self.subject_controller.current_student = student
 
-        def handle_enroll(e):
-            if len(student.subjects) >= Student.MAX_SUBJECTS:
-                self.display_error(f"Maximum subjects ({Student.MAX_SUBJECTS}) already enrolled!")
-                return
-            self.subject_controller.enrol_subject()
-            self._refresh_subjects()
+        @self.app_view.batched("Enroll in Subject")
+        async def handle_enroll(e):
+            await self.async_database.run(self.subject_controller.enrol_subject)
+            await self._refresh_subjects()
 
         def handle_remove(e):
             if not self.current_student.subjects:
@@ -45,21 +63,23 @@ class StudentView(BaseView):
 
             def handle_cancel(e):
                 dlg.open = False
-                self.page.update()
+                self.app_view.update()
 
-            def handle_remove_confirm(e):
+            @self.app_view.batched("Remove Subject")
+            async def handle_remove_confirm(e):
                 dlg.open = False
                 subject_id = text_field.value
                 if subject_id:
-                    if self.current_student.remove_subject(subject_id):
-                        if self.subject_controller.database.update_student(self.current_student):
-                            self.display_success(f"Subject {subject_id} removed successfully!")
-                            self._refresh_subjects()
-                        else:
-                            self.display_error("Failed to update database!")
+                    try:
+                        self.current_student = await self.async_database.run(
+                            self.service.remove_subject, self.current_student.id, subject_id
+                        )
+                    except ServiceError as ex:
+                        self.display_error(str(ex))
                     else:
-                        self.display_error(f"Subject {subject_id} not found!")
-                self.page.update()
+                        self.display_success(f"Subject {subject_id} removed successfully!")
+                        await self._refresh_subjects()
+                self.app_view.update()
 
             text_field = ft.TextField(
                 label="Subject ID",
@@ -84,35 +104,29 @@ class StudentView(BaseView):
 
             self.page.dialog = dlg
             dlg.open = True
-            self.page.update()
+            self.app_view.update()
 
         def handle_change_password(e):
             def handle_cancel(e):
                 dlg.open = False
-                self.page.update()
+                self.app_view.update()
 
-            def handle_change_confirm(e):
+            @self.app_view.batched("Change Password")
+            async def handle_change_confirm(e):
                 dlg.open = False
                 new_password = password_field.value
                 if new_password:
-                    if not PASSWORD_PATTERN.match(new_password):
-                        self.display_error(
-                            "Invalid password format! Must start with uppercase, "
-                            "contain at least 5 letters followed by 3+ digits"
+                    try:
+                        self.current_student = await self.async_database.run(
+                            self.service.change_password, self.current_student.id, new_password
                         )
-                        return
-
-                    # Update password in current student object
-                    self.current_student.password = new_password
-
-                    # Save to database
-                    if self.subject_controller.database.update_student(self.current_student):
-                        self.display_success("Password changed successfully!")
+                    except ServiceError as ex:
+                        self.display_error(str(ex))
                     else:
-                        self.display_error("Failed to update password in database!")
+                        self.display_success("Password changed successfully!")
                 else:
                     self.display_error("Password cannot be empty!")
-                self.page.update()
+                self.app_view.update()
 
             password_field = ft.TextField(
                 label="New Password",
@@ -140,12 +154,12 @@ class StudentView(BaseView):
 
             self.page.dialog = dlg
             dlg.open = True
-            self.page.update()
+            self.app_view.update()
 
+        @self.app_view.batched("Logout")
         def handle_logout(e):
             # 清理当前学生状态
             self.current_student = None
-            self.subject_controller.current_student = None
 
             # 返回登录页面
             self.app_view.navigate_to_login()
@@ -191,6 +205,10 @@ class StudentView(BaseView):
                     alignment=ft.alignment.center,
                     padding=20,
                 ),
+                ft.Container(
+                    content=self.standing_text,
+                    alignment=ft.alignment.center,
+                ),
                 ft.Container(
                     content=ft.TextButton(
                         text="Logout",
@@ -214,50 +232,57 @@ class StudentView(BaseView):
             self.page.clean()
             self.page.add(content)
 
-        self._refresh_subjects()
-        self.page.update()
-
-    def _refresh_subjects(self):
-        """Refresh the subjects table."""
-        self.subjects_table.rows.clear()
+        self.app_view.update()
+        self.page.run_task(self._refresh_subjects)
 
+    async def _refresh_subjects(self):
+        """Refresh the subjects table, reusing rows keyed by subject ID."""
+        rows = []
+        row_map: Dict[str, ft.DataRow] = {}
         for subject in self.current_student.subjects:
-            self.subjects_table.rows.append(
-                ft.DataRow(
+            fingerprint = (subject.mark, subject.grade)
+            row = self.subject_rows.get(subject.id)
+            if row is None or subject.id in row_map:
+                row = ft.DataRow(
                     cells=[
                         ft.DataCell(ft.Text(subject.id)),
                         ft.DataCell(ft.Text(f"{subject.mark:.1f}")),
                         ft.DataCell(ft.Text(subject.grade)),
                     ]
                 )
-            )
+            elif row.data != fingerprint:
+                row.cells[1].content.value = f"{subject.mark:.1f}"
+                row.cells[2].content.value = subject.grade
+            row.data = fingerprint
+            rows.append(row)
+            row_map.setdefault(subject.id, row)
+        self.subject_rows = row_map
 
         if self.current_student.subjects:
             avg_mark = self.current_student.get_average_mark()
             status = "PASS" if self.current_student.is_passing() else "FAIL"
-            self.subjects_table.rows.append(
-                ft.DataRow(
-                    cells=[
-                        ft.DataCell(ft.Text("Average", italic=True)),
-                        ft.DataCell(ft.Text(f"{avg_mark:.1f}", italic=True)),
-                        ft.DataCell(
-                            ft.Text(
-                                status,
-                                color=ft.colors.GREEN if status == "PASS" else ft.colors.RED
-                            )
-                        ),
-                    ]
-                )
+            _, avg_cell, status_cell = self.average_row.cells
+            avg_cell.content.value = f"{avg_mark:.1f}"
+            status_cell.content.value = status
+            status_cell.content.color = ft.colors.GREEN if status == "PASS" else ft.colors.RED
+            rows.append(self.average_row)
+            standing = await self.async_database.run(self.subject_controller.get_standing)
+            self.standing_text.value = (
+                f"Rank {standing.rank} of {standing.total} "
+                f"({standing.percentile:.1f} percentile)"
             )
+        else:
+            self.standing_text.value = ""
 
-        self.page.update()
+        self.subjects_table.rows = rows
+        self.app_view.update()
 
     def display_enrolment_result(self, subject):
         """Display the result of subject enrollment."""
 
         def close_dialog(e):
             self.page.dialog.open = False
-            self.page.update()
+            self.app_view.update()
 
         content = ft.Column(
             controls=[
@@ -277,7 +302,7 @@ class StudentView(BaseView):
             ],
         )
         self.page.dialog.open = True
-        self.page.update()
+        self.app_view.update()
 
     def display_error(self, message: str):
         """Display error message."""
@@ -33,7 +33,7 @@ class SubjectView(BaseView):
             ],
         )
         self.page.dialog.open = True
-        self.page.update()
+        self.app_view.update()
 
     def display_subjects(self, student: Student):
         """Display all subjects for a student."""
@@ -65,7 +65,7 @@ class SubjectView(BaseView):
             ],
         )
         self.page.dialog.open = True
-        self.page.update()
+        self.app_view.update()
 
     def display(self, data=None):
         """Display subject view (not used directly)."""